@@ -0,0 +1,2 @@
+from .compare import compare
+from .compare import run
@@ -0,0 +1,38 @@
+import argparse
+import json
+import sys
+
+from .compare import run, compare, _print_report
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="oon converter and transport benchmarks")
+    parser.add_argument("--suite", action="append", choices=["converter", "net", "unix"],
+                        help="suite to run, can be repeated (default: all)")
+    parser.add_argument("--codec", default="json", help="oon.StartValues.ConvertCodec to benchmark")
+    parser.add_argument("--rounds", type=int, default=20000, help="encode/decode calls per measurement")
+    parser.add_argument("--repeats", type=int, default=5, help="measurements per converter benchmark, best one is kept")
+    parser.add_argument("--transport-rounds", type=int, default=2000, help="round trips of 1KB messages per transport size")
+    parser.add_argument("--quick", action="store_true", help="tenth of default rounds, for smoke runs")
+    parser.add_argument("--output", help="write JSON report to this file (default: stdout)")
+    parser.add_argument("--baseline", help="JSON report to compare with, regressions make exit code 1")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown against baseline")
+    args = parser.parse_args()
+    if args.quick:
+        args.rounds //= 10
+        args.transport_rounds //= 10
+    report = run(args.suite or ["converter", "net", "unix"], args.codec, args.rounds, args.repeats, args.transport_rounds)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r") as f: baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        report["regressions"] = regressions
+    _print_report(report, regressions)
+    if args.output:
+        with open(args.output, "w") as f: json.dump(report, f, indent=2)
+    else: json.dump(report, sys.stdout, indent=2)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+import platform
+import sys
+import time
+
+import oon
+from . import converter
+from . import shapes
+from . import transport
+
+
+def run(suites : list, codec : str = "json", rounds : int = 20000, repeats : int = 5, transport_rounds : int = 2000):
+    saved = (oon.StartValues.ConvertModules, oon.StartValues.ConvertCodec)
+    oon.StartValues.ConvertModules = [shapes]
+    oon.StartValues.ConvertCodec = codec
+    results = {}
+    try:
+        if "converter" in suites:
+            if oon.start() != oon.ExCode.Success: raise RuntimeError("can not start oon")
+            try: results.update(converter.run(rounds, repeats))
+            finally: oon.stop()
+        for name in ("net", "unix"):
+            if name in suites: results.update(transport.run(name, transport_rounds))
+    finally: oon.StartValues.ConvertModules, oon.StartValues.ConvertCodec = saved
+    return {"python":platform.python_version(), "platform":platform.platform(), "codec":codec, "time":time.time(),
+            "results":results}
+
+def compare(report : dict, baseline : dict, tolerance : float):
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base == None or base["value"] <= 0: continue
+        ratio = result["value"] / base["value"]
+        if result["better"] == "higher": regressed = ratio < 1 - tolerance
+        else: regressed = ratio > 1 + tolerance
+        result["baseline"] = base["value"]
+        result["ratio"] = ratio
+        if regressed: regressions.append(name)
+    return regressions
+
+def _print_report(report : dict, regressions : list, out = sys.stderr):
+    for name, result in report["results"].items():
+        line = f"{name:<28} {result['value']:>14.2f} {result['unit']:<6}"
+        if "ratio" in result: line += f" {result['ratio']:>7.2f}x of baseline"
+        if name in regressions: line += "  REGRESSION"
+        print(line, file=out)
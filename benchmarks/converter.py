@@ -0,0 +1,29 @@
+import time
+
+import oon
+from . import shapes
+
+
+def _best_rate(function, rounds : int, repeats : int):
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(rounds): function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best == None else min(best, elapsed)
+    return rounds / best
+
+def run(rounds : int, repeats : int):
+    results = {}
+    for name, make in shapes.SHAPES.items():
+        netobj = make()
+        netmessage, excode = oon.generate_message(netobj)
+        if excode != oon.ExCode.Success: raise RuntimeError(f"can not encode {name}: {excode}")
+        data = netmessage._encoded("utf-8")
+        loaded, excode = oon.load_message_from_str(data)
+        if excode != oon.ExCode.Success: raise RuntimeError(f"can not decode {name}: {excode}")
+        results[f"encode.{name}"] = {"value":_best_rate(lambda: oon.generate_message(netobj), rounds, repeats),
+                                     "unit":"msg/s", "better":"higher", "bytes":len(data)}
+        results[f"decode.{name}"] = {"value":_best_rate(lambda: oon.load_message_from_str(data), rounds, repeats),
+                                     "unit":"msg/s", "better":"higher", "bytes":len(data)}
+    return results
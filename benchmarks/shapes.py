@@ -0,0 +1,78 @@
+import enum
+
+
+class Color(enum.Enum):
+    Red     =   0
+    Green   =   1
+    Blue    =   2
+    Black   =   3
+
+class Flat:
+    number : int = 0
+    ratio : float = 0.0
+    name : str = ""
+    active : bool = False
+    count : int = 0
+    def __init__(self, seed : int = 0):
+        self.number = seed
+        self.ratio = seed / 7
+        self.name = f"flat-{seed}"
+        self.active = seed % 2 == 0
+        self.count = seed * 3
+
+class Node:
+    value : int = 0
+    child = None
+    def __init__(self, value : int = 0, child = None):
+        self.value = value
+        self.child = child
+
+class Palette:
+    primary : Color = None
+    secondary : Color = None
+    background : Color = None
+    border : Color = None
+    text : Color = None
+    shadow : Color = None
+    accent : Color = None
+    highlight : Color = None
+    def __init__(self, seed : int = 0):
+        colors = list(Color)
+        for index, field in enumerate(["primary", "secondary", "background", "border", "text", "shadow", "accent", "highlight"]):
+            setattr(self, field, colors[(seed + index) % len(colors)])
+
+class Slotted:
+    __slots__ = ['x', 'y', 'z', 'label', 'weight']
+    def __init__(self, seed : int = 0):
+        self.x = seed
+        self.y = seed + 1
+        self.z = seed + 2
+        self.label = f"slot-{seed}"
+        self.weight = seed / 3
+
+WIDE_FIELDS = 200
+Wide = type("Wide", (), {f"field{index}":0 for index in range(WIDE_FIELDS)})
+
+class Payload:
+    data : str = ""
+    def __init__(self, data : str = ""):
+        self.data = data
+
+
+def nested(depth : int):
+    node = None
+    for value in range(depth): node = Node(value, node)
+    return node
+
+def wide(seed : int = 0):
+    obj = Wide()
+    for index in range(WIDE_FIELDS): setattr(obj, f"field{index}", seed + index)
+    return obj
+
+SHAPES = {
+    "flat"      :   lambda: Flat(42),
+    "nested"    :   lambda: nested(16),
+    "enums"     :   lambda: Palette(3),
+    "slots"     :   lambda: Slotted(7),
+    "wide"      :   lambda: wide(5),
+}
@@ -0,0 +1,102 @@
+import multiprocessing
+import os
+import tempfile
+import time
+
+import oon
+from . import shapes
+
+
+_TRANSPORTS = {
+    "net"   :   {"enable":"EnableNetManager", "is_server":"NetIsServer", "framing":"NetFraming", "connect":oon.connect_to_net_srv,
+                 "disconnect":oon.disconnect_from_net_srv, "serve":oon.serve_net, "send":oon.send_data_over_net,
+                 "send_batch":oon.send_messages_over_net, "receive":oon.receive_messages_over_net},
+    "unix"  :   {"enable":"EnableUnixManager", "is_server":"UnixIsServer", "framing":"UnixFraming", "connect":oon.connect_to_unix_srv,
+                 "disconnect":oon.disconnect_from_unix_srv, "serve":oon.serve_unix, "send":oon.send_data_over_unix,
+                 "send_batch":oon.send_messages_over_unix, "receive":oon.receive_messages_over_unix},
+}
+
+SIZES = [64, 1024, 16384, 262144]
+IN_FLIGHT_BYTES = 65536
+
+
+def _echo(client, netmessage, excode):
+    return netmessage
+
+def _configure(transport : str, is_server : bool):
+    setattr(oon.StartValues, _TRANSPORTS[transport]["enable"], True)
+    oon.StartValues.NetNoDelay = True
+    setattr(oon.StartValues, _TRANSPORTS[transport]["is_server"], is_server)
+    setattr(oon.StartValues, _TRANSPORTS[transport]["framing"], True)
+
+def _serve(transport : str, ready):
+    _configure(transport, True)
+    if oon.start() != oon.ExCode.Success: os._exit(1)
+    ready.set()
+    _TRANSPORTS[transport]["serve"](_echo)
+    os._exit(0)
+
+def _receive(transport : str, count : int):
+    received = 0
+    while received < count:
+        netmessages, excode = _TRANSPORTS[transport]["receive"]()
+        if excode != oon.ExCode.Success: raise RuntimeError(f"{transport} receive failed: {excode}")
+        received += len(netmessages)
+
+def _percentile(samples : list, part : float):
+    return samples[min(int(part * len(samples)), len(samples) - 1)]
+
+def _measure(transport : str, size : int, rounds : int, window : int):
+    netmessage, excode = oon.generate_message(shapes.Payload("x" * size))
+    if excode != oon.ExCode.Success: raise RuntimeError(f"can not encode payload: {excode}")
+    send = _TRANSPORTS[transport]["send"]
+    latencies = []
+    for _ in range(rounds):
+        started = time.perf_counter_ns()
+        if send(netmessage) != oon.ExCode.Success: raise RuntimeError(f"{transport} send failed")
+        _receive(transport, 1)
+        latencies.append(time.perf_counter_ns() - started)
+    latencies.sort()
+    window = max(1, min(window, IN_FLIGHT_BYTES // size))
+    batch = [netmessage] * window
+    batches = max(1, rounds // window)
+    started = time.perf_counter()
+    for _ in range(batches):
+        if _TRANSPORTS[transport]["send_batch"](batch) != oon.ExCode.Success: raise RuntimeError(f"{transport} send failed")
+        _receive(transport, window)
+    elapsed = time.perf_counter() - started
+    messages = batches * window
+    return {
+        f"{transport}.{size}.rtt_p50" : {"value":_percentile(latencies, 0.5) / 1000, "unit":"us", "better":"lower"},
+        f"{transport}.{size}.rtt_p99" : {"value":_percentile(latencies, 0.99) / 1000, "unit":"us", "better":"lower"},
+        f"{transport}.{size}.throughput" : {"value":messages / elapsed, "unit":"msg/s", "better":"higher",
+                                            "bytes_per_sec":messages * len(netmessage._encoded("utf-8")) / elapsed},
+    }
+
+def run(transport : str, rounds : int, window : int = 32, sizes : list = SIZES):
+    saved = {name:getattr(oon.StartValues, name) for name in ("UnixPath", "NetNoDelay", _TRANSPORTS[transport]["enable"],
+                                                               _TRANSPORTS[transport]["is_server"], _TRANSPORTS[transport]["framing"])}
+    workdir = tempfile.mkdtemp(prefix="oon-bench-")
+    oon.StartValues.UnixPath = os.path.join(workdir, "bench.socket")
+    ready = multiprocessing.get_context("fork").Event()
+    server = multiprocessing.get_context("fork").Process(target=_serve, args=(transport, ready), daemon=True)
+    server.start()
+    results = {}
+    try:
+        if not ready.wait(10): raise RuntimeError(f"{transport} server did not start")
+        _configure(transport, False)
+        if oon.start() != oon.ExCode.Success: raise RuntimeError(f"can not start {transport} client")
+        excode = _TRANSPORTS[transport]["connect"]()
+        if excode != oon.ExCode.Success: raise RuntimeError(f"can not connect to {transport} server: {excode}")
+        for size in sizes: results.update(_measure(transport, size, max(10, rounds * 1024 // max(size, 1024)), window))
+        _TRANSPORTS[transport]["disconnect"]()
+    finally:
+        server.terminate()
+        server.join()
+        oon.stop()
+        setattr(oon.StartValues, _TRANSPORTS[transport]["enable"], False)
+        try: os.unlink(oon.StartValues.UnixPath)
+        except OSError: pass
+        os.rmdir(workdir)
+        for name, value in saved.items(): setattr(oon.StartValues, name, value)
+    return results
@@ -1,5 +1,7 @@
 from .oon import generate_message
 from .oon import load_message_from_str
+from .oon import generate_stream
+from .oon import peek_message_from_str
 from .oon import is_running
 from .oon import is_connected_over_net
 from .oon import is_connected_over_unix
@@ -17,7 +19,61 @@ from .oon import receive_data_over_net
 from .oon import receive_data_over_unix
 from .oon import send_data_over_net
 from .oon import send_data_over_unix
+from .oon import send_messages_over_net
+from .oon import send_messages_over_unix
+from .oon import receive_messages_over_net
+from .oon import receive_messages_over_unix
+from .oon import send_delta_over_net
+from .oon import send_delta_over_unix
+from .oon import forget_delta_over_net
+from .oon import forget_delta_over_unix
+from .oon import send_stream_over_net
+from .oon import send_stream_over_unix
+from .oon import receive_stream_over_net
+from .oon import receive_stream_over_unix
+from .oon import start_net_pool
+from .oon import stop_net_pool
+from .oon import lease_net_connection
+from .oon import release_net_connection
+from .oon import send_data_over_pool
+from .oon import receive_data_over_pool
+from .oon import net_pool_status
+from .oon import serve_net
+from .oon import stop_serving_net
+from .oon import subscribe_net_client
+from .oon import unsubscribe_net_client
+from .oon import publish_over_net
+from .oon import net_subscribers
+from .oon import serve_unix
+from .oon import serve_relay_net
+from .oon import serve_relay_unix
+from .oon import serve_rpc_net
+from .oon import serve_rpc_unix
+from .oon import start_rpc_net
+from .oon import start_rpc_unix
+from .oon import stop_rpc_net
+from .oon import stop_rpc_unix
+from .oon import call_over_net
+from .oon import call_over_unix
+from .oon import stats
+from .oon import reset_stats
+from .oon import enable_stats
+from .oon import client_stats
+from .oon import client_send_queue
+from .oon import add_trace_hook
+from .oon import remove_trace_hook
+from .oon import stop_serving_unix
+from .oon import subscribe_unix_client
+from .oon import unsubscribe_unix_client
+from .oon import publish_over_unix
+from .oon import unix_subscribers
+from .oon import start_net_workers
+from .oon import start_unix_workers
 from .oon import just_convert_object_to_dict
 from .oon import just_load_object_from_dict
+from .oon import NetServer
+from .oon import UnixServer
+from .oon import NetClientSession
+from .oon import UnixClientSession
 from .oon import ExCode
 from .oon import StartValues
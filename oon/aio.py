@@ -0,0 +1,132 @@
+import asyncio
+import uuid as ud
+
+from .oon import ExCode, StartValues, _NetMessage, _FRAME_HEADER, _FRAME_COMPRESSED, _FRAME_SHARED, _FRAME_SIZE, _COMPRESSORS, _pack_frame
+from .oon import _unpack_frame
+from .oon import load_message_from_str
+
+
+class _AioConnection:
+    __slots__ = ['reader', 'writer', 'encoding', 'max_bytes', 'offload_bytes', 'compressor', 'compress_bytes', 'alive', 'addr', 'port',
+                 'uuid', 'state']
+    def __init__(self, reader : asyncio.StreamReader, writer : asyncio.StreamWriter, encoding : str, max_bytes : int,
+                 offload_bytes : int, compression : str = None, compress_bytes : int = 1024, uuid : str = None):
+        self.reader = reader
+        self.writer = writer
+        self.encoding = encoding
+        self.max_bytes = min(max_bytes, _FRAME_SIZE)
+        self.offload_bytes = offload_bytes
+        self.compressor = _COMPRESSORS.get(compression)
+        self.compress_bytes = compress_bytes
+        self.alive = True
+        peer = writer.get_extra_info("peername")
+        self.addr = peer[0] if type(peer) == tuple else peer
+        self.port = peer[1] if type(peer) == tuple else None
+        self.uuid = uuid if uuid != None else ud.uuid4().hex[:20]
+        self.state = {}
+
+    async def _receive_frame(self):
+        header = _FRAME_HEADER.unpack(await self.reader.readexactly(_FRAME_HEADER.size))[0]
+        size = header & _FRAME_SIZE
+        if size > self.max_bytes:
+            while size > 0: size -= len(await self.reader.readexactly(min(size, 65536)))
+            return None, ExCode.BadData
+        frame = await self.reader.readexactly(size)
+        if header & _FRAME_SHARED: return None, ExCode.BadData
+        if header & _FRAME_COMPRESSED:
+            try: frame = _unpack_frame(frame, self.max_bytes)
+            except Exception: return None, ExCode.BadData
+        return frame, ExCode.Success
+
+    async def receive(self, timeout : int = None):
+        if self.alive != True: return None, ExCode.BadConn
+        try: frame, excode = await asyncio.wait_for(self._receive_frame(), timeout)
+        except asyncio.TimeoutError: return None, ExCode.Timeout
+        except Exception: return None, ExCode.BadConn
+        if excode != ExCode.Success: return None, excode
+        if len(frame) >= self.offload_bytes:
+            return await asyncio.get_running_loop().run_in_executor(None, _load_frame, frame, self.encoding)
+        return _load_frame(frame, self.encoding)
+
+    async def send(self, netmessage : _NetMessage, timeout : int = None):
+        if not isinstance(netmessage, _NetMessage): return ExCode.BadData
+        if netmessage.create_code != ExCode.Success: return ExCode.BadData
+        if self.alive != True: return ExCode.BadConn
+        buffers = _pack_frame([], netmessage._encoded(self.encoding), self.compressor, self.compress_bytes)
+        if buffers == None: return ExCode.BadData
+        try:
+            self.writer.writelines(buffers)
+            await asyncio.wait_for(self.writer.drain(), timeout)
+            return ExCode.Success
+        except asyncio.TimeoutError: return ExCode.Timeout
+        except Exception: return ExCode.BadConn
+
+    async def close(self):
+        if self.alive != True: return ExCode.BadConn
+        self.alive = False
+        try:
+            self.writer.close()
+            await self.writer.wait_closed()
+        except Exception: return ExCode.BadConn
+        return ExCode.Success
+
+
+def _load_frame(frame : bytes, encoding : str):
+    return load_message_from_str(messtr=frame, encoding=encoding)
+
+def _connection_handler(handler, encoding : str, max_bytes : int, offload_bytes : int, compression : str, compress_bytes : int):
+    async def handle_connection(reader : asyncio.StreamReader, writer : asyncio.StreamWriter):
+        conn = _AioConnection(reader, writer, encoding, max_bytes, offload_bytes, compression, compress_bytes)
+        try: await handler(conn)
+        finally: await conn.close()
+    return handle_connection
+
+async def start_net_server(handler, ip : str = None, port : int = None, queue_size : int = None):
+    ip = StartValues.NetIp if ip == None else ip
+    port = StartValues.NetPort if port == None else port
+    queue_size = StartValues.NetQueueSize if queue_size == None else queue_size
+    try:
+        server = await asyncio.start_server(_connection_handler(handler, StartValues.NetEncoding, StartValues.NetMaxMessageBytes,
+                                            StartValues.AioOffloadBytes, StartValues.NetCompression, StartValues.NetCompressBytes),
+                                            ip, port, backlog=queue_size, reuse_address=True)
+        return server, ExCode.Success
+    except Exception: return None, ExCode.StartFail
+
+async def start_unix_server(handler, path : str = None, queue_size : int = None):
+    path = StartValues.UnixPath if path == None else path
+    queue_size = StartValues.UnixQueueSize if queue_size == None else queue_size
+    try:
+        server = await asyncio.start_unix_server(_connection_handler(handler, StartValues.UnixEncoding, StartValues.UnixMaxMessageBytes,
+                                                 StartValues.AioOffloadBytes, StartValues.UnixCompression, StartValues.UnixCompressBytes),
+                                                 path, backlog=queue_size)
+        return server, ExCode.Success
+    except Exception: return None, ExCode.StartFail
+
+async def connect_to_net_srv(ip : str = None, port : int = None, timeout : int = None):
+    ip = StartValues.NetIp if ip == None else ip
+    port = StartValues.NetPort if port == None else port
+    try: reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+    except asyncio.TimeoutError: return None, ExCode.Timeout
+    except Exception: return None, ExCode.BadConn
+    return _AioConnection(reader, writer, StartValues.NetEncoding, StartValues.NetMaxMessageBytes, StartValues.AioOffloadBytes,
+                          StartValues.NetCompression, StartValues.NetCompressBytes), ExCode.Success
+
+async def connect_to_unix_srv(path : str = None, timeout : int = None):
+    path = StartValues.UnixPath if path == None else path
+    try: reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(path), timeout)
+    except asyncio.TimeoutError: return None, ExCode.Timeout
+    except Exception: return None, ExCode.BadConn
+    return _AioConnection(reader, writer, StartValues.UnixEncoding, StartValues.UnixMaxMessageBytes, StartValues.AioOffloadBytes,
+                          StartValues.UnixCompression, StartValues.UnixCompressBytes), ExCode.Success
+
+async def receive_data(conn : _AioConnection, timeout : int = None):
+    if type(conn) != _AioConnection: return None, ExCode.BadConn
+    return await conn.receive(timeout)
+
+async def send_data(netmessage : _NetMessage, conn : _AioConnection, timeout : int = None):
+    if type(conn) != _AioConnection: return ExCode.BadConn
+    return await conn.send(netmessage, timeout)
+
+async def close_connection(conn : _AioConnection):
+    if type(conn) != _AioConnection: return ExCode.BadConn
+    return await conn.close()
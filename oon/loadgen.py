@@ -0,0 +1,259 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from . import oon
+
+
+class Ping:
+    seq : int = 0
+    def __init__(self, seq : int = 0):
+        self.seq = seq
+
+class Record:
+    seq : int = 0
+    name : str = ""
+    price : float = 0.0
+    tags : list = []
+    active : bool = True
+    def __init__(self, seq : int = 0):
+        self.seq = seq
+        self.name = f"record-{seq}"
+        self.price = seq / 100
+        self.tags = ["load", "test", "record"]
+        self.active = seq % 2 == 0
+
+class Blob:
+    seq : int = 0
+    data : str = ""
+    def __init__(self, seq : int = 0):
+        self.seq = seq
+        self.data = "x" * 16384
+
+
+_TRANSPORTS = {
+    "net"   :   {"enable":"EnableNetManager", "is_server":"NetIsServer", "framing":"NetFraming", "timeout":"DefaultNetTimeout",
+                 "connect":oon.connect_to_net_srv, "disconnect":oon.disconnect_from_net_srv, "serve":oon.serve_net,
+                 "stop_serving":oon.stop_serving_net, "send":oon.send_data_over_net, "receive":oon.receive_data_over_net},
+    "unix"  :   {"enable":"EnableUnixManager", "is_server":"UnixIsServer", "framing":"UnixFraming", "timeout":"DefaultUnixTimeout",
+                 "connect":oon.connect_to_unix_srv, "disconnect":oon.disconnect_from_unix_srv, "serve":oon.serve_unix,
+                 "stop_serving":oon.stop_serving_unix, "send":oon.send_data_over_unix, "receive":oon.receive_data_over_unix},
+}
+
+DEFAULT_MIX = {"Ping":8, "Record":2}
+RECEIVE_TIMEOUT = 0.2
+
+
+def _parse_mix(mix : str):
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition(":")
+        weights[name.strip()] = float(weight) if weight else 1.0
+    return weights
+
+def _classes(modules : list):
+    classes = {}
+    for mod in modules:
+        for name in dir(mod):
+            if isinstance(getattr(mod, name), type): classes[name] = getattr(mod, name)
+    return classes
+
+def _configure(transport : str, is_server : bool, modules : list):
+    oon.StartValues.ConvertModules = modules
+    setattr(oon.StartValues, _TRANSPORTS[transport]["enable"], True)
+    setattr(oon.StartValues, _TRANSPORTS[transport]["is_server"], is_server)
+    setattr(oon.StartValues, _TRANSPORTS[transport]["framing"], True)
+
+def _echo(client, netmessage, excode):
+    return netmessage
+
+def _serve(transport : str, modules : list, workers : int, ready):
+    _configure(transport, True, modules)
+    oon.StartValues.NetWorkers = workers
+    oon.StartValues.UnixWorkers = workers
+    if oon.start() != oon.ExCode.Success: os._exit(1)
+    ready.set()
+    _TRANSPORTS[transport]["serve"](_echo)
+    os._exit(0)
+
+class _LoadClient:
+    def __init__(self, transport : str, classes : dict, mix : dict, seed : int):
+        self.transport = _TRANSPORTS[transport]
+        self.random = random.Random(seed)
+        self.choices = [classes[name] for name in mix]
+        self.weights = list(mix.values())
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.sent = 0
+        self.errors = 0
+        self.running = True
+
+    def _message(self):
+        objclass = self.random.choices(self.choices, self.weights)[0]
+        netmessage, excode = oon.generate_message(objclass(self.sent))
+        if excode != oon.ExCode.Success: raise RuntimeError(f"can not encode {objclass.__name__}: {excode}")
+        return netmessage
+
+    def _closed_loop(self, deadline : float):
+        while time.perf_counter() < deadline:
+            netmessage = self._message()
+            started = time.perf_counter()
+            self.sent += 1
+            if self.transport["send"](netmessage) != oon.ExCode.Success:
+                self.errors += 1
+                continue
+            while True:
+                reply, excode = self.transport["receive"]()
+                if excode != oon.ExCode.Timeout or time.perf_counter() >= deadline + RECEIVE_TIMEOUT: break
+            if excode != oon.ExCode.Success or reply.uuid != netmessage.uuid: self.errors += 1
+            else: self.latencies.append(time.perf_counter() - started)
+
+    def _open_loop(self, deadline : float, rate : float, drain : float):
+        reader = threading.Thread(target=self._read, daemon=True)
+        reader.start()
+        interval = 1 / rate
+        scheduled = time.perf_counter() + self.random.random() * interval
+        while scheduled < deadline:
+            delay = scheduled - time.perf_counter()
+            if delay > 0: time.sleep(delay)
+            netmessage = self._message()
+            with self.lock: self.pending[netmessage.uuid] = scheduled
+            self.sent += 1
+            if self.transport["send"](netmessage) != oon.ExCode.Success:
+                with self.lock: self.pending.pop(netmessage.uuid, None)
+                self.errors += 1
+            scheduled += interval
+        drain_deadline = time.perf_counter() + drain
+        while len(self.pending) > 0 and time.perf_counter() < drain_deadline: time.sleep(0.01)
+        self.running = False
+        reader.join()
+
+    def _read(self):
+        while self.running:
+            reply, excode = self.transport["receive"]()
+            if excode == oon.ExCode.Timeout: continue
+            received = time.perf_counter()
+            if excode != oon.ExCode.Success:
+                self.errors += 1
+                if excode == oon.ExCode.BadConn: return
+                continue
+            with self.lock: scheduled = self.pending.pop(reply.uuid, None)
+            if scheduled == None: self.errors += 1
+            else: self.latencies.append(received - scheduled)
+
+def _run_client(transport : str, modules : list, mix : dict, rate : float, duration : float, drain : float, seed : int, start_at : float,
+                results):
+    report = {"sent":0, "received":0, "errors":0, "lost":0, "latencies":[], "failure":None}
+    try:
+        _configure(transport, False, modules)
+        setattr(oon.StartValues, _TRANSPORTS[transport]["timeout"], RECEIVE_TIMEOUT)
+        if oon.start() != oon.ExCode.Success: raise RuntimeError("can not start oon")
+        excode = _TRANSPORTS[transport]["connect"]()
+        if excode != oon.ExCode.Success: raise RuntimeError(f"can not connect: {excode}")
+        client = _LoadClient(transport, _classes(modules), mix, seed)
+        delay = start_at - time.time()
+        if delay > 0: time.sleep(delay)
+        deadline = time.perf_counter() + duration
+        if rate > 0: client._open_loop(deadline, rate, drain)
+        else: client._closed_loop(deadline)
+        _TRANSPORTS[transport]["disconnect"]()
+        report.update({"sent":client.sent, "received":len(client.latencies), "errors":client.errors, "lost":len(client.pending),
+                       "latencies":client.latencies})
+    except Exception as e: report["failure"] = f"{type(e).__name__}: {e}"
+    results.put(report)
+
+def _percentile(samples : list, part : float):
+    if len(samples) == 0: return None
+    return samples[min(int(part * len(samples)), len(samples) - 1)] * 1000
+
+def run_load(transport : str = "net", clients : int = 4, rate : float = 0, duration : float = 10, mix : dict = None, modules : list = None,
+             local : bool = True, workers : int = 0, drain : float = 2.0):
+    if transport not in _TRANSPORTS: raise ValueError(f"unknown transport {transport}")
+    modules = [sys.modules[__name__]] + (modules or [])
+    mix = DEFAULT_MIX if mix == None else mix
+    classes = _classes(modules)
+    for name in mix:
+        if name not in classes: raise ValueError(f"class {name} is not in registered modules")
+    context = multiprocessing.get_context("fork")
+    server = None
+    workdir = None
+    unix_path = oon.StartValues.UnixPath
+    try:
+        if local == True:
+            if transport == "unix" and oon.StartValues.UnixPath == "oon.socket":
+                workdir = tempfile.mkdtemp(prefix="oon-loadgen-")
+                oon.StartValues.UnixPath = os.path.join(workdir, "loadgen.socket")
+            ready = context.Event()
+            server = context.Process(target=_serve, args=(transport, modules, workers, ready), daemon=True)
+            server.start()
+            if not ready.wait(10): raise RuntimeError(f"local {transport} server did not start")
+        results = context.Queue()
+        start_at = time.time() + 0.5
+        processes = [context.Process(target=_run_client, args=(transport, modules, mix, rate / clients, duration, drain, index, start_at,
+                                                               results)) for index in range(clients)]
+        for process in processes: process.start()
+        reports = [results.get() for _ in processes]
+        for process in processes: process.join()
+    finally:
+        if server != None:
+            server.terminate()
+            server.join()
+        if workdir != None:
+            try: os.unlink(oon.StartValues.UnixPath)
+            except OSError: pass
+            os.rmdir(workdir)
+        oon.StartValues.UnixPath = unix_path
+    latencies = sorted(latency for report in reports for latency in report["latencies"])
+    return {"transport":transport, "clients":clients, "mode":"open" if rate > 0 else "closed", "target_rate":rate, "duration":duration,
+            "mix":mix, "sent":sum(report["sent"] for report in reports), "received":len(latencies),
+            "errors":sum(report["errors"] for report in reports), "lost":sum(report["lost"] for report in reports),
+            "throughput":len(latencies) / duration, "p50_ms":_percentile(latencies, 0.5), "p99_ms":_percentile(latencies, 0.99),
+            "p999_ms":_percentile(latencies, 0.999), "max_ms":latencies[-1] * 1000 if latencies else None,
+            "failures":[report["failure"] for report in reports if report["failure"] != None]}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m oon.loadgen", description="oon multi-client load generator")
+    parser.add_argument("--transport", choices=list(_TRANSPORTS), default="net")
+    parser.add_argument("--clients", type=int, default=4, help="concurrent client processes")
+    parser.add_argument("--rate", type=float, default=0, help="total messages per second (open loop), 0 - closed loop")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of sending")
+    parser.add_argument("--mix", default=",".join(f"{name}:{weight}" for name, weight in DEFAULT_MIX.items()),
+                        help="classes to send with weights, like Ping:8,Record:2,Blob:1")
+    parser.add_argument("--module", action="append", default=[], help="import path of module with your classes, can be repeated")
+    parser.add_argument("--remote", action="store_true", help="do not start local server, use one at StartValues address")
+    parser.add_argument("--ip", help="server ip (net)")
+    parser.add_argument("--port", type=int, help="server port (net)")
+    parser.add_argument("--path", help="server socket path (unix)")
+    parser.add_argument("--workers", type=int, default=0, help="worker threads of local server")
+    parser.add_argument("--codec", default="json", help="StartValues.ConvertCodec of clients and local server")
+    parser.add_argument("--nodelay", action="store_true", help="set StartValues.NetNoDelay")
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    args = parser.parse_args()
+    if args.ip != None: oon.StartValues.NetIp = args.ip
+    if args.port != None: oon.StartValues.NetPort = args.port
+    if args.path != None: oon.StartValues.UnixPath = args.path
+    oon.StartValues.ConvertCodec = args.codec
+    oon.StartValues.NetNoDelay = args.nodelay
+    report = run_load(args.transport, args.clients, args.rate, args.duration, _parse_mix(args.mix),
+                      [importlib.import_module(name) for name in args.module], not args.remote, args.workers)
+    if args.json: print(json.dumps(report, indent=2))
+    else:
+        for field in ("transport", "clients", "mode", "sent", "received", "errors", "lost", "throughput", "p50_ms", "p99_ms", "p999_ms",
+                      "max_ms"):
+            value = report[field]
+            print(f"{field:<11} {value:.3f}" if type(value) == float else f"{field:<11} {value}")
+        for failure in report["failures"]: print(f"client failed: {failure}")
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,36 @@
 import uuid as ud
 import socket
+import copy
 import enum
 import json
+import re
 import os
+import sys
+import struct
+import select
+import selectors
+import threading
+import collections
+import heapq
+import itertools
+import concurrent.futures
+import multiprocessing
+import multiprocessing.connection
+import signal
+import time
+import types
+import zlib
+import mmap
+import array
+
+try: import orjson
+except ImportError: orjson = None
+try: import ujson
+except ImportError: ujson = None
+try: import lzma
+except ImportError: lzma = None
+try: import bz2
+except ImportError: bz2 = None
 
 class ExCode(enum.Enum):
     Success     =   0
@@ -21,6 +49,18 @@ class StartValues(object):
     UnixQueueSize       =   3
     DefaultUnixBytes    =   1024
     DefaultUnixClient   =   None
+    UnixFraming         =   False
+    UnixMaxMessageBytes =   16777216
+    UnixWorkers         =   0
+    UnixWorkerQueueSize =   1024
+    UnixCompression     =   None
+    UnixCompressBytes   =   1024
+    UnixSharedMemoryBytes   =   0
+    UnixSharedMemorySegments    =   8
+    UnixSendQueueBytes  =   0
+    UnixSendQueueMessages   =   0
+    UnixSendQueuePolicy =   "block"
+    UnixPublishQueueBytes   =   1048576
 
     EnableNetManager    =   False
     NetIp               =   '127.0.0.1'
@@ -31,6 +71,23 @@ class StartValues(object):
     NetQueueSize        =   1
     DefaultNetBytes     =   1024
     DefaultNetClient    =   None
+    NetFraming          =   False
+    NetMaxMessageBytes  =   16777216
+    NetWorkers          =   0
+    NetWorkerQueueSize  =   1024
+    NetNoDelay          =   False
+    NetCork             =   False
+    NetCompression      =   None
+    NetCompressBytes    =   1024
+    NetPoolEndpoints    =   []
+    NetPoolConnections  =   2
+    NetPoolBalance      =   "round_robin"
+    NetPoolBackoff      =   0.1
+    NetPoolMaxBackoff   =   5.0
+    NetSendQueueBytes   =   0
+    NetSendQueueMessages    =   0
+    NetSendQueuePolicy  =   "block"
+    NetPublishQueueBytes    =   1048576
 
     EnableConvertManager    =   True
     ConvertModules                 =   []
@@ -38,6 +95,14 @@ class StartValues(object):
     DefaultNetobj           =   None
     DefaultMessageString    =   None
     DefaultIgnoreFields     =   []
+    ConvertCodec            =   "json"
+
+    AioOffloadBytes         =   65536
+
+    StreamChunkBytes        =   65536
+    StreamMaxBytes          =   1073741824
+
+    EnableStats             =   False
 
     @staticmethod
     def all_fields_info():
@@ -51,7 +116,32 @@ DefaultUnixTimeout : int = {StartValues.DefaultUnixTimeout} - timeout for operat
 data (if started in server mode, client sonnections inherit this option)
 UnixQueueSize : int = {StartValues.UnixQueueSize} - connections queue
 DefaultUnixBytes : int = {StartValues.DefaultUnixBytes} - size of message to expect on receive_data()
+(with framing on - initial size of per-connection receive buffer and minimal read size)
 DefaultUnixClient : _UnixClient = {StartValues.DefaultUnixClient} - default value where _UnixClient needed
+UnixFraming : bool = {StartValues.UnixFraming} - prefix every message with its size, so receive_data() always
+returns exactly one whole message (both sides must use the same value)
+UnixMaxMessageBytes : int = {StartValues.UnixMaxMessageBytes} - biggest framed message accepted on receive_data(), at most 1 GiB - 1
+(bigger messages are not sent at all)
+UnixWorkers : int = {StartValues.UnixWorkers} - threads that decode and handle messages in serve_unix(), 0 - handle in event loop
+UnixWorkerQueueSize : int = {StartValues.UnixWorkerQueueSize} - received messages waiting for worker threads before serve_unix() stops reading
+UnixCompression : str = {StartValues.UnixCompression} - compress sent messages with "zlib", "lzma" or "bz2", None - send raw.
+Compressed frames are marked in frame header, so receiver always reads them whatever this option is
+UnixCompressBytes : int = {StartValues.UnixCompressBytes} - messages smaller than this are sent raw even with compression on
+UnixSharedMemoryBytes : int = {StartValues.UnixSharedMemoryBytes} - messages of this size or bigger are written to shared memory (memfd)
+and only its descriptor goes over the socket, 0 - off (Linux, framing on, peer must be oon manager of this or newer version)
+UnixSharedMemorySegments : int = {StartValues.UnixSharedMemorySegments} - shared memory segments reused for sending, when all of them
+are still being read by receivers messages are sent over the socket. Received binary messages are not copied out of shared memory
+and hold their segment until they are sent on or dropped
+UnixSendQueueBytes : int = {StartValues.UnixSendQueueBytes} - bytes waiting in outbound queue of every accepted client before
+UnixSendQueuePolicy applies, 0 - no byte limit. With this or UnixSendQueueMessages set, sends to accepted clients are queued and
+written by background thread without blocking the sender, off - sent on caller thread
+UnixSendQueueMessages : int = {StartValues.UnixSendQueueMessages} - messages waiting in outbound queue of every accepted client
+before UnixSendQueuePolicy applies, 0 - no message limit
+UnixSendQueuePolicy : str = {StartValues.UnixSendQueuePolicy} - what send does when queue is full: "block" (wait for space up to
+client timeout, then ExCode.Timeout), "drop_oldest", "drop_newest" (ExCode.Timeout) or "disconnect" (close client, ExCode.BadConn)
+UnixPublishQueueBytes : int = {StartValues.UnixPublishQueueBytes} - limit of outbound queue given to client by subscribe_unix_client()
+or serve_unix() when send queues are off, published messages and served replies over it are dropped for this client only.
+Other sends to this client are not queued, they wait until messages queued before them are written
 
 Network connection settings:
 EnableNetManager : bool = {StartValues.EnableNetManager} - do you want to transfer data over unix named sockets?
@@ -63,7 +153,35 @@ DefaultNetTimeout : int = {StartValues.DefaultNetTimeout} - timeout for operatio
 data (if started in server mode, client sonnections inherit this option)
 NetQueueSize : int = {StartValues.NetQueueSize} - connections queue
 DefaultNetBytes : int = {StartValues.DefaultNetBytes} - size of message to expect on receive_data()
+(with framing on - initial size of per-connection receive buffer and minimal read size)
 DefaultNetClient : _NetClient = {StartValues.DefaultNetClient} - default value where _NetClient needed
+NetFraming : bool = {StartValues.NetFraming} - prefix every message with its size, so receive_data() always
+returns exactly one whole message (both sides must use the same value)
+NetMaxMessageBytes : int = {StartValues.NetMaxMessageBytes} - biggest framed message accepted on receive_data(), at most 1 GiB - 1
+(bigger messages are not sent at all)
+NetWorkers : int = {StartValues.NetWorkers} - threads that decode and handle messages in serve_net(), 0 - handle in event loop
+NetWorkerQueueSize : int = {StartValues.NetWorkerQueueSize} - received messages waiting for worker threads before serve_net() stops reading
+NetNoDelay : bool = {StartValues.NetNoDelay} - set TCP_NODELAY on all sockets (send small messages without delay)
+NetCork : bool = {StartValues.NetCork} - hold TCP_CORK while one send call is written, so messages are packed into full segments (Linux)
+NetCompression : str = {StartValues.NetCompression} - compress sent messages with "zlib", "lzma" or "bz2", None - send raw.
+Compressed frames are marked in frame header, so receiver always reads them whatever this option is
+NetCompressBytes : int = {StartValues.NetCompressBytes} - messages smaller than this are sent raw even with compression on
+NetPoolEndpoints : list = {StartValues.NetPoolEndpoints} - (ip, port) servers of start_net_pool(), empty - only NetIp and NetPort
+NetPoolConnections : int = {StartValues.NetPoolConnections} - connections kept open to every pool server
+NetPoolBalance : str = {StartValues.NetPoolBalance} - how pool picks connection: "round_robin" or "least_in_flight"
+(idle connection to the server with the fewest leased connections)
+NetPoolBackoff : float = {StartValues.NetPoolBackoff} - first delay before pool reconnects dead connection, doubled after every failed try
+NetPoolMaxBackoff : float = {StartValues.NetPoolMaxBackoff} - biggest delay between pool reconnect tries
+NetSendQueueBytes : int = {StartValues.NetSendQueueBytes} - bytes waiting in outbound queue of every accepted client before
+NetSendQueuePolicy applies, 0 - no byte limit. With this or NetSendQueueMessages set, sends to accepted clients are queued and
+written by background thread without blocking the sender, off - sent on caller thread
+NetSendQueueMessages : int = {StartValues.NetSendQueueMessages} - messages waiting in outbound queue of every accepted client
+before NetSendQueuePolicy applies, 0 - no message limit
+NetSendQueuePolicy : str = {StartValues.NetSendQueuePolicy} - what send does when queue is full: "block" (wait for space up to
+client timeout, then ExCode.Timeout), "drop_oldest", "drop_newest" (ExCode.Timeout) or "disconnect" (close client, ExCode.BadConn)
+NetPublishQueueBytes : int = {StartValues.NetPublishQueueBytes} - limit of outbound queue given to client by subscribe_net_client()
+or serve_net() when send queues are off, published messages and served replies over it are dropped for this client only.
+Other sends to this client are not queued, they wait until messages queued before them are written
 
 Converter settings:
 EnableConvertManager : bool = {StartValues.EnableConvertManager} - do not turn this off!
@@ -72,16 +190,552 @@ ConvertClasses : list = {StartValues.ConvertClasses} - list of your custom class
 DefaultNetobj : _NetMessage = {StartValues.DefaultNetobj} - default value where _NetMessage needed
 DefaultMessageString : str {StartValues.DefaultMessageString} - default value where _NetMessage needs json_string
 DefaultIgnoreFields : list = {StartValues.DefaultIgnoreFields} - default list of fields to ignore
+ConvertCodec : str = {StartValues.ConvertCodec} - wire format of generated messages: "json", "binary"
+(compact, both sides must register the same classes) or "orjson"/"ujson" if installed.
+Received messages are read in json or binary format regardless of this option
+
+Asyncio settings (oon.aio):
+AioOffloadBytes : int = {StartValues.AioOffloadBytes} - messages of this size or bigger are decoded in executor
+thread instead of event loop
+
+Streaming settings (send_stream_over_*, receive_stream_over_*):
+StreamChunkBytes : int = {StartValues.StreamChunkBytes} - approximate size of one sent chunk, long lists and strings are split by it
+StreamMaxBytes : int = {StartValues.StreamMaxBytes} - biggest total size of all chunks of one received stream
+
+Stats settings:
+EnableStats : bool = {StartValues.EnableStats} - count messages, bytes and errors of managers and clients and measure encode, decode,
+send and receive latency for stats(), off - almost no cost (does not turn off stats enabled by enable_stats())
 """
 
 
-class _ConvertManager(object):
-    init    =   False
-    classes =   []
+_PLAIN_TYPES = frozenset([str, int, float, bool, type(None)])
+_GRAPH_DEPTH = 64
+
+class _ClassPlan:
+    __slots__ = ['objclass', 'name', 'is_enum', 'fields', 'field_set', 'field_index', 'has_dict', 'type_id', 'construct']
+    def __init__(self, objclass):
+        self.objclass = objclass
+        self.name = objclass.__name__
+        self.type_id = None
+        self.is_enum = isinstance(objclass, enum.EnumMeta)
+        self.fields = []
+        self.has_dict = getattr(objclass, "__dictoffset__", 0) != 0
+        self.construct = False
+        if not self.is_enum:
+            for attr in dir(objclass):
+                if attr.startswith("__"): continue
+                try: class_value = getattr(objclass, attr)
+                except: continue
+                if callable(class_value): continue
+                self.fields.append(attr)
+                if isinstance(class_value, types.MemberDescriptorType): self.construct = True
+        self.field_set = frozenset(self.fields)
+        self.field_index = {field:index for index, field in enumerate(self.fields)}
+
+    def _object_fields(self, netobj):
+        if not self.has_dict: return self.fields
+        try: extra_fields = [attr for attr in netobj.__dict__ if attr not in self.field_set and not attr.startswith("__")]
+        except: return self.fields
+        if not extra_fields: return self.fields
+        return self.fields + extra_fields
+
+    def _new_object(self):
+        if self.construct == True:
+            try: return self.objclass()
+            except: pass
+        return self.objclass.__new__(self.objclass)
+
+class _ClassRegistry:
+    __slots__ = ['classes', 'by_type', 'by_name', 'by_id']
+    def __init__(self, classes : list):
+        self.classes = classes
+        self.by_type = {}
+        self.by_name = {}
+        for objcls in classes:
+            if objcls in self.by_type: continue
+            try: plan = _ClassPlan(objcls)
+            except: continue
+            self.by_type[objcls] = plan
+            if plan.name not in self.by_name: self.by_name[plan.name] = plan
+        self.by_id = [self.by_name[name] for name in sorted(self.by_name)]
+        for type_id, plan in enumerate(self.by_id): plan.type_id = type_id
+
+    @staticmethod
+    def _from_classes(classes):
+        if type(classes) == _ClassRegistry: return classes
+        if _ConvertManager.registry != None and classes is _ConvertManager.classes: return _ConvertManager.registry
+        return _ClassRegistry(classes)
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_HEAD = re.compile(r'\s*\{\s*"head"\s*:\s*')
+_JSON_BODY_TYPE = re.compile(r'\s*,\s*"body"\s*:\s*\{\s*"type"\s*:\s*')
+
+class _JsonCodec:
+    name = "json"
+    def _dumps(self, mesdict : dict, registry : _ClassRegistry):
+        return json.dumps(mesdict)
+
+    def _peek(self, data, encoding : str, registry : _ClassRegistry):
+        if type(data) != str: data = str(data, encoding)
+        match = _JSON_HEAD.match(data)
+        if match == None:
+            mesdict = json.loads(data)
+            return mesdict["head"], mesdict["body"].get("type") if type(mesdict["body"]) == dict else None
+        head, pos = _JSON_DECODER.raw_decode(data, match.end())
+        match = _JSON_BODY_TYPE.match(data, pos)
+        if match == None: return head, None
+        return head, _JSON_DECODER.raw_decode(data, match.end())[0]
+
+    def _loads(self, data, encoding : str, registry : _ClassRegistry):
+        if type(data) != str: data = str(data, encoding)
+        return json.loads(data), data
+
+class _OrjsonCodec(_JsonCodec):
+    name = "orjson"
+    def _dumps(self, mesdict : dict, registry : _ClassRegistry):
+        return orjson.dumps(mesdict)
+
+    def _loads(self, data, encoding : str, registry : _ClassRegistry):
+        if type(data) != str and encoding.replace("-", "").lower() != "utf8": data = str(data, encoding)
+        return orjson.loads(data), data if type(data) == str else None
+
+class _UjsonCodec(_JsonCodec):
+    name = "ujson"
+    def _dumps(self, mesdict : dict, registry : _ClassRegistry):
+        return ujson.dumps(mesdict)
+
+    def _loads(self, data, encoding : str, registry : _ClassRegistry):
+        if type(data) != str: data = str(data, encoding)
+        return ujson.loads(data), data
+
+_BINARY_MAGIC   =   0xB1
+_B_NONE         =   0
+_B_FALSE        =   1
+_B_TRUE         =   2
+_B_INT          =   3
+_B_FLOAT        =   4
+_B_STR          =   5
+_B_LIST         =   6
+_B_DICT         =   7
+_B_OBJECT       =   8
+_B_ENUM         =   9
+_B_INTS         =   10
+_B_FLOATS       =   11
+_B_DOUBLE = struct.Struct("!d")
+_B_PACK_MIN = 8
+_B_INT_CODES = [(code, 1 << (array.array(code).itemsize * 8 - 1)) for code in ("b", "h", "i", "q")]
+
+class _BinaryCodec:
+    name = "binary"
+    def _dumps(self, mesdict : dict, registry : _ClassRegistry):
+        out = bytearray([_BINARY_MAGIC])
+        self._dump_value(out, mesdict["head"], registry)
+        self._dump_value(out, mesdict["body"], registry)
+        return bytes(out)
+
+    def _loads(self, data, encoding : str, registry : _ClassRegistry):
+        if type(data) == str or len(data) == 0 or data[0] != _BINARY_MAGIC: raise ValueError("not a binary message")
+        head, pos = self._load_value(data, 1, registry)
+        body, pos = self._load_value(data, pos, registry)
+        if pos != len(data): raise ValueError("trailing data in binary message")
+        return {"head":head, "body":body}, None
+
+    def _peek(self, data, encoding : str, registry : _ClassRegistry):
+        if type(data) == str or len(data) == 0 or data[0] != _BINARY_MAGIC: raise ValueError("not a binary message")
+        head, pos = self._load_value(data, 1, registry)
+        if data[pos] != _B_OBJECT and data[pos] != _B_ENUM: return head, None
+        return head, registry.by_id[self._load_varint(data, pos + 1)[0]].name
+
+    @staticmethod
+    def _dump_varint(out : bytearray, number : int):
+        if number < 0x80: return out.append(number)
+        while number > 0x7f:
+            out.append((number & 0x7f) | 0x80)
+            number >>= 7
+        out.append(number)
+
+    @staticmethod
+    def _load_varint(data, pos : int):
+        if data[pos] < 0x80: return data[pos], pos + 1
+        number = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            number |= (byte & 0x7f) << shift
+            if byte < 0x80: return number, pos
+            shift += 7
+
+    def _dump_str(self, out : bytearray, value : str):
+        value = value.encode("utf-8")
+        self._dump_varint(out, len(value))
+        out += value
+
+    def _load_str(self, data, pos : int):
+        size, pos = self._load_varint(data, pos)
+        return str(data[pos:pos + size], "utf-8"), pos + size
+
+    def _dump_value(self, out : bytearray, value, registry : _ClassRegistry):
+        value_type = type(value)
+        if value_type == int:
+            out.append(_B_INT)
+            self._dump_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+        elif value_type == float:
+            out.append(_B_FLOAT)
+            out += _B_DOUBLE.pack(value)
+        elif value_type == str:
+            out.append(_B_STR)
+            self._dump_str(out, value)
+        elif value == None: out.append(_B_NONE)
+        elif value_type == bool: out.append(_B_TRUE if value else _B_FALSE)
+        elif value_type == list or value_type == tuple:
+            if len(value) >= _B_PACK_MIN and self._dump_packed(out, value): return
+            out.append(_B_LIST)
+            self._dump_varint(out, len(value))
+            for item in value: self._dump_value(out, item, registry)
+        elif value_type == dict:
+            plan = registry.by_name.get(value.get("type"))
+            if plan != None and plan.is_enum:
+                out.append(_B_ENUM)
+                self._dump_varint(out, plan.type_id)
+                self._dump_value(out, value["value"], registry)
+            elif plan != None:
+                out.append(_B_OBJECT)
+                self._dump_varint(out, plan.type_id)
+                self._dump_varint(out, len(value) - 1)
+                for field, field_value in value.items():
+                    if field == "type": continue
+                    field_index = plan.field_index.get(field)
+                    if field_index == None:
+                        out.append(0)
+                        self._dump_str(out, field)
+                    else: self._dump_varint(out, field_index + 1)
+                    self._dump_value(out, field_value, registry)
+            else:
+                out.append(_B_DICT)
+                self._dump_varint(out, len(value))
+                for key, item in value.items():
+                    if type(key) != str: raise TypeError("dict keys must be str")
+                    self._dump_str(out, key)
+                    self._dump_value(out, item, registry)
+        else: raise TypeError(f"can not encode {value_type.__name__}")
+
+    def _dump_packed(self, out : bytearray, value):
+        item_types = set(map(type, value))
+        if item_types == {float}:
+            numbers = array.array("d", value)
+            out.append(_B_FLOATS)
+        elif item_types == {int}:
+            smallest, biggest = min(value), max(value)
+            for code, limit in _B_INT_CODES:
+                if -limit <= smallest and biggest < limit: break
+            else: return False
+            numbers = array.array(code, value)
+            out.append(_B_INTS)
+            out.append(numbers.itemsize)
+        else: return False
+        if sys.byteorder != "little": numbers.byteswap()
+        self._dump_varint(out, len(numbers))
+        out += numbers.tobytes()
+        return True
+
+    def _load_packed(self, data, pos : int, code : str):
+        size, pos = self._load_varint(data, pos)
+        numbers = array.array(code)
+        end = pos + size * numbers.itemsize
+        if end > len(data): raise ValueError("truncated packed list")
+        numbers.frombytes(data[pos:end])
+        if sys.byteorder != "little": numbers.byteswap()
+        return numbers.tolist(), end
+
+    def _load_value(self, data, pos : int, registry : _ClassRegistry):
+        tag = data[pos]
+        pos += 1
+        if tag == _B_INT:
+            number, pos = self._load_varint(data, pos)
+            return (number >> 1) ^ -(number & 1), pos
+        elif tag == _B_STR: return self._load_str(data, pos)
+        elif tag == _B_NONE: return None, pos
+        elif tag == _B_TRUE: return True, pos
+        elif tag == _B_FALSE: return False, pos
+        elif tag == _B_FLOAT: return _B_DOUBLE.unpack_from(data, pos)[0], pos + _B_DOUBLE.size
+        elif tag == _B_LIST:
+            size, pos = self._load_varint(data, pos)
+            items = []
+            for _ in range(size):
+                item, pos = self._load_value(data, pos, registry)
+                items.append(item)
+            return items, pos
+        elif tag == _B_DICT:
+            size, pos = self._load_varint(data, pos)
+            value = {}
+            for _ in range(size):
+                key, pos = self._load_str(data, pos)
+                value[key], pos = self._load_value(data, pos, registry)
+            return value, pos
+        elif tag == _B_OBJECT:
+            type_id, pos = self._load_varint(data, pos)
+            plan = registry.by_id[type_id]
+            size, pos = self._load_varint(data, pos)
+            value = {"type":plan.name}
+            for _ in range(size):
+                field_index, pos = self._load_varint(data, pos)
+                if field_index == 0: field, pos = self._load_str(data, pos)
+                else: field = plan.fields[field_index - 1]
+                value[field], pos = self._load_value(data, pos, registry)
+            return value, pos
+        elif tag == _B_FLOATS: return self._load_packed(data, pos, "d")
+        elif tag == _B_INTS:
+            itemsize = data[pos]
+            for code, _ in _B_INT_CODES:
+                if array.array(code).itemsize == itemsize: return self._load_packed(data, pos + 1, code)
+            raise ValueError(f"unknown packed int size {itemsize}")
+        elif tag == _B_ENUM:
+            type_id, pos = self._load_varint(data, pos)
+            enum_value, pos = self._load_value(data, pos, registry)
+            return {"type":registry.by_id[type_id].name, "value":enum_value}, pos
+        raise ValueError(f"unknown binary tag {tag}")
+
+_CODECS = {"json":_JsonCodec(), "binary":_BinaryCodec()}
+if orjson != None: _CODECS["orjson"] = _OrjsonCodec()
+if ujson != None: _CODECS["ujson"] = _UjsonCodec()
+
+class _ZlibCompressor:
+    name = "zlib"
+    tag = 1
+    def _compress(self, data : bytes):
+        return zlib.compress(data)
+
+    def _decompressor(self):
+        return zlib.decompressobj()
+
+    def _decompress(self, data, max_size : int):
+        decompressor = self._decompressor()
+        data = decompressor.decompress(data, max_size + 1)
+        if len(data) > max_size: raise ValueError("decompressed message is too big")
+        if not decompressor.eof: raise ValueError("compressed message is truncated")
+        return data
+
+class _LzmaCompressor(_ZlibCompressor):
+    name = "lzma"
+    tag = 2
+    def _compress(self, data : bytes):
+        return lzma.compress(data)
+
+    def _decompressor(self):
+        return lzma.LZMADecompressor()
+
+class _Bz2Compressor(_ZlibCompressor):
+    name = "bz2"
+    tag = 3
+    def _compress(self, data : bytes):
+        return bz2.compress(data)
+
+    def _decompressor(self):
+        return bz2.BZ2Decompressor()
+
+_COMPRESSORS = {"zlib":_ZlibCompressor()}
+if lzma != None: _COMPRESSORS["lzma"] = _LzmaCompressor()
+if bz2 != None: _COMPRESSORS["bz2"] = _Bz2Compressor()
+_COMPRESSOR_TAGS = {compressor.tag:compressor for compressor in _COMPRESSORS.values()}
+
+
+_HISTOGRAM_BUCKETS = 48
+
+class _Histogram:
+    __slots__ = ['buckets', 'count', 'total', 'max']
+    def __init__(self):
+        self.buckets = [0] * _HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def _add(self, ns : int):
+        self.buckets[min(ns.bit_length(), _HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max: self.max = ns
+
+    def _percentile(self, part : float):
+        rank = part * self.count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank: return min(1 << index, self.max) / 1000
+        return self.max / 1000
+
+    def _snapshot(self):
+        if self.count == 0: return {"count":0}
+        return {"count":self.count, "mean_us":self.total / self.count / 1000, "max_us":self.max / 1000,
+                "p50_us":self._percentile(0.5), "p90_us":self._percentile(0.9), "p99_us":self._percentile(0.99),
+                "buckets_us":{(1 << index) / 1000:hits for index, hits in enumerate(self.buckets) if hits > 0}}
+
+class _Counters:
+    __slots__ = ['messages_in', 'messages_out', 'bytes_in', 'bytes_out', 'accepts', 'errors', 'started']
+    def __init__(self):
+        self.started = time.monotonic()
+        self.messages_in = 0
+        self.messages_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.accepts = 0
+        self.errors = collections.Counter()
+
+    def _snapshot(self):
+        return {"messages_in":self.messages_in, "messages_out":self.messages_out, "bytes_in":self.bytes_in, "bytes_out":self.bytes_out,
+                "accepts":self.accepts, "timeouts":self.errors[ExCode.Timeout.name], "errors":dict(self.errors)}
+
+class _StatsManager(object):
+    enabled     =   False
+    lock        =   threading.Lock()
+    started     =   time.monotonic()
+    conversions =   {"encode":collections.Counter(), "decode":collections.Counter()}
+    latency     =   {name:_Histogram() for name in ("encode", "decode", "dumps", "loads", "send", "recv")}
+
+    @staticmethod
+    def _io(counters : _Counters, client, received : bool, messages : int, size : int, excode : ExCode, started : int = None):
+        elapsed = time.perf_counter_ns() - started if started != None else None
+        client_counters = getattr(client, "stats", None)
+        targets = (counters,) if client_counters == None else (counters, client_counters)
+        with _StatsManager.lock:
+            for target in targets:
+                if excode != ExCode.Success: target.errors[excode.name] += 1
+                elif received == True:
+                    target.messages_in += messages
+                    target.bytes_in += size
+                else:
+                    target.messages_out += messages
+                    target.bytes_out += size
+            if elapsed != None: _StatsManager.latency["recv" if received == True else "send"]._add(elapsed)
+
+    @staticmethod
+    def _accepted(counters : _Counters, client):
+        client.stats = _Counters()
+        with _StatsManager.lock: counters.accepts += 1
+
+    @staticmethod
+    def _converted(name : str, excode : ExCode, started : int):
+        elapsed = time.perf_counter_ns() - started
+        with _StatsManager.lock:
+            _StatsManager.conversions[name][excode.name] += 1
+            _StatsManager.latency[name]._add(elapsed)
+
+    @staticmethod
+    def _timed(name : str, started : int):
+        elapsed = time.perf_counter_ns() - started
+        with _StatsManager.lock: _StatsManager.latency[name]._add(elapsed)
+
+    @staticmethod
+    def _snapshot(reset : bool):
+        with _StatsManager.lock:
+            elapsed = time.monotonic() - _StatsManager.started
+            snapshot = {"enabled":_StatsManager.enabled, "seconds":elapsed, "converter":{}, "latency":{}}
+            for name, manager in (("net", _NetManager), ("unix", _UnixManager)): snapshot[name] = _StatsManager._endpoint(manager)
+            for name, results in _StatsManager.conversions.items():
+                snapshot["converter"][name + "d"] = results[ExCode.Success.name]
+                snapshot["converter"][name + "_errors"] = {code:hits for code, hits in results.items() if code != ExCode.Success.name}
+            for name, histogram in _StatsManager.latency.items(): snapshot["latency"][name] = histogram._snapshot()
+            if reset == True: _StatsManager._reset()
+        return snapshot
+
+    @staticmethod
+    def _endpoint(manager):
+        elapsed = time.monotonic() - manager.stats.started
+        snapshot = manager.stats._snapshot()
+        snapshot["accept_rate"] = manager.stats.accepts / elapsed if elapsed > 0 else 0.0
+        snapshot["clients"] = manager.clients
+        return snapshot
+
+    @staticmethod
+    def _endpoint_snapshot(manager, reset : bool):
+        with _StatsManager.lock:
+            snapshot = _StatsManager._endpoint(manager)
+            snapshot["enabled"] = _StatsManager.enabled
+            if reset == True: manager.stats = _Counters()
+        return snapshot
+
+    @staticmethod
+    def _reset():
+        _StatsManager.started = time.monotonic()
+        _NetManager.stats = _Counters()
+        _UnixManager.stats = _Counters()
+        _StatsManager.conversions = {name:collections.Counter() for name in _StatsManager.conversions}
+        _StatsManager.latency = {name:_Histogram() for name in _StatsManager.latency}
+
+
+_TRACE_STAGES = frozenset(["to_dict", "from_dict", "dumps", "loads", "send", "recv", "accept"])
+
+class _TraceEvent:
+    __slots__ = ['stage', 'uuid', 'body_type', 'size', 'start_ns', 'end_ns']
+    def __init__(self, stage : str, uuid : str, body_type : str, size : int, start_ns : int, end_ns : int):
+        self.stage = stage
+        self.uuid = uuid
+        self.body_type = body_type
+        self.size = size
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+
+    def __repr__(self):
+        return f"_TraceEvent({self.stage}, {self.uuid}, {self.body_type}, {self.size}, {(self.end_ns - self.start_ns) / 1000}us)"
+
+class _TraceHook:
+    __slots__ = ['callback', 'sample', 'stages', 'counters']
+    def __init__(self, callback, sample : int, stages):
+        self.callback = callback
+        self.sample = sample
+        self.stages = stages
+        self.counters = {"dump":itertools.count(), "load":itertools.count(), "accept":itertools.count()}
+
+class _TraceManager(object):
+    active      =   False
+    hooks       =   ()
+    lock        =   threading.Lock()
+
+    @staticmethod
+    def _add(callback, sample : int, stages : list):
+        if not callable(callback) or type(sample) != int or sample < 1: return ExCode.BadData
+        stages = _TRACE_STAGES if stages == None else frozenset(stages)
+        if not stages <= _TRACE_STAGES: return ExCode.BadData
+        with _TraceManager.lock:
+            _TraceManager.hooks = _TraceManager.hooks + (_TraceHook(callback, sample, stages),)
+            _TraceManager.active = True
+        return ExCode.Success
+
+    @staticmethod
+    def _remove(callback):
+        with _TraceManager.lock:
+            hooks = tuple(hook for hook in _TraceManager.hooks if hook.callback != callback)
+            if len(hooks) == len(_TraceManager.hooks): return ExCode.BadData
+            _TraceManager.hooks = hooks
+            _TraceManager.active = len(hooks) > 0
+        return ExCode.Success
+
+    @staticmethod
+    def _sample(kind : str):
+        sampled = tuple(hook for hook in _TraceManager.hooks if next(hook.counters[kind]) % hook.sample == 0)
+        return sampled if len(sampled) > 0 else None
 
     @staticmethod
-    def _start_converter(modules : list, classes : list):
-        if _ConvertManager.init != False: return ExCode.StartFail
+    def _emit(hooks : tuple, stage : str, uuid : str, body_type : str, size : int, start_ns : int, end_ns : int = None):
+        event = None
+        for hook in hooks:
+            if stage not in hook.stages: continue
+            if event == None: event = _TraceEvent(stage, uuid, body_type, size, start_ns, time.time_ns() if end_ns == None else end_ns)
+            try: hook.callback(event)
+            except Exception: pass
+
+
+class _Converter:
+    def __init__(self):
+        self.init = False
+        self.classes = []
+        self.registry = None
+        self.codec = None
+
+    def _start_converter(self, modules : list, classes : list, codec : str = "json"):
+        if self.init != False: return ExCode.StartFail
+        if codec not in _CODECS: return ExCode.StartFail
         netobj_list = []
         for mod in modules:
             for objcls in dir(mod):
@@ -89,47 +743,541 @@ class _ConvertManager(object):
                     netobj_list.append(getattr(mod, objcls))
         for objcls in classes:
             netobj_list.append(objcls)
-        _ConvertManager.classes = netobj_list
-        _ConvertManager.init = True
+        self.classes = netobj_list
+        self.registry = _ClassRegistry(netobj_list)
+        self.codec = _CODECS[codec]
+        self.init = True
         return ExCode.Success
 
-    @staticmethod
-    def _generate_net_message(netobj, fields_to_ignore : list, uuid : str):
-        if not _ConvertManager.init: return None, ExCode.StartFail
-        new_network_message = _NetMessage(_ConvertManager.classes, netobj, fields_to_ignore, uuid)
+    def _generate_net_message(self, netobj, fields_to_ignore : list, uuid : str, deltas = None, key : str = None, head : dict = None):
+        if not self.init: return None, ExCode.StartFail
+        started = time.perf_counter_ns() if _StatsManager.enabled == True else None
+        new_network_message = _NetMessage(self.registry, netobj, fields_to_ignore, uuid, codec=self.codec,
+                                          deltas=deltas, key=key, head=head)
+        if started != None: _StatsManager._converted("encode", new_network_message.create_code, started)
         return new_network_message, new_network_message.create_code
 
-    @staticmethod
-    def _load_net_message_from_str(messtr : str, fields_to_ignore : list):
-        if not _ConvertManager.init: return None, ExCode.StartFail
-        old_network_message = _NetMessage(_ConvertManager.classes, messtr, fields_to_ignore)
+    def _generate_stream(self, netobj, fields_to_ignore : list, chunk_bytes : int, encoding : str):
+        if not self.init: return None, ExCode.StartFail
+        if type(netobj) not in self.registry.by_type: return None, ExCode.BadData
+        objdict, excode = _NetMessage._netobj_to_dict(self.registry, netobj, fields_to_ignore)
+        if excode != ExCode.Success: return None, excode
+        chunk_bytes = StartValues.StreamChunkBytes if chunk_bytes == None else chunk_bytes
+        return _StreamEncoder(self.registry, objdict, ud.uuid4().hex[:20], self.codec, encoding, chunk_bytes), ExCode.Success
+
+    def _load_stream(self, client, manager, progress, max_bytes : int):
+        if not self.init: return None, ExCode.StartFail
+        if manager.framing != True: return None, ExCode.StartFail
+        max_bytes = StartValues.StreamMaxBytes if max_bytes == None else max_bytes
+        decoder = _StreamDecoder(self.registry, self.codec, manager.encoding, StartValues.DefaultIgnoreFields,
+                                 max_bytes, progress, manager._peer_deltas(client))
+        while True:
+            data, excode = manager._receive_data(client, manager.bytes)
+            if excode != ExCode.Success: return decoder.netmes, excode
+            done, excode = decoder._feed(data)
+            if done == True or excode != ExCode.Success: return decoder.netmes, excode
+
+    def _peek_net_message(self, messtr, fields_to_ignore : list, encoding : str):
+        if not self.init: return None, ExCode.StartFail
+        lazy_network_message = _LazyNetMessage(self.registry, messtr, fields_to_ignore, encoding=encoding, codec=self.codec)
+        return lazy_network_message, lazy_network_message.create_code
+
+    def _load_net_message_from_str(self, messtr, fields_to_ignore : list, encoding : str, deltas = None):
+        if not self.init: return None, ExCode.StartFail
+        started = time.perf_counter_ns() if _StatsManager.enabled == True else None
+        old_network_message = _NetMessage(self.registry, messtr, fields_to_ignore, encoding=encoding, codec=self.codec,
+                                          deltas=deltas)
+        if started != None: _StatsManager._converted("decode", old_network_message.create_code, started)
         return old_network_message, old_network_message.create_code
 
-    @staticmethod
-    def _stop(prepare_mod : bool):
+    def _stop(self, prepare_mod : bool):
         if prepare_mod == True: return ExCode.Success
-        _ConvertManager.classes = []
-        _ConvertManager.init = False
+        self.classes = []
+        self.registry = None
+        self.codec = None
+        self.init = False
         return ExCode.Success
 
-    @staticmethod
-    def _status():
-        return _ConvertManager.init
+    def _status(self):
+        return self.init
+
+_ConvertManager = _Converter()
+
+
+_FRAME_HEADER = struct.Struct("!I")
+_FRAME_COMPRESSED = 0x80000000
+_FRAME_SHARED = 0x40000000
+_FRAME_SIZE = 0x3fffffff
+_SHARED_HEADER = struct.Struct("!Q")
+_SEGMENT_HEADER = 8
+_FDS_BUFFER = socket.CMSG_SPACE(64 * array.array("i").itemsize) if hasattr(socket, "CMSG_SPACE") else 0
+
+def _pack_frame(buffers : list, data : bytes, compressor = None, compress_bytes : int = 0):
+    if compressor != None and len(data) >= compress_bytes:
+        packed = compressor._compress(data)
+        if len(packed) + 1 < len(data) and len(packed) + 1 <= _FRAME_SIZE:
+            buffers.append(_FRAME_HEADER.pack((len(packed) + 1) | _FRAME_COMPRESSED))
+            buffers.append(bytes((compressor.tag,)))
+            buffers.append(packed)
+            return buffers
+    if len(data) > _FRAME_SIZE: return None
+    buffers.append(_FRAME_HEADER.pack(len(data)))
+    buffers.append(data)
+    return buffers
+
+def _unpack_frame(frame, max_size : int):
+    compressor = _COMPRESSOR_TAGS.get(frame[0])
+    if compressor == None: raise ValueError(f"unknown compression {frame[0]}")
+    return compressor._decompress(frame[1:], max_size)
+
+
+class _SharedFrame:
+    __slots__ = ['map', 'view']
+    def __init__(self, fd : int, size : int):
+        try: self.map = mmap.mmap(fd, _SEGMENT_HEADER + size)
+        finally: os.close(fd)
+        self.view = memoryview(self.map)[_SEGMENT_HEADER:_SEGMENT_HEADER + size]
+
+    def __len__(self):
+        return len(self.view)
+
+    def _copy(self):
+        try: return bytes(self.view)
+        finally: self._release()
+
+    def _release(self):
+        if self.map.closed: return
+        self.view.release()
+        self.map[0] = 0
+        self.map.close()
+
+    def __del__(self):
+        try: self._release()
+        except: pass
+
+
+class _SharedSegment:
+    __slots__ = ['fd', 'map', 'capacity']
+    def __init__(self, capacity : int):
+        self.fd = os.memfd_create("oon", os.MFD_CLOEXEC)
+        self.map = None
+        self.capacity = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity : int):
+        capacity = max(capacity, self.capacity * 2)
+        capacity = (capacity + mmap.PAGESIZE - 1) // mmap.PAGESIZE * mmap.PAGESIZE
+        os.ftruncate(self.fd, capacity)
+        if self.map != None: self.map.close()
+        self.map = mmap.mmap(self.fd, capacity)
+        self.capacity = capacity
+
+    def _close(self):
+        self.map.close()
+        os.close(self.fd)
+
+
+class _SharedMemoryPool:
+    def __init__(self, segments : int):
+        self.max_segments = segments
+        self.segments = []
+        self.lock = threading.Lock()
+
+    def _put(self, data : bytes):
+        size = _SEGMENT_HEADER + len(data)
+        with self.lock:
+            free = [segment for segment in self.segments if segment.map[0] == 0]
+            fitting = [segment for segment in free if segment.capacity >= size]
+            try:
+                if len(fitting) > 0: segment = min(fitting, key=lambda segment: segment.capacity)
+                elif len(self.segments) < self.max_segments:
+                    segment = _SharedSegment(size)
+                    self.segments.append(segment)
+                elif len(free) > 0:
+                    segment = max(free, key=lambda segment: segment.capacity)
+                    segment._grow(size)
+                else: return None
+            except OSError: return None
+            segment.map[_SEGMENT_HEADER:size] = data
+            segment.map[0] = 1
+            return segment.fd
+
+    def _free(self, fds : list):
+        with self.lock:
+            for segment in self.segments:
+                if segment.fd in fds: segment.map[0] = 0
+
+    def _close(self):
+        with self.lock:
+            for segment in self.segments:
+                try: segment._close()
+                except: pass
+            self.segments = []
+
+class _FrameBuffer:
+    __slots__ = ['buffer', 'view', 'start', 'end', 'size', 'max_size', 'skip', 'fds']
+    def __init__(self, size : int, max_size : int, fds : bool = False):
+        self.size = max(size, _FRAME_HEADER.size)
+        self.buffer = bytearray(self.size)
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+        self.max_size = min(max_size, _FRAME_SIZE)
+        self.skip = 0
+        self.fds = collections.deque() if fds == True and _FDS_BUFFER > 0 else None
+
+    def _reserve(self, size : int):
+        if len(self.buffer) - self.start >= size: return
+        pending = self.end - self.start
+        if len(self.buffer) >= size:
+            self.buffer[:pending] = bytes(self.view[self.start:self.end])
+        else:
+            new_buffer = bytearray(max(size, len(self.buffer) * 2))
+            new_buffer[:pending] = self.view[self.start:self.end]
+            self.view.release()
+            self.buffer = new_buffer
+            self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = pending
+
+    def _next_frame(self):
+        if self.skip > 0 and self._discard() == False: return None, ExCode.Success
+        pending = self.end - self.start
+        if pending < _FRAME_HEADER.size: return None, ExCode.Success
+        header = _FRAME_HEADER.unpack_from(self.buffer, self.start)[0]
+        size = header & _FRAME_SIZE
+        if size > self.max_size:
+            self.start += _FRAME_HEADER.size
+            self.skip = size
+            self._discard()
+            return None, ExCode.BadData
+        if pending < _FRAME_HEADER.size + size:
+            self._reserve(_FRAME_HEADER.size + size)
+            return None, ExCode.Success
+        frame_start = self.start + _FRAME_HEADER.size
+        if header & _FRAME_SHARED: frame = self._shared_frame(frame_start, size)
+        elif header & _FRAME_COMPRESSED:
+            try: frame = _unpack_frame(self.view[frame_start:frame_start + size], self.max_size)
+            except Exception: frame = None
+        else: frame = bytes(self.view[frame_start:frame_start + size])
+        self.start = frame_start + size
+        if self.start == self.end: self._drained()
+        if frame == None: return None, ExCode.BadData
+        return frame, ExCode.Success
+
+    def _discard(self):
+        dropped = min(self.skip, self.end - self.start)
+        self.skip -= dropped
+        self.start += dropped
+        if self.start == self.end: self._drained()
+        return self.skip == 0
+
+    def _drained(self):
+        self.start = 0
+        self.end = 0
+        if len(self.buffer) == self.size: return
+        self.view.release()
+        self.buffer = bytearray(self.size)
+        self.view = memoryview(self.buffer)
+
+    def _shared_frame(self, frame_start : int, size : int):
+        if self.fds == None or len(self.fds) == 0 or size != _SHARED_HEADER.size: return None
+        fd = self.fds.popleft()
+        shared_size = _SHARED_HEADER.unpack_from(self.buffer, frame_start)[0]
+        if shared_size > self.max_size:
+            os.close(fd)
+            return None
+        try: return _SharedFrame(fd, shared_size)
+        except: return None
+
+    def _close(self):
+        while self.fds:
+            try: os.close(self.fds.popleft())
+            except: pass
+
+    def __del__(self):
+        try: self._close()
+        except: pass
+
+    def _fill(self, sock, bytes : int):
+        bytes = max(bytes, 1)
+        if len(self.buffer) - self.end < bytes: self._reserve(self.end - self.start + bytes)
+        if self.fds == None: received = sock.recv_into(self.view[self.end:])
+        else:
+            received, ancdata, _, _ = sock.recvmsg_into([self.view[self.end:]], _FDS_BUFFER)
+            for level, kind, data in ancdata:
+                if level != socket.SOL_SOCKET or kind != socket.SCM_RIGHTS: continue
+                fds = array.array("i")
+                fds.frombytes(data[:len(data) - len(data) % fds.itemsize])
+                self.fds.extend(fds)
+        self.end += received
+        return received
+
+    def _receive_frame(self, sock, bytes : int):
+        while True:
+            frame, excode = self._next_frame()
+            if excode != ExCode.Success or frame != None: return frame, excode
+            if self._fill(sock, bytes) == 0: return None, ExCode.BadConn
+
+    def _receive_frames(self, sock, bytes : int):
+        frame, excode = self._receive_frame(sock, bytes)
+        if excode != ExCode.Success: return [], excode
+        frames = [frame]
+        while True:
+            frame, excode = self._next_frame()
+            if excode != ExCode.Success or frame == None: return frames, ExCode.Success
+            frames.append(frame)
+
+def _wait_readable(sock, timeout : int):
+    if hasattr(select, "poll"):
+        poller = select.poll()
+        poller.register(sock, select.POLLIN)
+        return len(poller.poll(None if timeout == None else timeout * 1000)) > 0
+    return len(select.select([sock], [], [], timeout)[0]) > 0
+
+def _wait_writable(sock, timeout : int):
+    if hasattr(select, "poll"):
+        poller = select.poll()
+        poller.register(sock, select.POLLOUT)
+        return len(poller.poll(None if timeout == None else timeout * 1000)) > 0
+    return len(select.select([], [sock], [], timeout)[1]) > 0
+
+try: _IOV_MAX = min(os.sysconf("SC_IOV_MAX"), 1024)
+except: _IOV_MAX = 16
+
+def _send_buffers(sock, buffers : list, timeout : int, cork : bool = False, fds : list = None):
+    if not hasattr(sock, "sendmsg"): buffers = [b"".join(buffers)]
+    if cork == True: sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+    try:
+        index = 0
+        while index < len(buffers):
+            try:
+                if fds: sent = sock.sendmsg(buffers[index:index + _IOV_MAX], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))])
+                elif hasattr(sock, "sendmsg"): sent = sock.sendmsg(buffers[index:index + _IOV_MAX])
+                else: sent = sock.send(buffers[index])
+                fds = None
+            except BlockingIOError:
+                if not _wait_writable(sock, timeout): raise socket.timeout("timed out")
+                continue
+            while index < len(buffers) and sent >= len(buffers[index]):
+                sent -= len(buffers[index])
+                index += 1
+            if sent > 0: buffers[index] = memoryview(buffers[index])[sent:]
+    finally:
+        if cork == True: sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+
+
+_SEND_POLICIES = frozenset(["block", "drop_oldest", "drop_newest", "disconnect"])
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
+def _send_some(sock, buffers : list, fds : list = None):
+    if not _wait_writable(sock, 0): return 0
+    try:
+        if fds: return sock.sendmsg(buffers[:_IOV_MAX], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))], _MSG_DONTWAIT)
+        if hasattr(sock, "sendmsg"): return sock.sendmsg(buffers[:_IOV_MAX], [], _MSG_DONTWAIT)
+        return sock.send(buffers[0], _MSG_DONTWAIT)
+    except BlockingIOError: return 0
+
+class _SendQueue:
+    __slots__ = ['entries', 'bytes', 'messages', 'max_bytes', 'max_messages', 'policy', 'dropped', 'peak_bytes', 'writing', 'failed',
+                 'ready', 'shared']
+    def __init__(self, max_bytes : int, max_messages : int, policy : str, lock, shared = None):
+        self.entries = collections.deque()
+        self.bytes = 0
+        self.messages = 0
+        self.max_bytes = max_bytes
+        self.max_messages = max_messages
+        self.policy = policy
+        self.dropped = 0
+        self.peak_bytes = 0
+        self.writing = False
+        self.failed = False
+        self.ready = threading.Condition(lock)
+        self.shared = shared
+
+    def _full(self, size : int, messages : int):
+        if len(self.entries) == 0: return False
+        if self.max_bytes > 0 and self.bytes + size > self.max_bytes: return True
+        return self.max_messages > 0 and self.messages + messages > self.max_messages
+
+    def _drop_oldest(self):
+        index = 1 if self.writing == True else 0
+        if len(self.entries) <= index: return False
+        _, size, messages, fds = self.entries[index]
+        del self.entries[index]
+        self.bytes -= size
+        self.messages -= messages
+        self.dropped += messages
+        self._release(fds)
+        return True
+
+    def _release(self, fds : list):
+        if fds and self.shared != None: self.shared._free(fds)
+
+    def _refuse(self, fds : list, excode : ExCode):
+        self._release(fds)
+        return excode, False
+
+    def _put(self, sock, buffers : list, messages : int, timeout : int, block : bool = True, fds : list = None):
+        size = sum(len(buffer) for buffer in buffers)
+        deadline = time.monotonic() + timeout if timeout != None else None
+        with self.ready:
+            while self.failed != True and self._full(size, messages):
+                if self.policy == "drop_oldest" and self._drop_oldest() == True: continue
+                if self.policy == "disconnect": return self._refuse(fds, ExCode.BadConn)
+                if self.policy != "block" or block != True:
+                    self.dropped += messages
+                    return self._refuse(fds, ExCode.Timeout)
+                remaining = deadline - time.monotonic() if deadline != None else None
+                if remaining != None and remaining <= 0: return self._refuse(fds, ExCode.Timeout)
+                self.ready.wait(remaining)
+            if self.failed == True: return self._refuse(fds, ExCode.BadConn)
+            self.entries.append([buffers, size, messages, fds])
+            self.bytes += size
+            self.messages += messages
+            self.peak_bytes = max(self.peak_bytes, self.bytes)
+            return self._flush(sock)
+
+    def _flush(self, sock):
+        try:
+            while len(self.entries) > 0:
+                entry = self.entries[0]
+                sent = _send_some(sock, entry[0], entry[3])
+                if sent == 0: break
+                entry[3] = None
+                self.bytes -= sent
+                buffers = entry[0]
+                while len(buffers) > 0 and sent >= len(buffers[0]):
+                    sent -= len(buffers.pop(0))
+                if sent > 0: buffers[0] = memoryview(buffers[0])[sent:]
+                self.writing = len(buffers) > 0
+                if self.writing == True: break
+                self.entries.popleft()
+                self.messages -= entry[2]
+                self.ready.notify_all()
+        except OSError:
+            self._abandon()
+            return ExCode.BadConn, False
+        return ExCode.Success, len(self.entries) > 0
+
+    def _drained(self, timeout : int):
+        deadline = time.monotonic() + timeout if timeout != None else None
+        while self.failed != True and len(self.entries) > 0:
+            remaining = deadline - time.monotonic() if deadline != None else None
+            if remaining != None and remaining <= 0: return ExCode.Timeout
+            self.ready.wait(remaining)
+        return ExCode.BadConn if self.failed == True else ExCode.Success
+
+    def _fail(self):
+        with self.ready: self._abandon()
+
+    def _abandon(self):
+        self.failed = True
+        for entry in self.entries: self._release(entry[3])
+        self.entries.clear()
+        self.bytes = 0
+        self.messages = 0
+        self.writing = False
+        self.ready.notify_all()
+
+    def _status(self):
+        with self.ready:
+            return {"messages":self.messages, "bytes":self.bytes, "peak_bytes":self.peak_bytes, "dropped":self.dropped,
+                    "max_messages":self.max_messages, "max_bytes":self.max_bytes, "policy":self.policy}
+
+class _SendPump:
+    def __init__(self, manager):
+        self.manager = manager
+        self.selector = selectors.DefaultSelector()
+        self.lock = threading.Lock()
+        self.waiting = []
+        self.running = False
+        self.thread = None
+        self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+        self.wakeup_reader.setblocking(False)
+        self.wakeup_writer.setblocking(False)
+
+    def _start(self):
+        self.running = True
+        self.selector.register(self.wakeup_reader, selectors.EVENT_READ, None)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _send(self, client, buffers : list, messages : int, block : bool = True, fds : list = None):
+        excode, pending = client.outbox._put(client.socket, buffers, messages, client.timeout, block, fds)
+        if excode == ExCode.BadConn and client.alive == True: self.manager._close_client_connection(client)
+        if pending == True: self._watch(client)
+        return excode
+
+    def _watch(self, client):
+        with self.lock: self.waiting.append(client)
+        try: self.wakeup_writer.send(b"\0")
+        except: pass
+
+    def _run(self):
+        while self.running:
+            with self.lock: waiting, self.waiting = self.waiting, []
+            for client in waiting: self._register(client)
+            for key, events in self.selector.select():
+                if key.data == None:
+                    try:
+                        while self.wakeup_reader.recv(1024): pass
+                    except: pass
+                else: self._flush(key.data)
+        self.selector.close()
+        self.wakeup_reader.close()
+        self.wakeup_writer.close()
+
+    def _register(self, client):
+        try:
+            if client.alive != True: return self.selector.unregister(client.socket)
+            stale_key = self.selector.get_map().get(client.socket.fileno())
+            if stale_key != None:
+                if stale_key.data is client: return
+                self.selector.unregister(stale_key.fileobj)
+            self.selector.register(client.socket, selectors.EVENT_WRITE, client)
+        except (KeyError, ValueError, OSError): pass
+
+    def _flush(self, client):
+        excode, pending = ExCode.BadConn, False
+        if client.alive == True:
+            with client.lock: excode, pending = client.outbox._flush(client.socket)
+        if pending == True: return
+        try: self.selector.unregister(client.socket)
+        except: pass
+        if excode != ExCode.Success and client.alive == True: self.manager._close_client_connection(client)
+
+    def _stop(self):
+        self.running = False
+        try: self.wakeup_writer.send(b"\0")
+        except: pass
+        self.thread.join()
 
 
 class _NetClient:
-    __slots__ = ['alive', 'socket', 'addr', 'port', 'uuid']
+    __slots__ = ['alive', 'socket', 'addr', 'port', 'uuid', 'reader', 'timeout', 'state', 'last_active', 'deltas', 'lock', 'stats', 'outbox',
+                 'owner']
     _count = 0
-    def __init__(self, socket, conn : tuple, uuid : str = ud.uuid4().hex[:20]):
+    def __init__(self, socket, conn : tuple, uuid : str = None):
         self.socket = socket
         self.addr = conn[0]
         self.port = conn[1]
-        self.uuid = uuid
+        self.uuid = uuid if uuid != None else ud.uuid4().hex[:20]
         self.alive = True
+        self.reader = None
+        self.timeout = None
+        self.state = {}
+        self.last_active = time.monotonic()
+        self.deltas = _DeltaState()
+        self.lock = threading.Lock()
+        self.stats = None
+        self.outbox = None
+        self.owner = None
         _NetClient._count += 1
     def set_time_out(self, timeout : int):
         try:
             self.socket.settimeout(timeout)
+            self.timeout = timeout
             return ExCode.Success
         except: return ExCode.BadConn
     def __del__(self):
@@ -137,18 +1285,30 @@ class _NetClient:
         try: self.socket.close()
         except: pass
         _NetClient._count -= 1
+        if self.owner != None: self.owner.clients -= 1
 
 class _UnixClient:
-    __slots__ = ['alive', 'socket', 'uuid']
+    __slots__ = ['alive', 'socket', 'uuid', 'reader', 'timeout', 'state', 'last_active', 'deltas', 'lock', 'stats', 'outbox',
+                 'owner']
     _count = 0
-    def __init__(self, socket, uuid : str = ud.uuid4().hex[:20]):
+    def __init__(self, socket, uuid : str = None):
         self.socket = socket
-        self.uuid = uuid
+        self.uuid = uuid if uuid != None else ud.uuid4().hex[:20]
         self.alive = True
+        self.reader = None
+        self.timeout = None
+        self.state = {}
+        self.last_active = time.monotonic()
+        self.deltas = _DeltaState()
+        self.lock = threading.Lock()
+        self.stats = None
+        self.outbox = None
+        self.owner = None
         _UnixClient._count += 1
     def set_time_out(self, timeout : int):
         try:
             self.socket.settimeout(timeout)
+            self.timeout = timeout
             return ExCode.Success
         except: return ExCode.BadConn
     def __del__(self):
@@ -156,131 +1316,309 @@ class _UnixClient:
         try: self.socket.close()
         except: pass
         _UnixClient._count -= 1
-
-
-class _UnixManager(object):
-    init        =   False
-    server_mode =   False
-    connected   =   False
-    encoding    =   None
-    timeout     =   None
-    queue_size  =   None
-    path        =   None
-    unix_socket =   None
-    
-    @staticmethod
-    def _init_connection(is_server : bool, path : str, encoding : str, timeout : int, queue_size : int):
-        if _UnixManager.init != False: return ExCode.StartFail
+        if self.owner != None: self.owner.clients -= 1
+
+
+class _UnixEndpoint:
+    def __init__(self, converter = None):
+        self.init = False
+        self.server_mode = False
+        self.connected = False
+        self.encoding = None
+        self.timeout = None
+        self.queue_size = None
+        self.path = None
+        self.unix_socket = None
+        self.framing = False
+        self.bytes = None
+        self.max_bytes = None
+        self.workers = 0
+        self.worker_queue_size = None
+        self.reader = None
+        self.serve_loop = None
+        self.prefork = None
+        self.compressor = None
+        self.compress_bytes = 1024
+        self.deltas = None
+        self.send_lock = threading.Lock()
+        self.rpc = None
+        self.stats = _Counters()
+        self.shared = None
+        self.shared_bytes = 0
+        self.queue_bytes = 0
+        self.queue_messages = 0
+        self.queue_policy = "block"
+        self.pump = None
+        self.publish_bytes = 1048576
+        self.topics = {}
+        self.topics_lock = threading.Lock()
+        self.converter = converter
+        self.clients = 0
+
+    def _init_connection(self, is_server : bool, path : str, encoding : str, timeout : int, queue_size : int,
+                         framing : bool = False, bytes : int = 1024, max_bytes : int = 16777216, workers : int = 0,
+                         worker_queue_size : int = 1024, compression : str = None, compress_bytes : int = 1024,
+                         shared_bytes : int = 0, shared_segments : int = 8, queue_bytes : int = 0, queue_messages : int = 0,
+                         queue_policy : str = "block", publish_bytes : int = 1048576):
+        if self.init != False: return ExCode.StartFail
+        if compression != None and compression not in _COMPRESSORS: return ExCode.StartFail
+        if queue_policy not in _SEND_POLICIES: return ExCode.StartFail
+        if shared_bytes > 0 and (not hasattr(os, "memfd_create") or _FDS_BUFFER == 0 or framing != True): return ExCode.StartFail
+        self.compressor = _COMPRESSORS[compression] if compression != None else None
+        self.compress_bytes = compress_bytes
+        self.shared = _SharedMemoryPool(shared_segments) if shared_bytes > 0 else None
+        self.shared_bytes = shared_bytes
         if is_server == True:
-            if _UnixManager._close_unix_socket(path) != ExCode.Success: return ExCode.StartFail
+            if self._close_unix_socket(path) != ExCode.Success: return ExCode.StartFail
             try:
-                _UnixManager.unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                _UnixManager.unix_socket.bind(path)
-                _UnixManager.unix_socket.listen(queue_size)
-                _UnixManager.unix_socket.settimeout(timeout)
+                self.unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.unix_socket.bind(path)
+                self.unix_socket.listen(queue_size)
+                self.unix_socket.settimeout(timeout)
             except:
                 return ExCode.StartFail
         else:
             try:
-                _UnixManager.unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                _UnixManager.unix_socket.settimeout(timeout)
+                self.unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.unix_socket.settimeout(timeout)
             except:
                 return ExCode.StartFail
-        _UnixManager.server_mode = is_server
-        _UnixManager.path = path
-        _UnixManager.encoding = encoding
-        _UnixManager.timeout = timeout
-        _UnixManager.queue_size = queue_size
-        _UnixManager.init = True
+        self.server_mode = is_server
+        self.path = path
+        self.encoding = encoding
+        self.timeout = timeout
+        self.queue_size = queue_size
+        self.framing = framing
+        self.bytes = bytes
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.worker_queue_size = worker_queue_size
+        self.queue_bytes = queue_bytes
+        self.queue_messages = queue_messages
+        self.queue_policy = queue_policy
+        self.publish_bytes = publish_bytes
+        if is_server == True and (queue_bytes > 0 or queue_messages > 0):
+            self.pump = _SendPump(self)
+            self.pump._start()
+        self.init = True
         return ExCode.Success
 
 #### server methods
 
-    @staticmethod
-    def _accept_connection(client_timeout : int):
-        if not _UnixManager.init or _UnixManager.server_mode == False: return None, ExCode.StartFail
+    def _accept_connection(self, client_timeout : int):
+        if not self.init or self.server_mode == False: return None, ExCode.StartFail
         try:
-            client_conn, client_addr = _UnixManager.unix_socket.accept()
+            accepted = time.time_ns() if _TraceManager.active == True else None
+            client_conn, client_addr = self.unix_socket.accept()
             new_client = _UnixClient(client_conn)
+            new_client.owner = self
+            self.clients += 1
             new_client.set_time_out(client_timeout)
+            if _StatsManager.enabled == True: _StatsManager._accepted(self.stats, new_client)
+            if _TraceManager.active == True: _trace_accept(new_client, accepted)
+            if self.framing == True: new_client.reader = _FrameBuffer(self.bytes, self.max_bytes, True)
+            if self.queue_bytes > 0 or self.queue_messages > 0: new_client.outbox = _SendQueue(self.queue_bytes, self.queue_messages,
+                                                                         self.queue_policy, new_client.lock, self.shared)
             return new_client, ExCode.Success
         except socket.timeout:
             return None, ExCode.Timeout
         except:
             return None, ExCode.BadConn
 
-    @staticmethod
-    def _close_client_connection(client : _UnixClient):
-        if not _UnixManager.init or _UnixManager.server_mode == False: return ExCode.StartFail
-        if type(client) != _UnixClient: return ExCode.BadConn
+    def _close_client_connection(self, client : _UnixClient):
+        if not self.init or self.server_mode == False: return ExCode.StartFail
+        if type(client) != _UnixClient or client.owner is not self: return ExCode.BadConn
         if client.alive != True: return ExCode.BadConn
+        if len(self.topics) > 0: _unsubscribe(self, client, None)
+        if client.outbox != None: client.outbox._fail()
         try: client.socket.close()
         except: return ExCode.BadConn
+        if client.reader != None: client.reader._close()
         client.alive = False
         _UnixClient._count -= 1
+        self.clients -= 1
+        if client.outbox != None and self.pump != None: self.pump._watch(client)
+        return ExCode.Success
+
+    def _serve(self, handler, client_timeout : int, lazy : bool = False):
+        if not self.init or self.server_mode == False: return ExCode.StartFail
+        if self.framing != True or self.serve_loop != None: return ExCode.StartFail
+        if self.workers > 0: self.serve_loop = _WorkerServeLoop(self, handler, client_timeout, self.workers, self.worker_queue_size, lazy)
+        else: self.serve_loop = _ServeLoop(self, handler, client_timeout, lazy)
+        try: return self.serve_loop._run()
+        finally: self.serve_loop = None
+
+    def _stop_serving(self):
+        if self.prefork != None: return self._stop_workers()
+        if self.serve_loop == None: return ExCode.BadConn
+        self.serve_loop._stop()
         return ExCode.Success
 
+    def _start_workers(self, handler, client_timeout : int, processes : int):
+        if not self.init or self.server_mode == False: return ExCode.StartFail
+        if self.framing != True or self.serve_loop != None or self.prefork != None: return ExCode.StartFail
+        if processes < 1: return ExCode.StartFail
+        self.prefork = _PreforkServer(self, handler, client_timeout, processes)
+        excode = self.prefork._start()
+        if excode != ExCode.Success: self.prefork = None
+        return excode
+
+    def _stop_workers(self):
+        if self.prefork == None: return ExCode.BadConn
+        excode = self.prefork._stop()
+        self.prefork = None
+        return excode
+
+    def _workers_status(self):
+        if self.prefork == None: return None
+        return self.prefork._status()
+
 #### client methods
 
-    @staticmethod
-    def _connect_to_srv():
-        if not _UnixManager.init or _UnixManager.server_mode == True: return ExCode.StartFail
-        if _UnixManager.connected == True: return ExCode.BadConn
+    def _connect_to_srv(self):
+        if not self.init or self.server_mode == True: return ExCode.StartFail
+        if self.connected == True: return ExCode.BadConn
         try:
-            _UnixManager.unix_socket.connect(_UnixManager.path)
-            _UnixManager.connected = True
+            self.unix_socket.connect(self.path)
+            if self.framing == True: self.reader = _FrameBuffer(self.bytes, self.max_bytes, True)
+            self.deltas = _DeltaState()
+            self.connected = True
             return ExCode.Success
         except socket.timeout:
             return ExCode.Timeout
         except:
             return ExCode.BadConn
 
-    @staticmethod
-    def _disconnect_from_srv():
-        if not _UnixManager.init or _UnixManager.server_mode == True: return ExCode.StartFail
-        if _UnixManager.connected == False: return ExCode.BadConn
-        try: _UnixManager.unix_socket.close()
+    def _disconnect_from_srv(self):
+        if not self.init or self.server_mode == True: return ExCode.StartFail
+        if self.connected == False: return ExCode.BadConn
+        if self.rpc != None: self._stop_rpc()
+        try: self.unix_socket.close()
         except: return ExCode.BadConn
-        _UnixManager.connected = False
+        if self.reader != None: self.reader._close()
+        self.reader = None
+        self.deltas = None
+        self.connected = False
+        return ExCode.Success
+
+    def _start_rpc(self, on_message):
+        if not self.init or self.server_mode == True: return ExCode.StartFail
+        if self.framing != True or self.rpc != None: return ExCode.StartFail
+        if self.connected == False: return ExCode.BadConn
+        self.rpc = _RpcClient(self, on_message)
+        self.rpc._start()
+        return ExCode.Success
+
+    def _stop_rpc(self):
+        if self.rpc == None: return ExCode.StopFail
+        self.rpc._stop()
+        self.rpc = None
         return ExCode.Success
 
 #### shared methods
 
-    @staticmethod
-    def _receive_data(client : _UnixClient, bytes : int):
-        if not _UnixManager.init: return None, ExCode.StartFail
-        if _UnixManager.server_mode == True and client == None: return None, ExCode.BadConn
-        elif _UnixManager.server_mode == False and client != None: return None, ExCode.BadConn
-        if _UnixManager.server_mode == True and type(client) != _UnixClient: return None, ExCode.BadConn
-        if _UnixManager.server_mode == True and client.alive != True: return None, ExCode.BadConn
-        if _UnixManager.server_mode == False and _UnixManager.connected == False: return None, ExCode.BadConn
+    def _peer_deltas(self, client : _UnixClient):
+        if client != None: return client.deltas if type(client) == _UnixClient else None
+        return self.deltas
+
+    def _check_client(self, client : _UnixClient):
+        if not self.init: return ExCode.StartFail
+        if self.server_mode == True and client == None: return ExCode.BadConn
+        elif self.server_mode == False and client != None: return ExCode.BadConn
+        if self.server_mode == True and (type(client) != _UnixClient or client.owner is not self): return ExCode.BadConn
+        if self.server_mode == True and client.alive != True: return ExCode.BadConn
+        if self.server_mode == False and self.connected == False: return ExCode.BadConn
+        return ExCode.Success
+
+    def _receive_data(self, client : _UnixClient, bytes : int):
+        if _StatsManager.enabled != True: return self._read_data(client, bytes)
+        started = time.perf_counter_ns()
+        data, excode = self._read_data(client, bytes)
+        _StatsManager._io(self.stats, client, True, 1, len(data) if data != None else 0, excode, started)
+        return data, excode
+
+    def _read_data(self, client : _UnixClient, bytes : int):
+        excode = self._check_client(client)
+        if excode != ExCode.Success: return None, excode
         try:
-            if client != None: data = client.socket.recv(bytes)
-            else: data = _UnixManager.unix_socket.recv(bytes)
+            if self.framing == True:
+                if client != None: data, excode = client.reader._receive_frame(client.socket, bytes)
+                else: data, excode = self.reader._receive_frame(self.unix_socket, bytes)
+                if excode != ExCode.Success: return None, excode
+            elif client != None: data = client.socket.recv(bytes)
+            else: data = self.unix_socket.recv(bytes)
             if not data: return None, ExCode.BadConn
-            return data.decode(), ExCode.Success
+            return data, ExCode.Success
         except socket.timeout:
             return None, ExCode.Timeout
         except:
             return None, ExCode.BadConn
 
-    @staticmethod
-    def _send_data(client : _UnixClient, data : str = "None"):
-        if not _UnixManager.init: return ExCode.StartFail
-        if _UnixManager.server_mode == True and client == None: return ExCode.BadConn
-        elif _UnixManager.server_mode == False and client != None: return ExCode.BadConn
-        if _UnixManager.server_mode == True and type(client) != _UnixClient: return ExCode.BadConn
-        if _UnixManager.server_mode == True and client.alive != True: return ExCode.BadConn
-        if _UnixManager.server_mode == False and _UnixManager.connected == False: return ExCode.BadConn
+    def _receive_batch(self, client : _UnixClient, bytes : int):
+        if _StatsManager.enabled != True: return self._read_batch(client, bytes)
+        started = time.perf_counter_ns()
+        frames, excode = self._read_batch(client, bytes)
+        _StatsManager._io(self.stats, client, True, len(frames), sum(len(frame) for frame in frames), excode, started)
+        return frames, excode
+
+    def _read_batch(self, client : _UnixClient, bytes : int):
+        excode = self._check_client(client)
+        if excode != ExCode.Success: return [], excode
+        if self.framing != True: return [], ExCode.StartFail
+        try:
+            if client != None: return client.reader._receive_frames(client.socket, bytes)
+            return self.reader._receive_frames(self.unix_socket, bytes)
+        except socket.timeout:
+            return [], ExCode.Timeout
+        except:
+            return [], ExCode.BadConn
+
+    def _send_data(self, client : _UnixClient, data : bytes = b"None", block : bool = True):
+        return self._send_batch(client, [data], block)
+
+    def _send_batch(self, client : _UnixClient, datas : list, block : bool = True):
+        if _StatsManager.enabled != True: return self._write_batch(client, datas, block)
+        started = time.perf_counter_ns()
+        excode = self._write_batch(client, datas, block)
+        _StatsManager._io(self.stats, client, False, len(datas), sum(len(data) for data in datas), excode, started)
+        return excode
+
+    def _write_batch(self, client : _UnixClient, datas : list, block : bool = True):
+        excode = self._check_client(client)
+        if excode != ExCode.Success: return excode
+        buffers = []
+        fds = []
+        shared = self.shared
+        if self.framing == True:
+            for data in datas:
+                fd = None
+                if shared != None and len(data) >= self.shared_bytes: fd = shared._put(data)
+                if fd == None:
+                    if _pack_frame(buffers, data, self.compressor, self.compress_bytes) != None: continue
+                    if len(fds) > 0: shared._free(fds)
+                    return ExCode.BadData
+                buffers.append(_FRAME_HEADER.pack(_SHARED_HEADER.size | _FRAME_SHARED))
+                buffers.append(_SHARED_HEADER.pack(len(data)))
+                fds.append(fd)
+        else: buffers = list(datas)
+        if client != None and client.outbox != None and (block != True or self.queue_bytes > 0 or self.queue_messages > 0):
+            return self.pump._send(client, buffers, len(datas), block, fds)
         try:
-            if client != None: client.socket.send(data.encode(encoding=_UnixManager.encoding))
-            else: _UnixManager.unix_socket.send(data.encode(encoding=_UnixManager.encoding))
+            if client != None:
+                with client.lock:
+                    excode = client.outbox._drained(client.timeout) if client.outbox != None else ExCode.Success
+                    if excode == ExCode.Success: _send_buffers(client.socket, buffers, client.timeout, False, fds)
+                    elif len(fds) > 0: shared._free(fds)
+                return excode
+            else:
+                with self.send_lock: _send_buffers(self.unix_socket, buffers, self.timeout, False, fds)
             return ExCode.Success
         except socket.timeout:
             return ExCode.Timeout
         except:
             return ExCode.BadConn
 
+    @staticmethod
     def _close_unix_socket(sock_path : str):
         try:
             os.unlink(sock_path)
@@ -290,315 +1628,1534 @@ class _UnixManager(object):
                 return ExCode.StopFail
             return ExCode.Success
 
-    @staticmethod
-    def _stop(prepare_mod : bool):
-        if not _UnixManager.init: ExCode.StopFail
-        if _UnixManager.server_mode == True and _UnixClient._count > 0: return ExCode.StopFail
+    def _stop(self, prepare_mod : bool):
+        if not self.init: ExCode.StopFail
+        if self.server_mode == True and self.clients > 0: return ExCode.StopFail
         if prepare_mod == True: return ExCode.Success
+        if self.prefork != None: self._stop_workers()
+        if self.rpc != None: self._stop_rpc()
+        if self.pump != None: self.pump._stop()
+        self.pump = None
+        self.topics = {}
         try:
-            _UnixManager.unix_socket.close()
-            if _UnixManager.server_mode == True: _UnixManager._close_unix_socket(_UnixManager.path)
-            _UnixManager.connected = False
-            _UnixManager.server_mode = False
-            _UnixManager.path = None
-            _UnixManager.encoding = None
-            _UnixManager.timeout = None
-            _UnixManager.queue_size = None
-            _UnixManager.init = False
+            self.unix_socket.close()
+            if self.server_mode == True: self._close_unix_socket(self.path)
+            self.connected = False
+            self.server_mode = False
+            self.path = None
+            self.encoding = None
+            self.timeout = None
+            self.queue_size = None
+            self.framing = False
+            self.bytes = None
+            self.max_bytes = None
+            self.compressor = None
+            self.deltas = None
+            if self.shared != None: self.shared._close()
+            self.shared = None
+            self.workers = 0
+            self.worker_queue_size = None
+            self.reader = None
+            self.init = False
             return ExCode.Success
         except:
             return ExCode.StopFail
 
-    @staticmethod
-    def _status():
-        return _UnixManager.init
-
-    @staticmethod
-    def _connect_status():
-        return _UnixManager.connected
-
-
-
-class _NetManager(object):
-    init        =   False
-    server_mode =   False
-    connected   =   False
-    encoding    =   None
-    timeout     =   None
-    queue_size  =   None
-    ip          =   None
-    port        =   None
-    net_socket  =   None
-
-    @staticmethod
-    def _init_connection(is_server : bool, ip : str, port : int, encoding : str, timeout : int, queue_size : int):
-        if _NetManager.init != False: return ExCode.StartFail
+    def _status(self):
+        return self.init
+
+    def _connect_status(self):
+        return self.connected
+
+_UnixManager = _UnixEndpoint(_ConvertManager)
+
+
+class _NetEndpoint:
+    def __init__(self, converter = None):
+        self.init = False
+        self.server_mode = False
+        self.connected = False
+        self.encoding = None
+        self.timeout = None
+        self.queue_size = None
+        self.ip = None
+        self.port = None
+        self.net_socket = None
+        self.framing = False
+        self.bytes = None
+        self.max_bytes = None
+        self.workers = 0
+        self.worker_queue_size = None
+        self.reader = None
+        self.serve_loop = None
+        self.prefork = None
+        self.nodelay = False
+        self.cork = False
+        self.compressor = None
+        self.compress_bytes = 1024
+        self.deltas = None
+        self.send_lock = threading.Lock()
+        self.rpc = None
+        self.stats = _Counters()
+        self.queue_bytes = 0
+        self.queue_messages = 0
+        self.queue_policy = "block"
+        self.pump = None
+        self.publish_bytes = 1048576
+        self.topics = {}
+        self.topics_lock = threading.Lock()
+        self.converter = converter
+        self.clients = 0
+
+    def _init_connection(self, is_server : bool, ip : str, port : int, encoding : str, timeout : int, queue_size : int,
+                         framing : bool = False, bytes : int = 1024, max_bytes : int = 16777216, workers : int = 0,
+                         worker_queue_size : int = 1024, nodelay : bool = False, cork : bool = False,
+                         compression : str = None, compress_bytes : int = 1024, queue_bytes : int = 0, queue_messages : int = 0,
+                         queue_policy : str = "block", publish_bytes : int = 1048576):
+        if self.init != False: return ExCode.StartFail
+        if compression != None and compression not in _COMPRESSORS: return ExCode.StartFail
+        if queue_policy not in _SEND_POLICIES: return ExCode.StartFail
+        self.compressor = _COMPRESSORS[compression] if compression != None else None
+        self.compress_bytes = compress_bytes
+        self.nodelay = nodelay
+        self.cork = cork and hasattr(socket, "TCP_CORK")
         if is_server == True:
             try:
-                _NetManager.net_socket = socket.socket()
-                _NetManager.net_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                _NetManager.net_socket.bind((ip, port))
-                _NetManager.net_socket.listen(queue_size)
-                _NetManager.net_socket.settimeout(timeout)
+                self.net_socket = socket.socket()
+                self.net_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self._tune_socket(self.net_socket)
+                self.net_socket.bind((ip, port))
+                self.net_socket.listen(queue_size)
+                self.net_socket.settimeout(timeout)
             except:
                 return ExCode.StartFail
         else:
             try:
-                _NetManager.net_socket = socket.socket()
-                _NetManager.net_socket.settimeout(timeout)
+                self.net_socket = socket.socket()
+                self.net_socket.settimeout(timeout)
             except:
                 return ExCode.StartFail
-        _NetManager.server_mode = is_server
-        _NetManager.ip = ip
-        _NetManager.port = port
-        _NetManager.encoding = encoding
-        _NetManager.timeout = timeout
-        _NetManager.queue_size = queue_size
-        _NetManager.init = True
+        self.server_mode = is_server
+        self.ip = ip
+        self.port = port
+        self.encoding = encoding
+        self.timeout = timeout
+        self.queue_size = queue_size
+        self.framing = framing
+        self.bytes = bytes
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.worker_queue_size = worker_queue_size
+        self.queue_bytes = queue_bytes
+        self.queue_messages = queue_messages
+        self.queue_policy = queue_policy
+        self.publish_bytes = publish_bytes
+        if is_server == True and (queue_bytes > 0 or queue_messages > 0):
+            self.pump = _SendPump(self)
+            self.pump._start()
+        self.init = True
         return ExCode.Success
 
 #### server methods
 
-    @staticmethod
-    def _accept_connection(client_timeout : int):
-        if not _NetManager.init or _NetManager.server_mode == False: return None, ExCode.StartFail
+    def _accept_connection(self, client_timeout : int):
+        if not self.init or self.server_mode == False: return None, ExCode.StartFail
         try:
-            client_conn, client_addr = _NetManager.net_socket.accept()
+            accepted = time.time_ns() if _TraceManager.active == True else None
+            client_conn, client_addr = self.net_socket.accept()
             new_client = _NetClient(client_conn, client_addr)
+            new_client.owner = self
+            self.clients += 1
             new_client.set_time_out(client_timeout)
+            if _StatsManager.enabled == True: _StatsManager._accepted(self.stats, new_client)
+            if _TraceManager.active == True: _trace_accept(new_client, accepted)
+            self._tune_socket(client_conn)
+            if self.framing == True: new_client.reader = _FrameBuffer(self.bytes, self.max_bytes)
+            if self.queue_bytes > 0 or self.queue_messages > 0: new_client.outbox = _SendQueue(self.queue_bytes, self.queue_messages,
+                                                                        self.queue_policy, new_client.lock)
             return new_client, ExCode.Success
         except socket.timeout:
             return None, ExCode.Timeout
         except:
             return None, ExCode.BadConn
 
-    @staticmethod
-    def _close_client_connection(client : _NetClient):
-        if not _NetManager.init or _NetManager.server_mode == False: return ExCode.StartFail
-        if type(client) != _NetClient: return ExCode.BadConn
+    def _close_client_connection(self, client : _NetClient):
+        if not self.init or self.server_mode == False: return ExCode.StartFail
+        if type(client) != _NetClient or client.owner is not self: return ExCode.BadConn
         if client.alive != True: return ExCode.BadConn
+        if len(self.topics) > 0: _unsubscribe(self, client, None)
+        if client.outbox != None: client.outbox._fail()
         try: client.socket.close()
         except: return ExCode.BadConn
         client.alive = False
         _NetClient._count -= 1
+        self.clients -= 1
+        if client.outbox != None and self.pump != None: self.pump._watch(client)
+        return ExCode.Success
+
+    def _serve(self, handler, client_timeout : int, lazy : bool = False):
+        if not self.init or self.server_mode == False: return ExCode.StartFail
+        if self.framing != True or self.serve_loop != None: return ExCode.StartFail
+        if self.workers > 0: self.serve_loop = _WorkerServeLoop(self, handler, client_timeout, self.workers, self.worker_queue_size, lazy)
+        else: self.serve_loop = _ServeLoop(self, handler, client_timeout, lazy)
+        try: return self.serve_loop._run()
+        finally: self.serve_loop = None
+
+    def _stop_serving(self):
+        if self.prefork != None: return self._stop_workers()
+        if self.serve_loop == None: return ExCode.BadConn
+        self.serve_loop._stop()
         return ExCode.Success
 
+    def _start_workers(self, handler, client_timeout : int, processes : int):
+        if not self.init or self.server_mode == False: return ExCode.StartFail
+        if self.framing != True or self.serve_loop != None or self.prefork != None: return ExCode.StartFail
+        if processes < 1: return ExCode.StartFail
+        self.prefork = _PreforkServer(self, handler, client_timeout, processes)
+        excode = self.prefork._start()
+        if excode != ExCode.Success: self.prefork = None
+        return excode
+
+    def _stop_workers(self):
+        if self.prefork == None: return ExCode.BadConn
+        excode = self.prefork._stop()
+        self.prefork = None
+        return excode
+
+    def _workers_status(self):
+        if self.prefork == None: return None
+        return self.prefork._status()
+
 #### client methods
 
-    @staticmethod
-    def _connect_to_srv():
-        if not _NetManager.init or _NetManager.server_mode == True: return ExCode.StartFail
-        if _NetManager.connected == True: return ExCode.BadConn
+    def _connect_to_srv(self):
+        if not self.init or self.server_mode == True: return ExCode.StartFail
+        if self.connected == True: return ExCode.BadConn
         try:
-            _NetManager.net_socket = socket.socket()
-            _NetManager.net_socket.settimeout(_NetManager.timeout)
-            _NetManager.net_socket.connect((_NetManager.ip, _NetManager.port))
-            _NetManager.connected = True
+            self.net_socket = socket.socket()
+            self.net_socket.settimeout(self.timeout)
+            self._tune_socket(self.net_socket)
+            self.net_socket.connect((self.ip, self.port))
+            if self.framing == True: self.reader = _FrameBuffer(self.bytes, self.max_bytes)
+            self.deltas = _DeltaState()
+            self.connected = True
             return ExCode.Success
         except socket.timeout:
             return ExCode.Timeout
         except:
             return ExCode.BadConn
 
-    @staticmethod
-    def _disconnect_from_srv():
-        if not _NetManager.init or _NetManager.server_mode == True: return ExCode.StartFail
-        if _NetManager.connected == False: return ExCode.BadConn
+    def _disconnect_from_srv(self):
+        if not self.init or self.server_mode == True: return ExCode.StartFail
+        if self.connected == False: return ExCode.BadConn
+        if self.rpc != None: self._stop_rpc()
         try:
-            _NetManager.net_socket.close()
-            _NetManager.net_socket = None
+            self.net_socket.close()
+            self.net_socket = None
         except: return ExCode.BadConn
-        _NetManager.connected = False
+        self.reader = None
+        self.deltas = None
+        self.connected = False
+        return ExCode.Success
+
+    def _start_rpc(self, on_message):
+        if not self.init or self.server_mode == True: return ExCode.StartFail
+        if self.framing != True or self.rpc != None: return ExCode.StartFail
+        if self.connected == False: return ExCode.BadConn
+        self.rpc = _RpcClient(self, on_message)
+        self.rpc._start()
+        return ExCode.Success
+
+    def _stop_rpc(self):
+        if self.rpc == None: return ExCode.StopFail
+        self.rpc._stop()
+        self.rpc = None
         return ExCode.Success
 
 #### shared methods
 
-    @staticmethod
-    def _receive_data(client : _NetClient, bytes : int):
-        if not _NetManager.init: return None, ExCode.StartFail
-        if _NetManager.server_mode == True and client == None: return None, ExCode.BadConn
-        elif _NetManager.server_mode == False and client != None: return None, ExCode.BadConn
-        if _NetManager.server_mode == True and type(client) != _NetClient: return None, ExCode.BadConn
-        if _NetManager.server_mode == True and client.alive != True: return None, ExCode.BadConn
-        if _NetManager.server_mode == False and _NetManager.connected == False: return None, ExCode.BadConn
+    def _tune_socket(self, sock):
+        if self.nodelay == True: sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _peer_deltas(self, client : _NetClient):
+        if client != None: return client.deltas if type(client) == _NetClient else None
+        return self.deltas
+
+    def _check_client(self, client : _NetClient):
+        if not self.init: return ExCode.StartFail
+        if self.server_mode == True and client == None: return ExCode.BadConn
+        elif self.server_mode == False and client != None: return ExCode.BadConn
+        if self.server_mode == True and (type(client) != _NetClient or client.owner is not self): return ExCode.BadConn
+        if self.server_mode == True and client.alive != True: return ExCode.BadConn
+        if self.server_mode == False and self.connected == False: return ExCode.BadConn
+        return ExCode.Success
+
+    def _receive_data(self, client : _NetClient, bytes : int):
+        if _StatsManager.enabled != True: return self._read_data(client, bytes)
+        started = time.perf_counter_ns()
+        data, excode = self._read_data(client, bytes)
+        _StatsManager._io(self.stats, client, True, 1, len(data) if data != None else 0, excode, started)
+        return data, excode
+
+    def _read_data(self, client : _NetClient, bytes : int):
+        excode = self._check_client(client)
+        if excode != ExCode.Success: return None, excode
         try:
-            if client != None: data = client.socket.recv(bytes)
-            else: data = _NetManager.net_socket.recv(bytes)
+            if self.framing == True:
+                if client != None: data, excode = client.reader._receive_frame(client.socket, bytes)
+                else: data, excode = self.reader._receive_frame(self.net_socket, bytes)
+                if excode != ExCode.Success: return None, excode
+            elif client != None: data = client.socket.recv(bytes)
+            else: data = self.net_socket.recv(bytes)
             if not data: return None, ExCode.BadConn
-            return data.decode(), ExCode.Success
+            return data, ExCode.Success
         except socket.timeout:
             return None, ExCode.Timeout
         except:
             return None, ExCode.BadConn
 
-    @staticmethod
-    def _send_data(client : _NetClient, data : str = "None"):
-        if not _NetManager.init: return ExCode.StartFail
-        if _NetManager.server_mode == True and client == None: return ExCode.BadConn
-        elif _NetManager.server_mode == False and client != None: return ExCode.BadConn
-        if _NetManager.server_mode == True and type(client) != _NetClient: return ExCode.BadConn
-        if _NetManager.server_mode == True and client.alive != True: return ExCode.BadConn
-        if _NetManager.server_mode == False and _NetManager.connected == False: return ExCode.BadConn
+    def _receive_batch(self, client : _NetClient, bytes : int):
+        if _StatsManager.enabled != True: return self._read_batch(client, bytes)
+        started = time.perf_counter_ns()
+        frames, excode = self._read_batch(client, bytes)
+        _StatsManager._io(self.stats, client, True, len(frames), sum(len(frame) for frame in frames), excode, started)
+        return frames, excode
+
+    def _read_batch(self, client : _NetClient, bytes : int):
+        excode = self._check_client(client)
+        if excode != ExCode.Success: return [], excode
+        if self.framing != True: return [], ExCode.StartFail
         try:
-            if client != None: client.socket.send(data.encode(encoding=_NetManager.encoding))
-            else: _NetManager.net_socket.send(data.encode(encoding=_NetManager.encoding))
+            if client != None: return client.reader._receive_frames(client.socket, bytes)
+            return self.reader._receive_frames(self.net_socket, bytes)
+        except socket.timeout:
+            return [], ExCode.Timeout
+        except:
+            return [], ExCode.BadConn
+
+    def _send_data(self, client : _NetClient, data : bytes = b"None", block : bool = True):
+        return self._send_batch(client, [data], block)
+
+    def _send_batch(self, client : _NetClient, datas : list, block : bool = True):
+        if _StatsManager.enabled != True: return self._write_batch(client, datas, block)
+        started = time.perf_counter_ns()
+        excode = self._write_batch(client, datas, block)
+        _StatsManager._io(self.stats, client, False, len(datas), sum(len(data) for data in datas), excode, started)
+        return excode
+
+    def _write_batch(self, client : _NetClient, datas : list, block : bool = True):
+        excode = self._check_client(client)
+        if excode != ExCode.Success: return excode
+        if self.framing == True:
+            buffers = []
+            for data in datas:
+                if _pack_frame(buffers, data, self.compressor, self.compress_bytes) == None: return ExCode.BadData
+        else: buffers = list(datas)
+        if client != None and client.outbox != None and (block != True or self.queue_bytes > 0 or self.queue_messages > 0):
+            return self.pump._send(client, buffers, len(datas), block)
+        try:
+            if client != None:
+                with client.lock:
+                    excode = client.outbox._drained(client.timeout) if client.outbox != None else ExCode.Success
+                    if excode == ExCode.Success: _send_buffers(client.socket, buffers, client.timeout, self.cork)
+                return excode
+            else:
+                with self.send_lock: _send_buffers(self.net_socket, buffers, self.timeout, self.cork)
             return ExCode.Success
         except socket.timeout:
             return ExCode.Timeout
         except:
             return ExCode.BadConn
 
-    @staticmethod
-    def _stop(prepare_mod : bool):
-        if not _NetManager.init: ExCode.StopFail
-        if _NetManager.server_mode == True and _NetClient._count > 0: return ExCode.StopFail
+    def _stop(self, prepare_mod : bool):
+        if not self.init: ExCode.StopFail
+        if self.server_mode == True and self.clients > 0: return ExCode.StopFail
         if prepare_mod == True: return ExCode.Success
+        if self.prefork != None: self._stop_workers()
+        if self.rpc != None: self._stop_rpc()
+        if self.pump != None: self.pump._stop()
+        self.pump = None
+        self.topics = {}
         try:
-            _NetManager.net_socket.close()
-            _NetManager.connected = False
-            _NetManager.server_mode = False
-            _NetManager.ip = None
-            _NetManager.port = None
-            _NetManager.encoding = None
-            _NetManager.timeout = None
-            _NetManager.queue_size = None
-            _NetManager.init = False
+            if self.net_socket != None: self.net_socket.close()
+            self.connected = False
+            self.server_mode = False
+            self.ip = None
+            self.port = None
+            self.encoding = None
+            self.timeout = None
+            self.queue_size = None
+            self.framing = False
+            self.bytes = None
+            self.max_bytes = None
+            self.nodelay = False
+            self.cork = False
+            self.compressor = None
+            self.deltas = None
+            self.workers = 0
+            self.worker_queue_size = None
+            self.reader = None
+            self.init = False
             return ExCode.Success
         except:
             return ExCode.StopFail
 
-    @staticmethod
-    def _status():
-        return _NetManager.init
+    def _status(self):
+        return self.init
 
-    @staticmethod
-    def _connect_status():
-        return _NetManager.connected
+    def _connect_status(self):
+        return self.connected
+
+_NetManager = _NetEndpoint(_ConvertManager)
 
 
+class _ServeLoop:
+    def __init__(self, manager, handler, client_timeout : int, lazy : bool = False):
+        self.manager = manager
+        self.handler = handler
+        self.client_timeout = client_timeout
+        self.lazy = lazy
+        self.selector = None
+        self.running = False
+        self.listen_socket = manager.net_socket if isinstance(manager, _NetEndpoint) else manager.unix_socket
+        self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+        self.wakeup_reader.setblocking(False)
+        self.wakeup_writer.setblocking(False)
+
+    def _run(self):
+        self.selector = selectors.DefaultSelector()
+        listen_timeout = self.listen_socket.gettimeout()
+        self.running = True
+        try:
+            self.listen_socket.setblocking(False)
+            self.selector.register(self.listen_socket, selectors.EVENT_READ, None)
+            self.selector.register(self.wakeup_reader, selectors.EVENT_READ, self)
+            while self.running:
+                for key, events in self.selector.select():
+                    if key.data == None: self._accept()
+                    elif key.data is self: self._drain_wakeup()
+                    else: self._read(key.data)
+            return ExCode.Success
+        except Exception:
+            return ExCode.BadConn
+        finally:
+            self.running = False
+            self._close()
+            try: self.listen_socket.settimeout(listen_timeout)
+            except: pass
+
+    def _stop(self):
+        self.running = False
+        try: self.wakeup_writer.send(b"\0")
+        except: pass
 
+    def _drain_wakeup(self):
+        try:
+            while self.wakeup_reader.recv(1024): pass
+        except: pass
 
+    def _accept(self):
+        for _ in range(64):
+            client, excode = self.manager._accept_connection(self.client_timeout)
+            if excode != ExCode.Success: return
+            try:
+                client.socket.setblocking(False)
+                _outbox(self.manager, client)
+                self._watch(client)
+            except: self.manager._close_client_connection(client)
+
+    def _watch(self, client):
+        stale_key = self.selector.get_map().get(client.socket.fileno())
+        if stale_key != None: self.selector.unregister(stale_key.fileobj)
+        self.selector.register(client.socket, selectors.EVENT_READ, client)
+
+    def _forget(self, client):
+        try: self.selector.unregister(client.socket)
+        except: pass
 
-class _NetMessage:
-    __slots__ = ['create_code', 'json_string', 'netobj', 'uuid']
-    def __init__(self, classes : list, body, fields_to_ignore : list, uuid : str = ud.uuid4().hex[:20]):
-        final_netobj = None
-        final_json_string = json.dumps({"head":{"uuid":uuid}, "body":{}})
-        final_uuid = uuid
-        final_create_code = ExCode.Success
-        if type(body) == str:
-            final_json_string = body
-            if _NetMessage._check_net_mes_str(final_json_string) != ExCode.Success:
-                final_create_code = ExCode.BadData
+    def _read(self, client):
+        if client.alive != True: return self._forget(client)
+        try: received = client.reader._fill(client.socket, self.manager.bytes)
+        except BlockingIOError: return
+        except: received = 0
+        if received == 0: return self._drop(client, ExCode.BadConn)
+        client.last_active = time.monotonic()
+        while client.alive == True:
+            frame, excode = client.reader._next_frame()
+            if _StatsManager.enabled == True and (frame != None or excode != ExCode.Success):
+                _StatsManager._io(self.manager.stats, client, True, 1, len(frame) if frame != None else 0, excode)
+            if excode != ExCode.Success: return self._drop(client, excode)
+            if frame == None: return
+            self._dispatch(client, frame)
+        self._forget(client)
+
+    def _dispatch(self, client, frame : bytes):
+        self._handle(client, frame, ExCode.Success)
+
+    def _handle(self, client, frame : bytes, excode : ExCode):
+        if frame == None:
+            try: self.handler(client, None, excode)
+            except Exception: pass
+            return
+        converter = self.manager.converter
+        try:
+            if self.lazy == True: netmes, excode = converter._peek_net_message(frame, StartValues.DefaultIgnoreFields, self.manager.encoding)
+            else: netmes, excode = converter._load_net_message_from_str(frame, StartValues.DefaultIgnoreFields, self.manager.encoding,
+                                                                        client.deltas)
+            reply = self.handler(client, netmes, excode)
+            if reply == None or client.alive != True: return
+            if not isinstance(reply, _NetMessage): reply, excode = converter._generate_net_message(reply, StartValues.DefaultIgnoreFields, None)
+            if reply == None or reply.create_code != ExCode.Success: return
+            _send_message(self.manager, client, reply, False)
+        except Exception: return self._fail(client)
+
+    def _fail(self, client):
+        self._drop(client, ExCode.BadData, notify=False)
+
+    def _drop(self, client, excode : ExCode, notify : bool = True):
+        self._forget(client)
+        if client.alive != True: return
+        self.manager._close_client_connection(client)
+        if notify == True: self._dispatch_drop(client, excode)
+
+    def _dispatch_drop(self, client, excode : ExCode):
+        self._handle(client, None, excode)
+
+    def _close(self):
+        for key in list(self.selector.get_map().values()):
+            if key.data == None or key.data is self: continue
+            self._drop(key.data, ExCode.BadConn)
+        self.selector.close()
+        self.wakeup_reader.close()
+        self.wakeup_writer.close()
+
+
+class _WorkerServeLoop(_ServeLoop):
+    def __init__(self, manager, handler, client_timeout : int, workers : int, queue_size : int, lazy : bool = False):
+        _ServeLoop.__init__(self, manager, handler, client_timeout, lazy)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        self.slots = threading.Semaphore(max(queue_size, 1))
+        self.lock = threading.Lock()
+        self.queues = {}
+
+    def _dispatch(self, client, frame : bytes):
+        self._enqueue(client, frame, ExCode.Success)
+
+    def _dispatch_drop(self, client, excode : ExCode):
+        self._enqueue(client, None, excode)
+
+    def _enqueue(self, client, frame : bytes, excode : ExCode):
+        self.slots.acquire()
+        with self.lock:
+            queue = self.queues.get(client)
+            if queue != None: return queue.append((frame, excode))
+            self.queues[client] = collections.deque([(frame, excode)])
+        self.executor.submit(self._work, client)
+
+    def _work(self, client):
+        while True:
+            with self.lock:
+                queue = self.queues[client]
+                if len(queue) == 0:
+                    del self.queues[client]
+                    return
+                frame, excode = queue.popleft()
+            try:
+                if frame == None or client.alive == True: self._handle(client, frame, excode)
+            finally: self.slots.release()
+
+    def _fail(self, client):
+        self.manager._close_client_connection(client)
+
+    def _close(self):
+        _ServeLoop._close(self)
+        self.executor.shutdown(wait=True)
+
+
+class _PreforkServer:
+    def __init__(self, manager, handler, client_timeout : int, processes : int):
+        self.manager = manager
+        self.handler = handler
+        self.client_timeout = client_timeout
+        self.processes = processes
+        self.context = multiprocessing.get_context("fork")
+        self.workers = []
+        self.restarts = 0
+        self.running = False
+        self.monitor = None
+
+    def _start(self):
+        if isinstance(self.manager, _NetEndpoint):
+            if not hasattr(socket, "SO_REUSEPORT"): return ExCode.StartFail
+            try:
+                self.manager.net_socket.close()
+                self.manager.net_socket = None
+            except: return ExCode.StartFail
+        self.running = True
+        try:
+            for _ in range(self.processes): self.workers.append(self._spawn())
+        except:
+            self._stop()
+            return ExCode.StartFail
+        self.monitor = threading.Thread(target=self._watch, daemon=True)
+        self.monitor.start()
+        return ExCode.Success
+
+    def _spawn(self):
+        listen_socket = self._listen() if isinstance(self.manager, _NetEndpoint) else None
+        try:
+            worker = self.context.Process(target=self._work, args=(listen_socket,), daemon=True)
+            worker.start()
+        finally:
+            if listen_socket != None: listen_socket.close()
+        return worker
+
+    def _listen(self):
+        listen_socket = socket.socket()
+        try:
+            listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.manager._tune_socket(listen_socket)
+            listen_socket.bind((self.manager.ip, self.manager.port))
+            listen_socket.listen(self.manager.queue_size)
+            listen_socket.settimeout(self.manager.timeout)
+            return listen_socket
+        except:
+            listen_socket.close()
+            raise
+
+    def _work(self, listen_socket):
+        self.manager.prefork = None
+        if listen_socket != None: self.manager.net_socket = listen_socket
+        elif self.manager.shared != None: self.manager.shared = _SharedMemoryPool(self.manager.shared.max_segments)
+        if self.manager.pump != None:
+            self.manager.pump = _SendPump(self.manager)
+            self.manager.pump._start()
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.manager._stop_serving())
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        if self.manager._serve(self.handler, self.client_timeout) != ExCode.Success: os._exit(1)
+
+    def _watch(self):
+        while self.running:
+            sentinels = [worker.sentinel for worker in self.workers]
+            multiprocessing.connection.wait(sentinels, timeout=0.5)
+            for index, worker in enumerate(self.workers):
+                if worker.is_alive() or not self.running: continue
+                worker.join()
+                try: self.workers[index] = self._spawn()
+                except: time.sleep(0.5)
+                self.restarts += 1
+
+    def _stop(self):
+        self.running = False
+        if self.monitor != None: self.monitor.join()
+        for worker in self.workers:
+            if worker.is_alive(): worker.terminate()
+        excode = ExCode.Success
+        for worker in self.workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.kill()
+                worker.join()
+                excode = ExCode.StopFail
+        self.workers = []
+        return excode
+
+    def _status(self):
+        alive = len([worker for worker in self.workers if worker.is_alive()])
+        return {"processes":self.processes, "alive":alive, "restarts":self.restarts, "pids":[worker.pid for worker in self.workers]}
+
+
+class _PoolConnection:
+    __slots__ = ['socket', 'addr', 'port', 'reader', 'timeout', 'alive', 'leased', 'failures', 'retry_at']
+    def __init__(self, addr : str, port : int, timeout : int):
+        self.socket = None
+        self.addr = addr
+        self.port = port
+        self.reader = None
+        self.timeout = timeout
+        self.alive = False
+        self.leased = False
+        self.failures = 0
+        self.retry_at = 0
+
+
+class _NetPool:
+    def __init__(self, endpoints : list, connections : int, balance : str, timeout : int, encoding : str,
+                 bytes : int, max_bytes : int, nodelay : bool, backoff : float, max_backoff : float,
+                 compressor = None, compress_bytes : int = 1024):
+        self.connections = [_PoolConnection(ip, port, timeout) for _ in range(connections) for ip, port in endpoints]
+        self.balance = balance
+        self.encoding = encoding
+        self.bytes = bytes
+        self.max_bytes = max_bytes
+        self.nodelay = nodelay
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.compressor = compressor
+        self.compress_bytes = compress_bytes
+        self.lock = threading.Condition()
+        self.stopped = threading.Event()
+        self.next = 0
+        self.running = False
+        self.monitor = None
+
+    def _start(self):
+        self.running = True
+        for conn in self.connections: self._connect(conn)
+        self.monitor = threading.Thread(target=self._watch, daemon=True)
+        self.monitor.start()
+        if True not in [conn.alive for conn in self.connections]: return ExCode.BadConn
+        return ExCode.Success
+
+    def _connect(self, conn : _PoolConnection):
+        try:
+            sock = socket.create_connection((conn.addr, conn.port), timeout=conn.timeout)
+            sock.settimeout(conn.timeout)
+            if self.nodelay == True: sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except:
+            conn.failures += 1
+            conn.retry_at = time.monotonic() + min(self.backoff * 2 ** (conn.failures - 1), self.max_backoff)
+            return False
+        with self.lock:
+            conn.socket = sock
+            conn.reader = _FrameBuffer(self.bytes, self.max_bytes)
+            conn.failures = 0
+            conn.alive = True
+            self.lock.notify_all()
+        return True
+
+    def _watch(self):
+        while self.running:
+            now = time.monotonic()
+            with self.lock: dead = [conn for conn in self.connections if not conn.alive and not conn.leased and conn.retry_at <= now]
+            for conn in dead:
+                if self.running: self._connect(conn)
+            self.stopped.wait(0.05)
+
+    def _pick(self):
+        if self.balance == "least_in_flight":
+            leased = {}
+            for conn in self.connections:
+                if conn.leased: leased[(conn.addr, conn.port)] = leased.get((conn.addr, conn.port), 0) + 1
+            idle = [conn for conn in self.connections if conn.alive and not conn.leased]
+            if len(idle) == 0: return None
+            return min(idle, key=lambda conn: leased.get((conn.addr, conn.port), 0))
+        count = len(self.connections)
+        for step in range(count):
+            conn = self.connections[(self.next + step) % count]
+            if conn.alive and not conn.leased:
+                self.next = (self.next + step + 1) % count
+                return conn
+        return None
+
+    def _lease(self, timeout : int):
+        deadline = None if timeout == None else time.monotonic() + timeout
+        with self.lock:
+            while True:
+                if self.running != True: return None, ExCode.BadConn
+                conn = self._pick()
+                if conn != None:
+                    conn.leased = True
+                    return conn, ExCode.Success
+                remaining = None if deadline == None else deadline - time.monotonic()
+                if remaining != None and remaining <= 0: return None, ExCode.Timeout
+                self.lock.wait(remaining)
+
+    def _release(self, conn : _PoolConnection):
+        with self.lock:
+            if conn not in self.connections or conn.leased != True: return ExCode.BadConn
+            conn.leased = False
+            self.lock.notify_all()
+        return ExCode.Success
+
+    def _drop(self, conn : _PoolConnection):
+        with self.lock:
+            conn.alive = False
+            conn.retry_at = time.monotonic()
+        try: conn.socket.close()
+        except: pass
+
+    def _send(self, conn : _PoolConnection, data : bytes):
+        if conn.alive != True: return ExCode.BadConn
+        buffers = _pack_frame([], data, self.compressor, self.compress_bytes)
+        if buffers == None: return ExCode.BadData
+        try:
+            _send_buffers(conn.socket, buffers, conn.timeout)
+            return ExCode.Success
+        except socket.timeout:
+            self._drop(conn)
+            return ExCode.Timeout
+        except:
+            self._drop(conn)
+            return ExCode.BadConn
+
+    def _receive(self, conn : _PoolConnection, bytes : int):
+        if conn.alive != True: return None, ExCode.BadConn
+        try:
+            data, excode = conn.reader._receive_frame(conn.socket, bytes)
+        except socket.timeout:
+            return None, ExCode.Timeout
+        except:
+            data, excode = None, ExCode.BadConn
+        if excode == ExCode.BadConn: self._drop(conn)
+        return data, excode
+
+    def _stop(self):
+        if self.running != True: return ExCode.StopFail
+        with self.lock:
+            self.running = False
+            self.lock.notify_all()
+        self.stopped.set()
+        self.monitor.join()
+        for conn in self.connections:
+            conn.alive = False
+            try: conn.socket.close()
+            except: pass
+        return ExCode.Success
+
+    def _status(self):
+        with self.lock:
+            alive = len([conn for conn in self.connections if conn.alive])
+            leased = len([conn for conn in self.connections if conn.leased])
+        return {"connections":len(self.connections), "alive":alive, "leased":leased}
+
+
+class _RpcClient:
+    def __init__(self, manager, on_message):
+        self.manager = manager
+        self.on_message = on_message
+        self.socket = manager.net_socket if isinstance(manager, _NetEndpoint) else manager.unix_socket
+        self.pending = {}
+        self.deadlines = []
+        self.lock = threading.Condition()
+        self.running = False
+        self.reader = None
+        self.sweeper = None
+
+    def _start(self):
+        self.running = True
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.sweeper = threading.Thread(target=self._sweep, daemon=True)
+        self.reader.start()
+        self.sweeper.start()
+
+    def _call(self, netobj, timeout : int):
+        uuid = ud.uuid4().hex[:20]
+        netmessage, excode = self.manager.converter._generate_net_message(netobj, StartValues.DefaultIgnoreFields, uuid)
+        if excode != ExCode.Success: return None, excode
+        future = concurrent.futures.Future()
+        with self.lock:
+            if self.running != True: return None, ExCode.BadConn
+            self.pending[uuid] = future
+            if timeout != None:
+                heapq.heappush(self.deadlines, (time.monotonic() + timeout, uuid))
+                self.lock.notify()
+        sendcode = _send_message(self.manager, None, netmessage)
+        if sendcode != ExCode.Success:
+            with self.lock: self.pending.pop(uuid, None)
+            return None, sendcode
+        return future, ExCode.Success
+
+    def _resolve(self, uuid : str, netmessage, excode : ExCode):
+        with self.lock: future = self.pending.pop(uuid, None)
+        if future == None: return
+        try: future.set_result((netmessage, excode))
+        except concurrent.futures.InvalidStateError: pass
+
+    def _read(self):
+        reader = self.manager.reader
+        while self.running:
+            if reader.start == reader.end and not _wait_readable(self.socket, 0.1): continue
+            data, excode = self.manager._receive_data(None, self.manager.bytes)
+            if excode == ExCode.Timeout: continue
+            if excode != ExCode.Success: break
+            netmessage, excode = self.manager.converter._peek_net_message(data, StartValues.DefaultIgnoreFields, self.manager.encoding)
+            if excode != ExCode.Success: continue
+            reply_to = netmessage.head.get("reply")
+            if reply_to == None:
+                if self.on_message == None: continue
+                try: self.on_message(netmessage)
+                except Exception: pass
+            elif "error" in netmessage.head: self._resolve(reply_to, netmessage, ExCode.BadData)
             else:
-                mesdict = json.loads(final_json_string)
-                final_uuid = mesdict["head"]["uuid"]
-                final_netobj, final_create_code =  _NetMessage._netobj_from_dict(classes, mesdict["body"], fields_to_ignore)
-        elif type(body) in classes or body == None:
-            final_netobj = body
-            objdict, final_create_code = _NetMessage._netobj_to_dict(classes, body, fields_to_ignore)
-            mesdict = {"head":{"uuid":uuid}, "body":objdict}
-            if _NetMessage._check_net_mes_dict(mesdict) != ExCode.Success:
-                final_create_code = ExCode.BadData
+                if netmessage.body_type == None: netmessage.netobj = None
+                self._resolve(reply_to, netmessage, ExCode.Success)
+        self._fail(ExCode.BadConn)
+
+    def _sweep(self):
+        with self.lock:
+            while self.running:
+                now = time.monotonic()
+                while len(self.deadlines) > 0 and self.deadlines[0][0] <= now:
+                    _, uuid = heapq.heappop(self.deadlines)
+                    future = self.pending.pop(uuid, None)
+                    if future != None and not future.done(): future.set_result((None, ExCode.Timeout))
+                self.lock.wait(self.deadlines[0][0] - now if len(self.deadlines) > 0 else None)
+
+    def _fail(self, excode : ExCode):
+        with self.lock:
+            self.running = False
+            pending = self.pending
+            self.pending = {}
+            self.deadlines = []
+            self.lock.notify_all()
+        for future in pending.values():
+            try: future.set_result((None, excode))
+            except concurrent.futures.InvalidStateError: pass
+
+    def _stop(self):
+        self._fail(ExCode.BadConn)
+        if self.reader != threading.current_thread(): self.reader.join()
+        self.sweeper.join()
+
+
+_COLLECTION_TYPES = frozenset([list, tuple, dict])
+_COLUMNS_MIN = 8
+
+class _GraphEncoder:
+    __slots__ = ['registry', 'fields_to_ignore', 'nodes', 'dicts', 'depths', 'positions', 'links', 'lists', 'shared', 'deep']
+    def __init__(self, registry : _ClassRegistry, fields_to_ignore : list):
+        self.registry = registry
+        self.fields_to_ignore = fields_to_ignore
+        self.nodes = []
+        self.dicts = []
+        self.depths = []
+        self.positions = {}
+        self.links = []
+        self.lists = []
+        self.shared = False
+        self.deep = False
+
+    def _encode(self, netobj, plan : _ClassPlan):
+        stack = [self._node(netobj, plan, 0)]
+        while stack:
+            position = stack.pop()
+            netobj = self.nodes[position]
+            objdict = self.dicts[position]
+            for field in self.registry.by_type[type(netobj)]._object_fields(netobj):
+                if self.fields_to_ignore and field in self.fields_to_ignore: continue
+                try: field_value = getattr(netobj, field)
+                except: return self.dicts[0], ExCode.BadData
+                if type(field_value) in _PLAIN_TYPES:
+                    objdict[field] = field_value
+                    continue
+                if callable(field_value): continue
+                excode = self._value(objdict, field, field_value, position, stack)
+                if excode != ExCode.Success: return self.dicts[0], excode
+        if self.shared or self.deep:
+            for container, key, child in self.links: container[key] = {"__ref":child}
+            return {"type":self.dicts[0]["type"], "__graph":self.dicts}, ExCode.Success
+        for container, key, child in self.links: container[key] = self.dicts[child]
+        for wrapper in self.lists: _GraphEncoder._to_columns(wrapper)
+        return self.dicts[0], ExCode.Success
+
+    def _node(self, netobj, plan : _ClassPlan, depth : int):
+        position = len(self.nodes)
+        self.positions[id(netobj)] = position
+        self.nodes.append(netobj)
+        self.dicts.append({"type":plan.name})
+        self.depths.append(depth)
+        if depth > _GRAPH_DEPTH: self.deep = True
+        return position
+
+    def _value(self, container, key, value, position : int, stack : list):
+        plan = self.registry.by_type.get(type(value))
+        if plan == None:
+            if isinstance(value, enum.Enum): return ExCode.BadData
+            if type(value) == dict or type(value) in _COLLECTION_TYPES and self._holds_objects(value):
+                return self._collection(container, key, value, position, stack)
+            container[key] = value
+        elif plan.is_enum: container[key] = {"type":plan.name, "value":value.value}
+        else:
+            child = self.positions.get(id(value))
+            if child != None: self.shared = True
             else:
-                final_json_string = json.dumps({"head":{"uuid":uuid}, "body":objdict})
+                child = self._node(value, plan, self.depths[position] + 1)
+                stack.append(child)
+            container[key] = None
+            self.links.append((container, key, child))
+        return ExCode.Success
+
+    def _holds_objects(self, value):
+        for item in (value.values() if type(value) == dict else value):
+            if type(item) in _PLAIN_TYPES: continue
+            if type(item) in self.registry.by_type: return True
+            if type(item) in _COLLECTION_TYPES and self._holds_objects(item): return True
+        return False
+
+    def _collection(self, container, key, value, position : int, stack : list):
+        if type(value) == dict:
+            items = {}
+            container[key] = {"__dict":items}
+            pairs = value.items()
         else:
-            final_create_code = ExCode.BadData
-        self.uuid = final_uuid
-        self.json_string = final_json_string
-        self.netobj = final_netobj
-        self.create_code = final_create_code
+            items = [None] * len(value)
+            container[key] = {"__list":items}
+            pairs = enumerate(value)
+            if len(items) >= _COLUMNS_MIN: self.lists.append(container[key])
+        for item_key, item in pairs:
+            if type(item_key) != str and type(items) == dict: return ExCode.BadData
+            if type(item) in _PLAIN_TYPES:
+                items[item_key] = item
+                continue
+            excode = self._value(items, item_key, item, position, stack)
+            if excode != ExCode.Success: return excode
+        return ExCode.Success
 
     @staticmethod
-    def _check_net_mes_str(messtr):
-        head_fields = ["uuid"]
-        try: mesdict = json.loads(messtr)
+    def _to_columns(wrapper : dict):
+        items = wrapper["__list"]
+        first = items[0]
+        if type(first) != dict or "type" not in first or "value" in first: return
+        for item in items:
+            if type(item) != dict or item.get("type") != first["type"] or item.keys() != first.keys(): return
+        fields = {field:[item[field] for item in items] for field in first if field != "type"}
+        wrapper.clear()
+        wrapper.update({"__columns":first["type"], "count":len(items), "fields":fields})
+
+
+_MISSING = object()
+
+class _DeltaState:
+    __slots__ = ['sent', 'received']
+    def __init__(self):
+        self.sent = {}
+        self.received = {}
+
+    def _dump(self, key : str, objdict : dict, head : dict):
+        head["delta"] = key
+        last = self.sent.get(key)
+        self.sent[key] = _DeltaState._snapshot(objdict)
+        if last == None or last["type"] != objdict["type"] or "value" in objdict or "__graph" in objdict:
+            head["full"] = True
+            return objdict
+        return _DeltaState._patch(last, objdict)
+
+    def _load(self, registry : _ClassRegistry, head : dict, body, fields_to_ignore : list):
+        key = head["delta"]
+        if head.get("full") == True:
+            netobj, excode = _NetMessage._netobj_from_dict(registry, body, fields_to_ignore)
+            if excode == ExCode.Success: self.received[key] = netobj
+            else: self.received.pop(key, None)
+            return netobj, excode
+        netobj = self.received.get(key)
+        if netobj == None or type(body) != dict: return None, ExCode.BadData
+        excode = _DeltaState._apply(registry, netobj, body, fields_to_ignore)
+        if excode != ExCode.Success: self.received.pop(key, None)
+        return netobj, excode
+
+    def _forget(self, key : str):
+        self.sent.pop(key, None)
+
+    def _drop(self, key : str):
+        sent = self.sent.pop(key, None)
+        received = self.received.pop(key, None)
+        return sent != None or received != None
+
+    @staticmethod
+    def _snapshot(objdict : dict):
+        snapshot = {}
+        for field, value in objdict.items():
+            if type(value) in _PLAIN_TYPES: snapshot[field] = value
+            elif type(value) == dict: snapshot[field] = _DeltaState._snapshot(value)
+            else: snapshot[field] = copy.deepcopy(value)
+        return snapshot
+
+    @staticmethod
+    def _patch(last : dict, objdict : dict):
+        patch = {"type":objdict["type"], "__delta":[field for field in last if field not in objdict]}
+        for field, value in objdict.items():
+            if field == "type": continue
+            last_value = last.get(field, _MISSING)
+            if (type(value) == dict and type(last_value) == dict and "type" in value and "value" not in value
+                and "__graph" not in value and last_value.get("type") == value["type"]):
+                subpatch = _DeltaState._patch(last_value, value)
+                if len(subpatch) > 2 or len(subpatch["__delta"]) > 0: patch[field] = subpatch
+            elif type(value) != type(last_value) or value != last_value: patch[field] = value
+        return patch
+
+    @staticmethod
+    def _apply(registry : _ClassRegistry, netobj, patch : dict, fields_to_ignore : list):
+        plan = registry.by_name.get(patch.get("type"))
+        if plan == None or type(netobj) != plan.objclass: return ExCode.BadData
+        for field, value in patch.items():
+            if field == "type": continue
+            if field == "__delta":
+                for removed in value:
+                    try: delattr(netobj, removed)
+                    except: pass
+                continue
+            if fields_to_ignore and field in fields_to_ignore: continue
+            if field not in plan.field_set and (not plan.has_dict or field.startswith("__")): return ExCode.BadData
+            if type(value) == dict and "__delta" in value:
+                excode = _DeltaState._apply(registry, getattr(netobj, field, None), value, fields_to_ignore)
+                if excode != ExCode.Success: return excode
+                continue
+            if type(value) == dict:
+                value, excode = _NetMessage._netobj_from_dict(registry, value, fields_to_ignore)
+                if excode != ExCode.Success: return excode
+            try: setattr(netobj, field, value)
+            except: return ExCode.BadData
+        return ExCode.Success
+
+
+class _NetMessage:
+    __slots__ = ['create_code', 'json_string', 'netobj', 'uuid', 'data', 'encoding', 'head', 'trace']
+    def __init__(self, registry : _ClassRegistry, body, fields_to_ignore : list, uuid : str = None, encoding : str = "utf-8",
+                 codec = _CODECS["json"], deltas : _DeltaState = None, key : str = None, head : dict = None):
+        self.uuid = uuid if uuid != None else ud.uuid4().hex[:20]
+        self.json_string = None
+        self.netobj = None
+        self.data = None
+        self.encoding = encoding
+        self.head = None
+        self.trace = None
+        if type(body) == bytes or type(body) == str or type(body) == _SharedFrame:
+            if _TraceManager.active == True: self.trace = _TraceManager._sample("load")
+            self.create_code = self._load(registry, body, fields_to_ignore, codec, deltas)
+        elif type(body) in registry.by_type or body == None:
+            if _TraceManager.active == True: self.trace = _TraceManager._sample("dump")
+            self.create_code = self._dump(registry, body, fields_to_ignore, codec, deltas, key, head)
+        else:
+            self.create_code = ExCode.BadData
+
+    def _load(self, registry : _ClassRegistry, body, fields_to_ignore : list, codec, deltas : _DeltaState = None):
+        if type(body) == _SharedFrame:
+            try:
+                excode = self._load(registry, body.view, fields_to_ignore, codec, deltas)
+                if self.data == None and self.json_string == None: self.data = body
+                return excode
+            finally:
+                if self.data is not body: body._release()
+        if type(body) == bytes: self.data = body
+        codec = _NetMessage._pick_codec(body, codec)
+        if codec.name == "binary": self.encoding = None
+        started = time.perf_counter_ns() if _StatsManager.enabled == True else None
+        traced = time.time_ns() if self.trace != None else None
+        try: mesdict, self.json_string = codec._loads(body, self.encoding, registry)
         except: return ExCode.BadData
-        if type(mesdict) != dict or "head" not in mesdict or "body" not in mesdict: return ExCode.BadData
-        for hf in head_fields:
-            if hf not in mesdict["head"]: return ExCode.BadData
+        if started != None: _StatsManager._timed("loads", started)
+        if _NetMessage._check_net_mes_dict(mesdict) != ExCode.Success: return ExCode.BadData
+        self.head = mesdict["head"]
+        self.uuid = mesdict["head"]["uuid"]
+        if traced != None:
+            body_type = mesdict["body"].get("type") if type(mesdict["body"]) == dict else None
+            _TraceManager._emit(self.trace, "loads", self.uuid, body_type, len(body), traced)
+            traced = time.time_ns()
+        if "delta" in mesdict["head"]:
+            if deltas == None: return ExCode.BadData
+            self.netobj, excode = deltas._load(registry, mesdict["head"], mesdict["body"], fields_to_ignore)
+        else: self.netobj, excode = _NetMessage._netobj_from_dict(registry, mesdict["body"], fields_to_ignore)
+        if traced != None: _TraceManager._emit(self.trace, "from_dict", self.uuid, body_type, len(body), traced)
+        return excode
+
+    def _dump(self, registry : _ClassRegistry, body, fields_to_ignore : list, codec, deltas : _DeltaState = None, key : str = None,
+              extra_head : dict = None):
+        self.netobj = body
+        traced = time.time_ns() if self.trace != None else None
+        if body == None and extra_head != None: objdict = None
+        else:
+            objdict, excode = _NetMessage._netobj_to_dict(registry, body, fields_to_ignore)
+            if excode != ExCode.Success: return excode
+        if traced != None:
+            _TraceManager._emit(self.trace, "to_dict", self.uuid, type(body).__name__, 0, traced)
+            traced = time.time_ns()
+        head = {"uuid":self.uuid}
+        if extra_head != None: head.update(extra_head)
+        self.head = head
+        if deltas != None: objdict = deltas._dump(key, objdict, head)
+        started = time.perf_counter_ns() if _StatsManager.enabled == True else None
+        try: encoded = codec._dumps({"head":head, "body":objdict}, registry)
+        except:
+            if deltas != None: deltas._forget(key)
+            return ExCode.BadData
+        if started != None: _StatsManager._timed("dumps", started)
+        if traced != None: _TraceManager._emit(self.trace, "dumps", self.uuid, type(body).__name__, len(encoded), traced)
+        if type(encoded) == str: self.json_string = encoded
+        else:
+            self.data = encoded
+            self.encoding = None if codec.name == "binary" else "utf-8"
         return ExCode.Success
 
+    def _encoded(self, encoding : str):
+        if type(self.data) == _SharedFrame: self.data = self.data._copy()
+        if self.data != None and (self.encoding == encoding or self.encoding == None): return self.data
+        if self.json_string == None: self.json_string = self.data.decode(self.encoding)
+        self.data = self.json_string.encode(encoding)
+        self.encoding = encoding
+        return self.data
+
+    @staticmethod
+    def _pick_codec(body, codec):
+        if type(body) != str and len(body) > 0 and body[0] == _BINARY_MAGIC: return _CODECS["binary"]
+        if codec.name == "binary": return _CODECS["json"]
+        return codec
+
     @staticmethod
     def _check_net_mes_dict(mesdict):
         head_fields = ["uuid"]
         if type(mesdict) != dict or "head" not in mesdict or "body" not in mesdict: return ExCode.BadData
+        if type(mesdict["head"]) != dict: return ExCode.BadData
         for hf in head_fields:
             if hf not in mesdict["head"]: return ExCode.BadData
-        try: json.dumps(mesdict)
-        except: return ExCode.BadData
         return ExCode.Success
 
     @staticmethod
-    def _netobj_to_dict(classes, netobj, fields_to_ignore : list):
+    def _netobj_to_dict(registry : _ClassRegistry, netobj, fields_to_ignore : list):
         if netobj == None: return {}, ExCode.BadData
-        if type(netobj) not in classes: return {}, ExCode.BadData
-        try: class_attrs = [attr for attr in dir(netobj) if not callable(getattr(netobj, attr)) and not attr.startswith("__")]
-        except: return {}, ExCode.BadData
-        objdict = {"type":type(netobj).__name__}
-        bad_field_types = []
-        for field in class_attrs:
-            if field in fields_to_ignore: continue
-            try: field_value = getattr(netobj, field)
-            except: return objdict, ExCode.BadData
-            if type(field_value) in bad_field_types: return objdict, ExCode.BadData
-            elif isinstance(field_value, enum.Enum):
-                if type(field_value) not in classes: return objdict, ExCode.BadData
-                objdict[field] = {"type":type(field_value).__name__, "value":field_value.value}
-            elif type(field_value) in classes:
-                recobjdict, recexcode = _NetMessage._netobj_to_dict(classes, field_value, fields_to_ignore)
-                objdict[field] = recobjdict
-                if recexcode != ExCode.Success: return objdict, recexcode
-            else:
-                objdict[field] = field_value
-        return objdict, ExCode.Success
+        plan = registry.by_type.get(type(netobj))
+        if plan == None: return {}, ExCode.BadData
+        if plan.is_enum: return {"type":plan.name, "value":netobj.value}, ExCode.Success
+        return _GraphEncoder(registry, fields_to_ignore)._encode(netobj, plan)
 
     @staticmethod
-    def _netobj_from_dict(classes, objdict, fields_to_ignore : list):
-        if objdict == {} or type(objdict) != dict or "type" not in objdict: return None, ExCode.BadData
-        netobjclass = None
-        for objcls in classes:
-            if objcls.__name__ == objdict["type"]:
-                netobjclass = objcls
-                break
-        if netobjclass == None: return None, ExCode.BadData
+    def _new_netobj(registry : _ClassRegistry, objdict):
+        if type(objdict) != dict or "type" not in objdict: return None, None, ExCode.BadData
+        plan = registry.by_name.get(objdict["type"])
+        if plan == None: return None, None, ExCode.BadData
         try:
-            if type(netobjclass) == type(enum.Enum):
-                return netobjclass(objdict["value"]),  ExCode.Success
-            newnetobj = netobjclass()
-            class_attrs = [attr for attr in dir(newnetobj) if not callable(getattr(newnetobj, attr)) and not attr.startswith("__")]
+            if plan.is_enum: return plan.objclass(objdict["value"]), plan, ExCode.Success
+            return plan._new_object(), plan, ExCode.Success
+        except: return None, None, ExCode.BadData
+
+    @staticmethod
+    def _netobj_from_dict(registry : _ClassRegistry, objdict, fields_to_ignore : list):
+        if type(objdict) != dict: return None, ExCode.BadData
+        if "__graph" in objdict: return _NetMessage._graph_from_dict(registry, objdict, fields_to_ignore)
+        stack = []
+        root, excode = _NetMessage._value_from_dict(registry, objdict, stack, None)
+        if excode != ExCode.Success: return root, excode
+        return root, _NetMessage._fill_objects(registry, stack, fields_to_ignore, None)
+
+    @staticmethod
+    def _graph_from_dict(registry : _ClassRegistry, objdict, fields_to_ignore : list):
+        table = objdict["__graph"]
+        if type(table) != list or len(table) == 0 or type(table[0]) != dict or table[0].get("type") != objdict.get("type"): return None, ExCode.BadData
+        nodes = []
+        stack = []
+        for entry in table:
+            newnetobj, plan, excode = _NetMessage._new_netobj(registry, entry)
+            if excode != ExCode.Success or plan.is_enum: return nodes[0] if nodes else None, ExCode.BadData
+            nodes.append(newnetobj)
+            stack.append((newnetobj, plan, entry))
+        return nodes[0], _NetMessage._fill_objects(registry, stack, fields_to_ignore, nodes)
+
+    @staticmethod
+    def _fill_objects(registry : _ClassRegistry, stack : list, fields_to_ignore : list, nodes : list):
+        while stack:
+            newnetobj, plan, objdict = stack.pop()
+            for field, field_value in objdict.items():
+                if field == "type": continue
+                if fields_to_ignore and field in fields_to_ignore: continue
+                if field not in plan.field_set and (not plan.has_dict or field.startswith("__")): return ExCode.BadData
+                if type(field_value) == dict:
+                    field_value, excode = _NetMessage._value_from_dict(registry, field_value, stack, nodes)
+                    if excode != ExCode.Success:
+                        try: setattr(newnetobj, field, field_value)
+                        except: pass
+                        return excode
+                try: setattr(newnetobj, field, field_value)
+                except: return ExCode.BadData
+        return ExCode.Success
+
+    @staticmethod
+    def _value_from_dict(registry : _ClassRegistry, value : dict, stack : list, nodes : list):
+        if type(value) != dict: return None, ExCode.BadData
+        if "__ref" in value:
+            ref = value["__ref"]
+            if nodes == None or type(ref) != int or not 0 <= ref < len(nodes): return None, ExCode.BadData
+            return nodes[ref], ExCode.Success
+        if "__list" in value:
+            if type(value["__list"]) != list: return None, ExCode.BadData
+            items = list(value["__list"])
+            for index, item in enumerate(items):
+                if type(item) != dict: continue
+                items[index], excode = _NetMessage._value_from_dict(registry, item, stack, nodes)
+                if excode != ExCode.Success: return items, excode
+            return items, ExCode.Success
+        if "__dict" in value:
+            if type(value["__dict"]) != dict: return None, ExCode.BadData
+            items = dict(value["__dict"])
+            for key, item in items.items():
+                if type(item) != dict: continue
+                items[key], excode = _NetMessage._value_from_dict(registry, item, stack, nodes)
+                if excode != ExCode.Success: return items, excode
+            return items, ExCode.Success
+        if "__columns" in value: return _NetMessage._columns_from_dict(registry, value, stack, nodes)
+        newnetobj, plan, excode = _NetMessage._new_netobj(registry, value)
+        if excode == ExCode.Success and not plan.is_enum: stack.append((newnetobj, plan, value))
+        return newnetobj, excode
+
+    @staticmethod
+    def _columns_from_dict(registry : _ClassRegistry, value : dict, stack : list, nodes : list):
+        plan = registry.by_name.get(value["__columns"])
+        count = value.get("count")
+        columns = value.get("fields")
+        if plan == None or plan.is_enum or type(count) != int or count < 0 or type(columns) != dict: return None, ExCode.BadData
+        try: items = [plan._new_object() for _ in range(count)]
         except: return None, ExCode.BadData
-        type_field_ignored = False
-        for field in objdict:
-            if not type_field_ignored:
-                type_field_ignored = True
-                continue
-            if field in fields_to_ignore:
-                continue
-            elif field not in class_attrs:
-                return newnetobj, ExCode.BadData
-            elif type(objdict[field]) == dict:
-                try:
-                    subobj, excode = _NetMessage._netobj_from_dict(classes, objdict[field], fields_to_ignore)
-                    setattr(newnetobj, field, subobj)
-                    if excode != ExCode.Success: return newnetobj, excode
-                except: return newnetobj, ExCode.BadData
-            else:
-                try: setattr(newnetobj, field, objdict[field])
-                except: return newnetobj, ExCode.BadData
-        return newnetobj, ExCode.Success
+        for field, column in columns.items():
+            if field not in plan.field_set and (not plan.has_dict or field.startswith("__")): return items, ExCode.BadData
+            if type(column) != list or len(column) != count: return items, ExCode.BadData
+            for item, cell in zip(items, column):
+                if type(cell) == dict:
+                    cell, excode = _NetMessage._value_from_dict(registry, cell, stack, nodes)
+                    if excode != ExCode.Success: return items, excode
+                try: setattr(item, field, cell)
+                except: return items, ExCode.BadData
+        return items, ExCode.Success
+
+class _LazyNetMessage(_NetMessage):
+    __slots__ = ['registry', 'fields_to_ignore', 'codec', 'body_type', 'loaded']
+    def __init__(self, registry : _ClassRegistry, body, fields_to_ignore : list, encoding : str = "utf-8", codec = _CODECS["json"]):
+        self.uuid = None
+        self.json_string = None
+        self.data = None
+        self.encoding = encoding
+        self.head = None
+        self.trace = None
+        _NetMessage.netobj.__set__(self, None)
+        self.registry = registry
+        self.fields_to_ignore = fields_to_ignore
+        self.codec = codec
+        self.body_type = None
+        self.loaded = False
+        if type(body) == _SharedFrame:
+            try: body = bytes(body.view)
+            finally: body._release()
+        if type(body) == bytes or type(body) == str: self.create_code = self._peek(body)
+        else: self.create_code = ExCode.BadData
+
+    def _peek(self, body):
+        if type(body) == bytes: self.data = body
+        else: self.json_string = body
+        codec = _NetMessage._pick_codec(body, self.codec)
+        if codec.name == "binary": self.encoding = None
+        try: head, self.body_type = codec._peek(body, self.encoding, self.registry)
+        except: return ExCode.BadData
+        if type(head) != dict or "uuid" not in head: return ExCode.BadData
+        self.head = head
+        self.uuid = head["uuid"]
+        return ExCode.Success
+
+    def _decode(self):
+        self.loaded = True
+        if self.create_code != ExCode.Success: return
+        message = _NetMessage(self.registry, self.data if self.data != None else self.json_string, self.fields_to_ignore,
+                              encoding=self.encoding, codec=self.codec)
+        _NetMessage.netobj.__set__(self, message.netobj)
+        if self.json_string == None: self.json_string = message.json_string
+        self.create_code = message.create_code
+
+    @property
+    def netobj(self):
+        if self.loaded != True: self._decode()
+        return _NetMessage.netobj.__get__(self)
 
+    @netobj.setter
+    def netobj(self, value):
+        self.loaded = True
+        _NetMessage.netobj.__set__(self, value)
 
 
+_STREAM_INLINE_ITEMS = 64
 
-def generate_message(netobj = StartValues.DefaultNetobj, fields_to_ignore : list = StartValues.DefaultIgnoreFields, uuid : str = ud.uuid4().hex[:20]):
+class _StreamEncoder:
+    def __init__(self, registry : _ClassRegistry, objdict : dict, uuid : str, codec, encoding : str, chunk_bytes : int):
+        self.registry = registry
+        self.objdict = objdict
+        self.uuid = uuid
+        self.codec = codec
+        self.encoding = encoding
+        self.chunk_bytes = chunk_bytes
+        self.deferred = []
+        self.wrapped = []
+        self.items = 0
+        self.create_code = ExCode.Success
+        self._defer(objdict, [])
+        self.total = sum([len(value) for _, value in self.deferred])
+
+    def _defer(self, objdict : dict, path : list):
+        for field, value in objdict.items():
+            if field == "type" or field.startswith("__"): continue
+            if type(value) == dict and "type" in value: self._defer(value, path + [field])
+            elif type(value) == dict:
+                rows = _StreamEncoder._rows(value)
+                if rows == None or len(rows) <= _STREAM_INLINE_ITEMS: continue
+                objdict[field] = {"__list":[]}
+                self.wrapped.append(len(self.deferred))
+                self.deferred.append((path + [field], rows))
+            elif (type(value) == list or type(value) == tuple) and len(value) > _STREAM_INLINE_ITEMS:
+                objdict[field] = []
+                self.deferred.append((path + [field], value))
+            elif type(value) == str and len(value) > self.chunk_bytes:
+                objdict[field] = ""
+                self.deferred.append((path + [field], value))
+
+    @staticmethod
+    def _rows(wrapper : dict):
+        if "__list" in wrapper and type(wrapper["__list"]) == list: return wrapper["__list"]
+        if "__columns" not in wrapper: return None
+        fields = wrapper["fields"]
+        return [dict({"type":wrapper["__columns"]}, **{field:column[index] for field, column in fields.items()})
+                for index in range(wrapper["count"])]
+
+    def _encode(self, head : dict, body):
+        encoded = self.codec._dumps({"head":head, "body":body}, self.registry)
+        if type(encoded) == str: return encoded.encode(self.encoding)
+        return encoded
+
+    def __iter__(self):
+        head = {"uuid":self.uuid, "stream":self.uuid, "paths":[path for path, _ in self.deferred],
+                "items":[len(value) for _, value in self.deferred], "wrapped":self.wrapped}
+        try: yield self._encode(head, self.objdict)
+        except:
+            self.create_code = ExCode.BadData
+            return
+        part = 1
+        for index, (path, value) in enumerate(self.deferred):
+            position = 0
+            count = self.chunk_bytes if type(value) == str else _STREAM_INLINE_ITEMS
+            while position < len(value):
+                items = value[position:position + count]
+                if type(items) == tuple: items = list(items)
+                try: data = self._encode({"uuid":self.uuid, "stream":self.uuid, "part":part, "path":index}, items)
+                except:
+                    self.create_code = ExCode.BadData
+                    yield self._encode({"uuid":self.uuid, "stream":self.uuid, "part":part, "end":True, "abort":True}, None)
+                    return
+                yield data
+                position += len(items)
+                self.items += len(items)
+                part += 1
+                if type(value) != str: count = max(1, int(self.chunk_bytes * len(items) / max(len(data), 1)))
+        yield self._encode({"uuid":self.uuid, "stream":self.uuid, "part":part, "end":True}, None)
+
+
+class _StreamDecoder:
+    def __init__(self, registry : _ClassRegistry, codec, encoding : str, fields_to_ignore : list, max_bytes : int, progress = None,
+                 deltas : _DeltaState = None):
+        self.registry = registry
+        self.codec = codec
+        self.encoding = encoding
+        self.fields_to_ignore = fields_to_ignore
+        self.max_bytes = max_bytes
+        self.progress = progress
+        self.deltas = deltas
+        self.netmes = None
+        self.targets = []
+        self.wrapped = ()
+        self.pieces = {}
+        self.bytes = 0
+        self.items = 0
+        self.total = 0
+
+    def _feed(self, frame : bytes):
+        self.bytes += len(frame)
+        if self.bytes > self.max_bytes: return True, ExCode.BadData
+        if self.netmes == None: done, excode = self._start(frame)
+        else: done, excode = self._append(frame)
+        if excode == ExCode.Success and self.progress != None: self.progress(self.bytes, self.items, self.total)
+        return done, excode
+
+    def _start(self, frame : bytes):
+        self.netmes = _NetMessage(self.registry, frame, self.fields_to_ignore, encoding=self.encoding, codec=self.codec, deltas=self.deltas)
+        if self.netmes.create_code != ExCode.Success: return True, self.netmes.create_code
+        if "stream" not in self.netmes.head: return True, ExCode.Success
+        try:
+            for path in self.netmes.head["paths"]:
+                if self.fields_to_ignore and len([name for name in path if name in self.fields_to_ignore]) > 0:
+                    self.targets.append(None)
+                    continue
+                target = self.netmes.netobj
+                for name in path[:-1]: target = getattr(target, name)
+                self.targets.append((target, path[-1]))
+            self.total = sum(self.netmes.head["items"])
+            self.wrapped = set(self.netmes.head.get("wrapped", ()))
+        except: return True, ExCode.BadData
+        return False, ExCode.Success
+
+    def _append(self, frame : bytes):
+        if type(frame) == _SharedFrame:
+            try: return self._append(frame.view)
+            finally: frame._release()
+        codec = _NetMessage._pick_codec(frame, self.codec)
+        try: mesdict, _ = codec._loads(frame, self.encoding, self.registry)
+        except: return True, ExCode.BadData
+        if _NetMessage._check_net_mes_dict(mesdict) != ExCode.Success: return True, ExCode.BadData
+        head, body = mesdict["head"], mesdict["body"]
+        if head.get("stream") != self.netmes.head["stream"]: return True, ExCode.BadData
+        if head.get("end") == True:
+            if head.get("abort") == True: return True, ExCode.BadData
+            for index, pieces in self.pieces.items():
+                target, field = self.targets[index]
+                try: setattr(target, field, "".join(pieces))
+                except: return True, ExCode.BadData
+            return True, ExCode.Success
+        try:
+            target = self.targets[head["path"]]
+            if target == None: return False, ExCode.Success
+            if type(body) == str: self.pieces.setdefault(head["path"], []).append(body)
+            elif head["path"] in self.wrapped:
+                items = getattr(target[0], target[1])
+                for item in body:
+                    if type(item) == dict:
+                        item, excode = _NetMessage._netobj_from_dict(self.registry, item, self.fields_to_ignore)
+                        if excode != ExCode.Success: return True, excode
+                    items.append(item)
+            else: getattr(target[0], target[1]).extend(body)
+        except: return True, ExCode.BadData
+        self.items += len(body)
+        return False, ExCode.Success
+
+
+def generate_message(netobj = StartValues.DefaultNetobj, fields_to_ignore : list = StartValues.DefaultIgnoreFields, uuid : str = None):
     return _ConvertManager._generate_net_message(netobj, fields_to_ignore, uuid)
 
-def load_message_from_str(messtr : str = StartValues.DefaultMessageString, fields_to_ignore : list = StartValues.DefaultIgnoreFields):
-    return _ConvertManager._load_net_message_from_str(messtr, fields_to_ignore)
+def load_message_from_str(messtr : str = StartValues.DefaultMessageString, fields_to_ignore : list = StartValues.DefaultIgnoreFields, encoding : str = "utf-8"):
+    return _ConvertManager._load_net_message_from_str(messtr, fields_to_ignore, encoding)
+
+def peek_message_from_str(messtr : str = StartValues.DefaultMessageString, fields_to_ignore : list = StartValues.DefaultIgnoreFields, encoding : str = "utf-8"):
+    return _ConvertManager._peek_net_message(messtr, fields_to_ignore, encoding)
+
+def generate_stream(netobj = StartValues.DefaultNetobj, fields_to_ignore : list = StartValues.DefaultIgnoreFields, chunk_bytes : int = None,
+                    encoding : str = "utf-8"):
+    return _ConvertManager._generate_stream(netobj, fields_to_ignore, chunk_bytes, encoding)
+
+def add_trace_hook(callback, sample : int = 1, stages : list = None):
+    return _TraceManager._add(callback, sample, stages)
+
+def remove_trace_hook(callback):
+    return _TraceManager._remove(callback)
+
+def stats(reset : bool = False):
+    return _StatsManager._snapshot(reset)
+
+def reset_stats():
+    with _StatsManager.lock: _StatsManager._reset()
+    return ExCode.Success
+
+def enable_stats(enabled : bool = True):
+    _StatsManager.enabled = enabled
+    return ExCode.Success
+
+def client_stats(client, reset : bool = False):
+    if type(client) != _NetClient and type(client) != _UnixClient: return None, ExCode.BadConn
+    if client.stats == None: return None, ExCode.StartFail
+    with _StatsManager.lock:
+        snapshot = client.stats._snapshot()
+        if reset == True: client.stats = _Counters()
+    return snapshot, ExCode.Success
+
+def client_send_queue(client):
+    if type(client) != _NetClient and type(client) != _UnixClient: return None, ExCode.BadConn
+    if client.outbox == None: return None, ExCode.StartFail
+    return client.outbox._status(), ExCode.Success
 
 def is_running():
-    return {"_UnixManager" : _UnixManager._status(), "_NetManager" : _NetManager._status(), "_ConvertManager" : _ConvertManager._status()}
+    return {"_UnixManager" : _UnixManager._status(), "_NetManager" : _NetManager._status(), "_ConvertManager" : _ConvertManager._status(),
+            "_UnixWorkers" : _UnixManager._workers_status(), "_NetWorkers" : _NetManager._workers_status()}
 
 def is_connected_over_net():
     return _NetManager._connect_status()
@@ -608,12 +3165,26 @@ def is_connected_over_unix():
 
 def start():
     start_codes = []
+    if StartValues.EnableStats == True: _StatsManager.enabled = True
     if StartValues.EnableConvertManager != True: return ExCode.StartFail
-    if StartValues.EnableConvertManager == True: start_codes.append(_ConvertManager._start_converter(StartValues.ConvertModules, StartValues.ConvertClasses))
+    if StartValues.EnableConvertManager == True: start_codes.append(_ConvertManager._start_converter(StartValues.ConvertModules, StartValues.ConvertClasses,
+                                           StartValues.ConvertCodec))
     if StartValues.EnableNetManager == True: start_codes.append(_NetManager._init_connection(StartValues.NetIsServer, StartValues.NetIp, StartValues.NetPort,
-                                           StartValues.NetEncoding, StartValues.DefaultNetTimeout, StartValues.NetQueueSize))
+                                           StartValues.NetEncoding, StartValues.DefaultNetTimeout, StartValues.NetQueueSize,
+                                           StartValues.NetFraming, StartValues.DefaultNetBytes, StartValues.NetMaxMessageBytes,
+                                           StartValues.NetWorkers, StartValues.NetWorkerQueueSize,
+                                           StartValues.NetNoDelay, StartValues.NetCork, StartValues.NetCompression,
+                                           StartValues.NetCompressBytes, StartValues.NetSendQueueBytes,
+                                           StartValues.NetSendQueueMessages, StartValues.NetSendQueuePolicy,
+                                           StartValues.NetPublishQueueBytes))
     if StartValues.EnableUnixManager == True: start_codes.append(_UnixManager._init_connection(StartValues.UnixIsServer, StartValues.UnixPath,
-                                           StartValues.UnixEncoding, StartValues.DefaultUnixTimeout, StartValues.UnixQueueSize))
+                                           StartValues.UnixEncoding, StartValues.DefaultUnixTimeout, StartValues.UnixQueueSize,
+                                           StartValues.UnixFraming, StartValues.DefaultUnixBytes, StartValues.UnixMaxMessageBytes,
+                                           StartValues.UnixWorkers, StartValues.UnixWorkerQueueSize,
+                                           StartValues.UnixCompression, StartValues.UnixCompressBytes,
+                                           StartValues.UnixSharedMemoryBytes, StartValues.UnixSharedMemorySegments,
+                                           StartValues.UnixSendQueueBytes, StartValues.UnixSendQueueMessages,
+                                           StartValues.UnixSendQueuePolicy, StartValues.UnixPublishQueueBytes))
     for exc in start_codes:
         if exc != ExCode.Success: return ExCode.StartFail
     return ExCode.Success
@@ -654,36 +3225,568 @@ def disconnect_from_net_srv():
 def disconnect_from_unix_srv():
     return _UnixManager._disconnect_from_srv()
 
-def receive_data_over_net(bytes : int = StartValues.DefaultNetBytes, client : _NetClient = StartValues.DefaultNetClient):
-    final_code = ExCode.Success
-    data, excode = _NetManager._receive_data(client, bytes)
-    if excode != ExCode.Success: final_code = excode
-    netmes, loadcode = load_message_from_str(messtr=data)
-    if loadcode != ExCode.Success and final_code == ExCode.Success: final_code = loadcode
-    return netmes, final_code
+def receive_data_over_net(bytes : int = StartValues.DefaultNetBytes, client : _NetClient = StartValues.DefaultNetClient, lazy : bool = False):
+    return _receive_message(_NetManager, client, bytes, lazy)
 
 def send_data_over_net(netmessage : _NetMessage, client : _NetClient = StartValues.DefaultNetClient):
-    if type(netmessage) != _NetMessage : return ExCode.BadData
+    return _send_checked(_NetManager, client, netmessage)
+
+def send_stream_over_net(netobj, client : _NetClient = StartValues.DefaultNetClient, fields_to_ignore : list = StartValues.DefaultIgnoreFields,
+                         chunk_bytes : int = None, progress = None):
+    return _send_stream(_NetManager, client, netobj, fields_to_ignore, chunk_bytes, progress)
+
+def receive_stream_over_net(client : _NetClient = StartValues.DefaultNetClient, progress = None, max_bytes : int = None):
+    return _NetManager.converter._load_stream(client, _NetManager, progress, max_bytes)
+
+def send_delta_over_net(netobj, client : _NetClient = StartValues.DefaultNetClient, key : str = None,
+                        fields_to_ignore : list = StartValues.DefaultIgnoreFields):
+    return _send_delta(_NetManager, client, netobj, key, fields_to_ignore)
+
+def forget_delta_over_net(key : str, client : _NetClient = StartValues.DefaultNetClient):
+    return _forget_delta(_NetManager, client, key)
+
+def send_messages_over_net(netmessages : list, client : _NetClient = StartValues.DefaultNetClient):
+    return _send_messages(_NetManager, client, netmessages)
+
+def receive_messages_over_net(bytes : int = StartValues.DefaultNetBytes, client : _NetClient = StartValues.DefaultNetClient):
+    return _receive_messages(_NetManager, client, bytes)
+
+def receive_data_over_unix(bytes : int = StartValues.DefaultUnixBytes, client : _UnixClient = StartValues.DefaultUnixClient, lazy : bool = False):
+    return _receive_message(_UnixManager, client, bytes, lazy)
+
+def send_data_over_unix(netmessage : _NetMessage, client : _UnixClient = StartValues.DefaultUnixClient):
+    return _send_checked(_UnixManager, client, netmessage)
+
+def send_stream_over_unix(netobj, client : _UnixClient = StartValues.DefaultUnixClient, fields_to_ignore : list = StartValues.DefaultIgnoreFields,
+                         chunk_bytes : int = None, progress = None):
+    return _send_stream(_UnixManager, client, netobj, fields_to_ignore, chunk_bytes, progress)
+
+def receive_stream_over_unix(client : _UnixClient = StartValues.DefaultUnixClient, progress = None, max_bytes : int = None):
+    return _UnixManager.converter._load_stream(client, _UnixManager, progress, max_bytes)
+
+def send_delta_over_unix(netobj, client : _UnixClient = StartValues.DefaultUnixClient, key : str = None,
+                        fields_to_ignore : list = StartValues.DefaultIgnoreFields):
+    return _send_delta(_UnixManager, client, netobj, key, fields_to_ignore)
+
+def forget_delta_over_unix(key : str, client : _UnixClient = StartValues.DefaultUnixClient):
+    return _forget_delta(_UnixManager, client, key)
+
+def send_messages_over_unix(netmessages : list, client : _UnixClient = StartValues.DefaultUnixClient):
+    return _send_messages(_UnixManager, client, netmessages)
+
+def receive_messages_over_unix(bytes : int = StartValues.DefaultUnixBytes, client : _UnixClient = StartValues.DefaultUnixClient):
+    return _receive_messages(_UnixManager, client, bytes)
+
+def start_net_pool(endpoints : list = None, connections : int = None, balance : str = None, timeout : int = None):
+    if endpoints == None: endpoints = StartValues.NetPoolEndpoints
+    if len(endpoints) == 0: endpoints = [(StartValues.NetIp, StartValues.NetPort)]
+    connections = StartValues.NetPoolConnections if connections == None else connections
+    balance = StartValues.NetPoolBalance if balance == None else balance
+    timeout = StartValues.DefaultNetTimeout if timeout == None else timeout
+    if connections < 1 or balance not in ("round_robin", "least_in_flight"): return None, ExCode.StartFail
+    if StartValues.NetCompression != None and StartValues.NetCompression not in _COMPRESSORS: return None, ExCode.StartFail
+    compressor = _COMPRESSORS[StartValues.NetCompression] if StartValues.NetCompression != None else None
+    pool = _NetPool(endpoints, connections, balance, timeout, StartValues.NetEncoding, StartValues.DefaultNetBytes,
+                    StartValues.NetMaxMessageBytes, StartValues.NetNoDelay, StartValues.NetPoolBackoff, StartValues.NetPoolMaxBackoff,
+                    compressor, StartValues.NetCompressBytes)
+    return pool, pool._start()
+
+def stop_net_pool(pool : _NetPool):
+    if type(pool) != _NetPool: return ExCode.StopFail
+    return pool._stop()
+
+def lease_net_connection(pool : _NetPool, timeout : int = None):
+    if type(pool) != _NetPool: return None, ExCode.BadConn
+    return pool._lease(timeout)
+
+def release_net_connection(conn : _PoolConnection, pool : _NetPool):
+    if type(pool) != _NetPool or type(conn) != _PoolConnection: return ExCode.BadConn
+    return pool._release(conn)
+
+def send_data_over_pool(netmessage : _NetMessage, pool : _NetPool, conn : _PoolConnection = None, timeout : int = None):
+    if not isinstance(netmessage, _NetMessage): return ExCode.BadData
     if netmessage.create_code != ExCode.Success: return ExCode.BadData
-    sendcode = _NetManager._send_data(client, netmessage.json_string)
+    if type(pool) != _NetPool: return ExCode.BadConn
+    if conn != None: return pool._send(conn, netmessage._encoded(pool.encoding))
+    conn, excode = pool._lease(timeout)
+    if excode != ExCode.Success: return excode
+    sendcode = pool._send(conn, netmessage._encoded(pool.encoding))
+    pool._release(conn)
     return sendcode
 
-def receive_data_over_unix(bytes : int = StartValues.DefaultUnixBytes, client : _UnixClient = StartValues.DefaultUnixClient):
+def receive_data_over_pool(pool : _NetPool, conn : _PoolConnection, bytes : int = StartValues.DefaultNetBytes):
+    if type(pool) != _NetPool or type(conn) != _PoolConnection: return None, ExCode.BadConn
+    final_code = ExCode.Success
+    data, excode = pool._receive(conn, bytes)
+    if excode != ExCode.Success: return None, excode
+    netmes, loadcode = load_message_from_str(messtr=data, encoding=pool.encoding)
+    if loadcode != ExCode.Success: final_code = loadcode
+    return netmes, final_code
+
+def net_pool_status(pool : _NetPool):
+    if type(pool) != _NetPool: return None
+    return pool._status()
+
+def _receive_message(manager, client, bytes : int, lazy : bool):
     final_code = ExCode.Success
-    data, excode = _UnixManager._receive_data(client, bytes)
+    traced = time.time_ns() if _TraceManager.active == True else None
+    data, excode = manager._receive_data(client, bytes)
+    if data == None: return None, excode
     if excode != ExCode.Success: final_code = excode
-    netmes, loadcode = load_message_from_str(messtr=data)
+    received = time.time_ns() if traced != None else None
+    if lazy == True: netmes, loadcode = manager.converter._peek_net_message(data, StartValues.DefaultIgnoreFields, manager.encoding)
+    else: netmes, loadcode = manager.converter._load_net_message_from_str(data, StartValues.DefaultIgnoreFields, manager.encoding,
+                                                                          manager._peer_deltas(client))
+    if traced != None and netmes != None and netmes.trace != None:
+        _TraceManager._emit(netmes.trace, "recv", netmes.uuid, type(netmes.netobj).__name__, len(data), traced, received)
     if loadcode != ExCode.Success and final_code == ExCode.Success: final_code = loadcode
     return netmes, final_code
 
-def send_data_over_unix(netmessage : _NetMessage, client : _UnixClient = StartValues.DefaultUnixClient):
+def _send_checked(manager, client, netmessage : _NetMessage):
     if type(netmessage) != _NetMessage : return ExCode.BadData
     if netmessage.create_code != ExCode.Success: return ExCode.BadData
-    sendcode = _UnixManager._send_data(client, netmessage.json_string)
+    return _send_message(manager, client, netmessage)
+
+def _send_stream(manager, client, netobj, fields_to_ignore : list, chunk_bytes : int, progress):
+    excode = manager._check_client(client)
+    if excode != ExCode.Success: return excode
+    if manager.framing != True: return ExCode.StartFail
+    stream, excode = manager.converter._generate_stream(netobj, fields_to_ignore, chunk_bytes, manager.encoding)
+    if excode != ExCode.Success: return excode
+    sent = 0
+    for data in stream:
+        sendcode = manager._send_data(client, data)
+        if sendcode != ExCode.Success: return sendcode
+        sent += len(data)
+        if progress != None: progress(sent, stream.items, stream.total)
+    return stream.create_code
+
+def _send_delta(manager, client, netobj, key : str, fields_to_ignore : list):
+    excode = manager._check_client(client)
+    if excode != ExCode.Success: return excode
+    if key == None: return ExCode.BadData
+    deltas = manager._peer_deltas(client)
+    key = str(key)
+    netmessage, excode = manager.converter._generate_net_message(netobj, fields_to_ignore, ud.uuid4().hex[:20], deltas, key)
+    if excode != ExCode.Success: return excode
+    sendcode = _send_message(manager, client, netmessage)
+    if sendcode != ExCode.Success: deltas._forget(key)
     return sendcode
 
+def _forget_delta(manager, client, key : str):
+    excode = manager._check_client(client)
+    if excode != ExCode.Success: return excode
+    if key == None: return ExCode.BadData
+    return ExCode.Success if manager._peer_deltas(client)._drop(str(key)) == True else ExCode.BadData
+
+def _send_messages(manager, client, netmessages : list):
+    datas = []
+    for netmessage in netmessages:
+        if not isinstance(netmessage, _NetMessage) or netmessage.create_code != ExCode.Success: return ExCode.BadData
+        datas.append(netmessage._encoded(manager.encoding))
+    return manager._send_batch(client, datas)
+
+def _receive_messages(manager, client, bytes : int):
+    final_code = ExCode.Success
+    datas, excode = manager._receive_batch(client, bytes)
+    if excode != ExCode.Success: final_code = excode
+    netmessages = []
+    deltas = manager._peer_deltas(client)
+    for data in datas:
+        netmes, loadcode = manager.converter._load_net_message_from_str(data, StartValues.DefaultIgnoreFields, manager.encoding, deltas)
+        if loadcode != ExCode.Success and final_code == ExCode.Success: final_code = loadcode
+        netmessages.append(netmes)
+    return netmessages, final_code
+
+def _send_message(manager, client, netmessage : _NetMessage, block : bool = True):
+    data = netmessage._encoded(manager.encoding)
+    if netmessage.trace == None: return manager._send_data(client, data, block)
+    traced = time.time_ns()
+    excode = manager._send_data(client, data, block)
+    _TraceManager._emit(netmessage.trace, "send", netmessage.uuid, type(netmessage.netobj).__name__, len(data), traced)
+    return excode
+
+def _subscribe(manager, client, topic : str):
+    excode = manager._check_client(client)
+    if excode != ExCode.Success: return excode
+    if manager.server_mode != True: return ExCode.StartFail
+    _outbox(manager, client)
+    with manager.topics_lock: manager.topics.setdefault(topic, set()).add(client)
+    return ExCode.Success
+
+def _outbox(manager, client):
+    shared = manager.shared if isinstance(manager, _UnixEndpoint) else None
+    with manager.topics_lock:
+        if manager.pump == None:
+            manager.pump = _SendPump(manager)
+            manager.pump._start()
+        with client.lock:
+            if client.outbox == None: client.outbox = _SendQueue(manager.publish_bytes, 0, manager.queue_policy, client.lock, shared)
+
+def _unsubscribe(manager, client, topic : str = None):
+    found = False
+    with manager.topics_lock:
+        for name in list(manager.topics) if topic == None else [topic]:
+            subscribers = manager.topics.get(name)
+            if subscribers == None or client not in subscribers: continue
+            subscribers.discard(client)
+            found = True
+            if len(subscribers) == 0: del manager.topics[name]
+    return ExCode.Success if found == True else ExCode.BadData
+
+def _subscribers(manager, topic : str):
+    with manager.topics_lock: return list(manager.topics.get(topic, ()))
+
+def _publish(manager, topic : str, netobj):
+    if not manager.init or manager.server_mode != True: return 0, ExCode.StartFail
+    if isinstance(netobj, _NetMessage): netmessage = netobj
+    else: netmessage, _ = manager.converter._generate_net_message(netobj, StartValues.DefaultIgnoreFields, None)
+    if netmessage == None or netmessage.create_code != ExCode.Success: return 0, ExCode.BadData
+    data = netmessage._encoded(manager.encoding)
+    buffers = _pack_frame([], data, manager.compressor, manager.compress_bytes) if manager.framing == True else [data]
+    if buffers == None: return 0, ExCode.BadData
+    traced = time.time_ns() if netmessage.trace != None else None
+    delivered = 0
+    for client in _subscribers(manager, topic):
+        if client.alive != True:
+            _unsubscribe(manager, client, None)
+            continue
+        excode = manager.pump._send(client, list(buffers), 1, False)
+        if _StatsManager.enabled == True: _StatsManager._io(manager.stats, client, False, 1, len(data), excode)
+        if excode == ExCode.Success: delivered += 1
+    if traced != None: _TraceManager._emit(netmessage.trace, "send", netmessage.uuid, type(netmessage.netobj).__name__, len(data), traced)
+    return delivered, ExCode.Success
+
+def _trace_accept(client, accepted : int):
+    hooks = _TraceManager._sample("accept")
+    if hooks != None: _TraceManager._emit(hooks, "accept", client.uuid, type(client).__name__, 0, accepted)
+
+def _rpc_handler(manager, handlers : dict):
+    handlers = {(key if type(key) == str else key.__name__):function for key, function in handlers.items()}
+    def rpc(client, netmessage : _NetMessage, excode : ExCode):
+        if netmessage == None or excode != ExCode.Success: return
+        head = {"reply":netmessage.uuid}
+        function = handlers.get(netmessage.body_type)
+        reply = None
+        if function == None: head["error"] = f"no handler for {netmessage.body_type}"
+        else:
+            netobj = netmessage.netobj
+            if netmessage.create_code != ExCode.Success: head["error"] = f"can not load {netmessage.body_type}"
+            else:
+                try: reply = function(client, netobj)
+                except Exception as e: head["error"] = f"{type(e).__name__}: {e}"
+        if isinstance(reply, _NetMessage): reply = reply.netobj
+        replymes, excode = manager.converter._generate_net_message(reply, StartValues.DefaultIgnoreFields, None, head=head)
+        if excode != ExCode.Success:
+            head["error"] = f"can not send {type(reply).__name__}"
+            replymes, excode = manager.converter._generate_net_message(None, StartValues.DefaultIgnoreFields, None, head=head)
+        _send_message(manager, client, replymes, False)
+    return rpc
+
+def _relay_handler(manager, router):
+    def relay(client, netmessage : _NetMessage, excode : ExCode):
+        if netmessage == None: return router(client, None)
+        if excode != ExCode.Success: return
+        targets = router(client, netmessage)
+        if targets == None: return
+        if type(targets) != list and type(targets) != tuple and type(targets) != set: targets = [targets]
+        data = netmessage._encoded(manager.encoding)
+        for target in targets: manager._send_data(target, data, False)
+    return relay
+
+def serve_net(handler, client_timeout : int = StartValues.DefaultNetTimeout):
+    return _NetManager._serve(handler, client_timeout)
+
+def serve_relay_net(router, client_timeout : int = StartValues.DefaultNetTimeout):
+    return _NetManager._serve(_relay_handler(_NetManager, router), client_timeout, lazy=True)
+
+def serve_rpc_net(handlers : dict, client_timeout : int = StartValues.DefaultNetTimeout):
+    return _NetManager._serve(_rpc_handler(_NetManager, handlers), client_timeout, lazy=True)
+
+def start_rpc_net(on_message = None):
+    return _NetManager._start_rpc(on_message)
+
+def stop_rpc_net():
+    return _NetManager._stop_rpc()
+
+def call_over_net(netobj, timeout : int = None):
+    if _NetManager.rpc == None: return None, ExCode.StartFail
+    return _NetManager.rpc._call(netobj, timeout)
+
+def stop_serving_net():
+    return _NetManager._stop_serving()
+
+def subscribe_net_client(client : _NetClient, topic : str):
+    return _subscribe(_NetManager, client, topic)
+
+def unsubscribe_net_client(client : _NetClient, topic : str = None):
+    return _unsubscribe(_NetManager, client, topic)
+
+def publish_over_net(topic : str, netobj):
+    return _publish(_NetManager, topic, netobj)
+
+def net_subscribers(topic : str):
+    return _subscribers(_NetManager, topic)
+
+def start_net_workers(handler, processes : int = os.cpu_count(), client_timeout : int = StartValues.DefaultNetTimeout):
+    return _NetManager._start_workers(handler, client_timeout, processes)
+
+def serve_unix(handler, client_timeout : int = StartValues.DefaultUnixTimeout):
+    return _UnixManager._serve(handler, client_timeout)
+
+def serve_relay_unix(router, client_timeout : int = StartValues.DefaultUnixTimeout):
+    return _UnixManager._serve(_relay_handler(_UnixManager, router), client_timeout, lazy=True)
+
+def serve_rpc_unix(handlers : dict, client_timeout : int = StartValues.DefaultUnixTimeout):
+    return _UnixManager._serve(_rpc_handler(_UnixManager, handlers), client_timeout, lazy=True)
+
+def start_rpc_unix(on_message = None):
+    return _UnixManager._start_rpc(on_message)
+
+def stop_rpc_unix():
+    return _UnixManager._stop_rpc()
+
+def call_over_unix(netobj, timeout : int = None):
+    if _UnixManager.rpc == None: return None, ExCode.StartFail
+    return _UnixManager.rpc._call(netobj, timeout)
+
+def stop_serving_unix():
+    return _UnixManager._stop_serving()
+
+def subscribe_unix_client(client : _UnixClient, topic : str):
+    return _subscribe(_UnixManager, client, topic)
+
+def unsubscribe_unix_client(client : _UnixClient, topic : str = None):
+    return _unsubscribe(_UnixManager, client, topic)
+
+def publish_over_unix(topic : str, netobj):
+    return _publish(_UnixManager, topic, netobj)
+
+def unix_subscribers(topic : str):
+    return _subscribers(_UnixManager, topic)
+
+def start_unix_workers(handler, processes : int = os.cpu_count(), client_timeout : int = StartValues.DefaultUnixTimeout):
+    return _UnixManager._start_workers(handler, client_timeout, processes)
+
 def just_convert_object_to_dict(classes, netobj, fields_to_ignore : list):
-    return _NetMessage._netobj_to_dict(classes, netobj, fields_to_ignore)
+    return _NetMessage._netobj_to_dict(_ClassRegistry._from_classes(classes), netobj, fields_to_ignore)
 
 def just_load_object_from_dict(classes, objdict, fields_to_ignore : list):
-    return _NetMessage._netobj_from_dict(classes, objdict, fields_to_ignore)
+    return _NetMessage._netobj_from_dict(_ClassRegistry._from_classes(classes), objdict, fields_to_ignore)
+
+
+class _Instance:
+    def __init__(self, endpoint_type, modules : list, classes : list, codec : str):
+        self.converter = _Converter()
+        self.manager = endpoint_type(self.converter)
+        self.modules = modules
+        self.classes = classes
+        self.codec = codec
+
+    def _start_converter(self):
+        modules = StartValues.ConvertModules if self.modules == None and self.classes == None else self.modules or []
+        classes = StartValues.ConvertClasses if self.modules == None and self.classes == None else self.classes or []
+        codec = StartValues.ConvertCodec if self.codec == None else self.codec
+        return self.converter._start_converter(modules, classes, codec)
+
+    def _started(self, excode : ExCode):
+        if excode == ExCode.Success: return ExCode.Success
+        self.manager._stop(prepare_mod=False)
+        self.converter._stop(prepare_mod=False)
+        return ExCode.StartFail
+
+    def stop(self):
+        if self.manager._stop(prepare_mod=True) != ExCode.Success: return ExCode.StopFail
+        excode = self.manager._stop(prepare_mod=False)
+        self.converter._stop(prepare_mod=False)
+        return excode
+
+    def is_running(self):
+        return self.manager._status()
+
+    def generate_message(self, netobj, fields_to_ignore : list = StartValues.DefaultIgnoreFields, uuid : str = None):
+        return self.converter._generate_net_message(netobj, fields_to_ignore, uuid)
+
+    def load_message_from_str(self, messtr, fields_to_ignore : list = StartValues.DefaultIgnoreFields, encoding : str = "utf-8"):
+        return self.converter._load_net_message_from_str(messtr, fields_to_ignore, encoding)
+
+    def stats(self, reset : bool = False):
+        return _StatsManager._endpoint_snapshot(self.manager, reset)
+
+class _ServerInstance(_Instance):
+    def accept(self, client_timeout : int = None):
+        return self.manager._accept_connection(self.manager.timeout if client_timeout == None else client_timeout)
+
+    def close_client(self, client):
+        return self.manager._close_client_connection(client)
+
+    def serve(self, handler, client_timeout : int = None):
+        return self.manager._serve(handler, self.manager.timeout if client_timeout == None else client_timeout)
+
+    def serve_relay(self, router, client_timeout : int = None):
+        return self.manager._serve(_relay_handler(self.manager, router), self.manager.timeout if client_timeout == None else client_timeout,
+                                   lazy=True)
+
+    def serve_rpc(self, handlers : dict, client_timeout : int = None):
+        return self.manager._serve(_rpc_handler(self.manager, handlers), self.manager.timeout if client_timeout == None else client_timeout,
+                                   lazy=True)
+
+    def stop_serving(self):
+        return self.manager._stop_serving()
+
+    def start_workers(self, handler, processes : int = os.cpu_count(), client_timeout : int = None):
+        return self.manager._start_workers(handler, self.manager.timeout if client_timeout == None else client_timeout, processes)
+
+    def client_count(self):
+        return self.manager.clients
+
+    def send(self, netmessage : _NetMessage, client):
+        return _send_checked(self.manager, client, netmessage)
+
+    def receive(self, client, bytes : int = None, lazy : bool = False):
+        return _receive_message(self.manager, client, self.manager.bytes if bytes == None else bytes, lazy)
+
+    def send_messages(self, netmessages : list, client):
+        return _send_messages(self.manager, client, netmessages)
+
+    def receive_messages(self, client, bytes : int = None):
+        return _receive_messages(self.manager, client, self.manager.bytes if bytes == None else bytes)
+
+    def send_delta(self, netobj, client, key : str = None, fields_to_ignore : list = StartValues.DefaultIgnoreFields):
+        return _send_delta(self.manager, client, netobj, key, fields_to_ignore)
+
+    def forget_delta(self, key : str, client):
+        return _forget_delta(self.manager, client, key)
+
+    def send_stream(self, netobj, client, fields_to_ignore : list = StartValues.DefaultIgnoreFields, chunk_bytes : int = None, progress = None):
+        return _send_stream(self.manager, client, netobj, fields_to_ignore, chunk_bytes, progress)
+
+    def receive_stream(self, client, progress = None, max_bytes : int = None):
+        return self.converter._load_stream(client, self.manager, progress, max_bytes)
+
+    def subscribe(self, client, topic : str):
+        return _subscribe(self.manager, client, topic)
+
+    def unsubscribe(self, client, topic : str = None):
+        return _unsubscribe(self.manager, client, topic)
+
+    def publish(self, topic : str, netobj):
+        return _publish(self.manager, topic, netobj)
+
+    def subscribers(self, topic : str):
+        return _subscribers(self.manager, topic)
+
+class _ClientInstance(_Instance):
+    def stop(self):
+        if self.manager._connect_status() == True: self.manager._disconnect_from_srv()
+        return _Instance.stop(self)
+
+    def is_connected(self):
+        return self.manager._connect_status()
+
+    def start_rpc(self, on_message = None):
+        return self.manager._start_rpc(on_message)
+
+    def stop_rpc(self):
+        return self.manager._stop_rpc()
+
+    def call(self, netobj, timeout : int = None):
+        if self.manager.rpc == None: return None, ExCode.StartFail
+        return self.manager.rpc._call(netobj, timeout)
+
+    def send(self, netmessage : _NetMessage):
+        return _send_checked(self.manager, None, netmessage)
+
+    def receive(self, bytes : int = None, lazy : bool = False):
+        return _receive_message(self.manager, None, self.manager.bytes if bytes == None else bytes, lazy)
+
+    def send_messages(self, netmessages : list):
+        return _send_messages(self.manager, None, netmessages)
+
+    def receive_messages(self, bytes : int = None):
+        return _receive_messages(self.manager, None, self.manager.bytes if bytes == None else bytes)
+
+    def send_delta(self, netobj, key : str = None, fields_to_ignore : list = StartValues.DefaultIgnoreFields):
+        return _send_delta(self.manager, None, netobj, key, fields_to_ignore)
+
+    def forget_delta(self, key : str):
+        return _forget_delta(self.manager, None, key)
+
+    def send_stream(self, netobj, fields_to_ignore : list = StartValues.DefaultIgnoreFields, chunk_bytes : int = None, progress = None):
+        return _send_stream(self.manager, None, netobj, fields_to_ignore, chunk_bytes, progress)
+
+    def receive_stream(self, progress = None, max_bytes : int = None):
+        return self.converter._load_stream(None, self.manager, progress, max_bytes)
+
+def _net_init(manager, is_server : bool, ip : str, port : int, timeout : int, workers : int):
+    return manager._init_connection(is_server, StartValues.NetIp if ip == None else ip, StartValues.NetPort if port == None else port,
+                                    StartValues.NetEncoding, StartValues.DefaultNetTimeout if timeout == None else timeout,
+                                    StartValues.NetQueueSize, StartValues.NetFraming, StartValues.DefaultNetBytes,
+                                    StartValues.NetMaxMessageBytes, StartValues.NetWorkers if workers == None else workers,
+                                    StartValues.NetWorkerQueueSize, StartValues.NetNoDelay, StartValues.NetCork, StartValues.NetCompression,
+                                    StartValues.NetCompressBytes, StartValues.NetSendQueueBytes, StartValues.NetSendQueueMessages,
+                                    StartValues.NetSendQueuePolicy, StartValues.NetPublishQueueBytes)
+
+def _unix_init(manager, is_server : bool, path : str, timeout : int, workers : int):
+    return manager._init_connection(is_server, StartValues.UnixPath if path == None else path, StartValues.UnixEncoding,
+                                    StartValues.DefaultUnixTimeout if timeout == None else timeout, StartValues.UnixQueueSize,
+                                    StartValues.UnixFraming, StartValues.DefaultUnixBytes, StartValues.UnixMaxMessageBytes,
+                                    StartValues.UnixWorkers if workers == None else workers, StartValues.UnixWorkerQueueSize,
+                                    StartValues.UnixCompression, StartValues.UnixCompressBytes, StartValues.UnixSharedMemoryBytes,
+                                    StartValues.UnixSharedMemorySegments, StartValues.UnixSendQueueBytes, StartValues.UnixSendQueueMessages,
+                                    StartValues.UnixSendQueuePolicy, StartValues.UnixPublishQueueBytes)
+
+class NetServer(_ServerInstance):
+    def __init__(self, ip : str = None, port : int = None, modules : list = None, classes : list = None, codec : str = None,
+                 timeout : int = None, workers : int = None):
+        _Instance.__init__(self, _NetEndpoint, modules, classes, codec)
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+        self.workers = workers
+
+    def start(self):
+        if self._start_converter() != ExCode.Success: return ExCode.StartFail
+        return self._started(_net_init(self.manager, True, self.ip, self.port, self.timeout, self.workers))
+
+class UnixServer(_ServerInstance):
+    def __init__(self, path : str = None, modules : list = None, classes : list = None, codec : str = None, timeout : int = None,
+                 workers : int = None):
+        _Instance.__init__(self, _UnixEndpoint, modules, classes, codec)
+        self.path = path
+        self.timeout = timeout
+        self.workers = workers
+
+    def start(self):
+        if self._start_converter() != ExCode.Success: return ExCode.StartFail
+        return self._started(_unix_init(self.manager, True, self.path, self.timeout, self.workers))
+
+class NetClientSession(_ClientInstance):
+    def __init__(self, ip : str = None, port : int = None, modules : list = None, classes : list = None, codec : str = None,
+                 timeout : int = None):
+        _Instance.__init__(self, _NetEndpoint, modules, classes, codec)
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+
+    def start(self):
+        if self._start_converter() != ExCode.Success: return ExCode.StartFail
+        excode = _net_init(self.manager, False, self.ip, self.port, self.timeout, 0)
+        if excode == ExCode.Success: excode = self.manager._connect_to_srv()
+        if excode == ExCode.Success: return excode
+        self._started(excode)
+        return excode
+
+class UnixClientSession(_ClientInstance):
+    def __init__(self, path : str = None, modules : list = None, classes : list = None, codec : str = None, timeout : int = None):
+        _Instance.__init__(self, _UnixEndpoint, modules, classes, codec)
+        self.path = path
+        self.timeout = timeout
+
+    def start(self):
+        if self._start_converter() != ExCode.Success: return ExCode.StartFail
+        excode = _unix_init(self.manager, False, self.path, self.timeout, 0)
+        if excode == ExCode.Success: excode = self.manager._connect_to_srv()
+        if excode == ExCode.Success: return excode
+        self._started(excode)
+        return excode
@@ -14,7 +14,7 @@ setup(
     author="Ivashka (Ivan Rakov)",
     author_email="<ivashka.2.r@gmail.com>",
     description=DESCRIPTION,
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     install_requires=[],
     keywords=['python', 'network', 'sockets', 'objects', 'classes', 'oon'],
     long_description=LONG_DESCRIPTION,
@@ -0,0 +1,49 @@
+import os
+import shutil
+import socket
+import tempfile
+
+import pytest
+
+import oon
+from oon import oon as core
+
+
+_DEFAULTS = {name:value for name, value in vars(oon.StartValues).items() if not name.startswith("__")}
+
+
+@pytest.fixture(autouse=True)
+def reset_oon():
+    yield
+    for manager in (core._NetManager, core._UnixManager):
+        if manager.prefork != None: manager._stop_workers()
+        if manager.serve_loop != None: manager._stop_serving()
+        manager.clients = 0
+        if manager.init == True: manager._stop(prepare_mod=False)
+    core._ConvertManager._stop(prepare_mod=False)
+    for name, value in _DEFAULTS.items(): setattr(oon.StartValues, name, value)
+    for hook in list(core._TraceManager.hooks): oon.remove_trace_hook(hook.callback)
+    oon.enable_stats(False)
+    oon.reset_stats()
+
+@pytest.fixture
+def net_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    oon.StartValues.NetIp = "127.0.0.1"
+    oon.StartValues.NetPort = port
+    return port
+
+@pytest.fixture
+def unix_path():
+    workdir = tempfile.mkdtemp(prefix="oon-test-")
+    oon.StartValues.UnixPath = os.path.join(workdir, "oon.socket")
+    yield oon.StartValues.UnixPath
+    shutil.rmtree(workdir, ignore_errors=True)
+
+@pytest.fixture(params=["net", "unix"])
+def transport(request):
+    if request.param == "net": request.getfixturevalue("net_port")
+    else: request.getfixturevalue("unix_path")
+    return request.param
@@ -0,0 +1,61 @@
+import enum
+
+
+class Color(enum.Enum):
+    Red = 1
+    Green = 2
+
+class Point:
+    x : int = 0
+    y : int = 0
+    def __init__(self, x : int = 0, y : int = 0):
+        self.x = x
+        self.y = y
+
+class Item:
+    n : int = 0
+    name : str = ""
+    def __init__(self, n : int = 0):
+        self.n = n
+        self.name = f"item-{n}"
+
+class Order:
+    id : int = 0
+    title : str = ""
+    price : float = 0.0
+    paid : bool = False
+    color : Color = Color.Red
+    origin : Point = None
+    tags : list = []
+    items : list = []
+    meta : dict = {}
+    def __init__(self, id : int = 0):
+        self.id = id
+        self.title = f"order-{id}"
+        self.price = id / 4
+        self.paid = id % 2 == 0
+        self.color = Color.Green
+        self.origin = Point(id, -id)
+        self.tags = ["a", "b"]
+        self.items = []
+        self.meta = {}
+
+class Slotted:
+    __slots__ = ["a", "b"]
+    a : int
+    b : str
+    def __init__(self, a : int = 1, b : str = "b"):
+        self.a = a
+        self.b = b
+
+class Node:
+    value : int = 0
+    next = None
+    def __init__(self, value : int = 0):
+        self.value = value
+        self.next = None
+
+class Blob:
+    data : str = ""
+    def __init__(self, data : str = ""):
+        self.data = data
@@ -0,0 +1,94 @@
+import contextlib
+import socket
+import struct
+import threading
+import time
+
+import oon
+from oon import oon as core
+from . import models
+
+
+CLASSES = [models.Color, models.Point, models.Item, models.Order, models.Slotted, models.Node, models.Blob]
+FRAME = struct.Struct("!I")
+
+
+def start(codec : str = "json", classes : list = None, **values):
+    oon.StartValues.ConvertClasses = CLASSES if classes == None else classes
+    oon.StartValues.ConvertCodec = codec
+    oon.StartValues.NetFraming = True
+    oon.StartValues.UnixFraming = True
+    for name, value in values.items(): setattr(oon.StartValues, name, value)
+    assert oon.start() == oon.ExCode.Success
+
+def start_server(transport : str, codec : str = "json", **values):
+    if transport == "net": values.update(EnableNetManager=True, NetIsServer=True)
+    else: values.update(EnableUnixManager=True, UnixIsServer=True)
+    start(codec, **values)
+
+def connect(transport : str):
+    if transport == "net": return socket.create_connection((oon.StartValues.NetIp, oon.StartValues.NetPort), timeout=5)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(5)
+    sock.connect(oon.StartValues.UnixPath)
+    return sock
+
+def accept(transport : str, timeout : int = 5):
+    if transport == "net": return oon.accept_net_connection(timeout)
+    return oon.accept_unix_connection(timeout)
+
+def close_client(transport : str, client):
+    if transport == "net": return oon.close_net_client_connection(client)
+    return oon.close_unix_client_connection(client)
+
+def send(transport : str, netmessage, client):
+    if transport == "net": return oon.send_data_over_net(netmessage, client)
+    return oon.send_data_over_unix(netmessage, client)
+
+def receive(transport : str, client):
+    if transport == "net": return oon.receive_data_over_net(client=client)
+    return oon.receive_data_over_unix(client=client)
+
+def pack(data : bytes):
+    return FRAME.pack(len(data)) + data
+
+def read_exactly(sock, size : int):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk: raise ConnectionError("peer closed")
+        data += chunk
+    return data
+
+def read_frame(sock):
+    size = FRAME.unpack(read_exactly(sock, FRAME.size))[0]
+    return read_exactly(sock, size & 0x3fffffff)
+
+def encode(netobj):
+    netmessage, excode = oon.generate_message(netobj)
+    assert excode == oon.ExCode.Success
+    return netmessage
+
+def decode(data):
+    netmessage, excode = oon.load_message_from_str(data)
+    assert excode == oon.ExCode.Success
+    return netmessage.netobj
+
+def wait_for(condition, timeout : float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline: return False
+        time.sleep(0.01)
+    return True
+
+@contextlib.contextmanager
+def serving(transport : str, serve, *args):
+    manager = core._NetManager if transport == "net" else core._UnixManager
+    result = []
+    thread = threading.Thread(target=lambda: result.append(serve(*args)), daemon=True)
+    thread.start()
+    assert wait_for(lambda: manager.serve_loop != None and manager.serve_loop.running == True or not thread.is_alive())
+    try: yield result
+    finally:
+        manager._stop_serving()
+        thread.join(5)
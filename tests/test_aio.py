@@ -0,0 +1,66 @@
+import asyncio
+
+import oon
+from oon import aio
+from . import models
+from .support import encode, pack, start
+
+
+def _run(transport : str, body):
+    async def run():
+        async def echo(conn):
+            while True:
+                netmessage, excode = await conn.receive()
+                if excode == oon.ExCode.BadConn: return
+                if excode == oon.ExCode.Success: await conn.send(netmessage)
+        if transport == "net":
+            server, excode = await aio.start_net_server(echo)
+            conn, connect_code = await aio.connect_to_net_srv(timeout=5)
+        else:
+            server, excode = await aio.start_unix_server(echo)
+            conn, connect_code = await aio.connect_to_unix_srv(timeout=5)
+        assert (excode, connect_code) == (oon.ExCode.Success, oon.ExCode.Success)
+        try: return await body(conn)
+        finally:
+            await aio.close_connection(conn)
+            server.close()
+            await server.wait_closed()
+    return asyncio.run(run())
+
+
+def test_aio_echo_round_trip(transport):
+    start()
+    async def body(conn):
+        replies = []
+        for index in range(3):
+            assert await aio.send_data(encode(models.Order(index)), conn) == oon.ExCode.Success
+            replies.append(await aio.receive_data(conn, 5))
+        return replies
+    replies = _run(transport, body)
+    assert [excode for _, excode in replies] == [oon.ExCode.Success] * 3
+    assert [netmessage.netobj.title for netmessage, _ in replies] == ["order-0", "order-1", "order-2"]
+
+def test_aio_big_message_is_decoded_off_loop(transport):
+    start(AioOffloadBytes=1024)
+    async def body(conn):
+        assert await aio.send_data(encode(models.Blob("q" * 200000)), conn) == oon.ExCode.Success
+        return await aio.receive_data(conn, 5)
+    netmessage, excode = _run(transport, body)
+    assert excode == oon.ExCode.Success
+    assert netmessage.netobj.data == "q" * 200000
+
+def test_aio_receive_timeout(transport):
+    start()
+    async def body(conn):
+        return await aio.receive_data(conn, 0.05)
+    assert _run(transport, body) == (None, oon.ExCode.Timeout)
+
+def test_aio_oversized_frame_is_skipped(transport):
+    start(NetMaxMessageBytes=4096, UnixMaxMessageBytes=4096)
+    async def body(conn):
+        conn.writer.write(pack(b"z" * 10001) + pack(encode(models.Point(2, 3))._encoded("utf-8")))
+        await conn.writer.drain()
+        return await aio.receive_data(conn, 5)
+    netmessage, excode = _run(transport, body)
+    assert excode == oon.ExCode.Success
+    assert netmessage.netobj.y == 3
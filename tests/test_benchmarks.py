@@ -0,0 +1,22 @@
+import benchmarks
+import oon
+
+
+def test_transport_suite_restores_start_values(transport):
+    before = {name:getattr(oon.StartValues, name) for name in ("UnixPath", "NetNoDelay", "EnableNetManager", "EnableUnixManager",
+                                                                "NetIsServer", "UnixIsServer", "ConvertModules", "ConvertCodec")}
+    report = benchmarks.run([transport], rounds=10, repeats=1, transport_rounds=10)
+    assert report["results"][f"{transport}.64.throughput"]["value"] > 0
+    assert {name:getattr(oon.StartValues, name) for name in before} == before
+
+def test_converter_suite_reports_every_shape():
+    report = benchmarks.run(["converter"], rounds=5, repeats=1)
+    assert report["codec"] == "json"
+    assert len([name for name in report["results"] if name.startswith("encode.")]) >= 5
+    assert all(result["value"] > 0 for result in report["results"].values())
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"results":{"a":{"value":100, "better":"higher"}, "b":{"value":100, "better":"lower"}}}
+    report = {"results":{"a":{"value":70, "unit":"msg/s", "better":"higher"}, "b":{"value":110, "unit":"us", "better":"lower"}}}
+    assert benchmarks.compare(report, baseline, 0.2) == ["a"]
+    assert round(report["results"]["b"]["ratio"], 2) == 1.1
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+import oon
+from oon import oon as core
+from . import models
+from .support import CLASSES, decode, encode, start
+
+
+CODECS = sorted(core._CODECS)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_round_trip_with_every_codec(codec):
+    start(codec)
+    order = models.Order(6)
+    order.items = [models.Item(n) for n in range(3)]
+    order.meta = {"k":models.Point(1, 2)}
+    loaded = decode(encode(order)._encoded("utf-8"))
+    assert (loaded.id, loaded.title, loaded.price, loaded.paid, loaded.color) == (6, "order-6", 1.5, True, models.Color.Green)
+    assert [item.name for item in loaded.items] == ["item-0", "item-1", "item-2"]
+    assert (loaded.meta["k"].x, loaded.meta["k"].y) == (1, 2)
+
+def test_binary_is_smaller_than_json():
+    start("json")
+    json_size = len(encode(models.Order(6))._encoded("utf-8"))
+    oon.stop()
+    start("binary")
+    data = encode(models.Order(6))._encoded("utf-8")
+    assert data[0] == core._BINARY_MAGIC
+    assert len(data) < json_size
+
+def test_binary_keeps_numeric_edge_values():
+    start("binary")
+    values = [0, -1, 2**63, -(2**70), 0.1, -2.5, float("inf"), "", "ü", None, True, False]
+    point = decode(encode(models.Point(values, list(range(-10, 10))))._encoded("utf-8"))
+    assert point.x == values
+    assert point.y == list(range(-10, 10))
+
+def test_received_codec_is_detected_automatically():
+    start("binary")
+    binary = encode(models.Point(1, 2))._encoded("utf-8")
+    json_data = json.dumps({"head":{"uuid":"a"}, "body":{"type":"Point", "x":3, "y":4}})
+    assert decode(json_data).x == 3
+    oon.stop()
+    start("json")
+    assert decode(binary).x == 1
+
+def test_binary_needs_same_classes_on_both_sides():
+    start("binary")
+    data = encode(models.Point(1, 2))._encoded("utf-8")
+    oon.stop()
+    start("binary", classes=[models.Item])
+    netmessage, excode = oon.load_message_from_str(data)
+    assert excode == oon.ExCode.BadData
+
+def test_truncated_binary_is_bad_data():
+    start("binary")
+    data = encode(models.Order(1))._encoded("utf-8")
+    for size in (1, len(data) // 2, len(data) - 1):
+        netmessage, excode = oon.load_message_from_str(data[:size])
+        assert excode == oon.ExCode.BadData
+
+def test_unknown_or_missing_codec_fails_start():
+    oon.StartValues.ConvertClasses = CLASSES
+    for codec in ("yaml",) + tuple(name for name in ("orjson", "ujson") if name not in core._CODECS):
+        oon.StartValues.ConvertCodec = codec
+        assert oon.start() == oon.ExCode.StartFail
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+import oon
+from oon import oon as core
+from . import models
+from .support import decode, encode, start
+
+
+def _body(netobj):
+    return json.loads(encode(netobj)._encoded("utf-8"))["body"]
+
+def test_long_object_list_is_sent_by_columns():
+    start()
+    order = models.Order(1)
+    order.items = [models.Item(index) for index in range(core._COLUMNS_MIN)]
+    columns = _body(order)["items"]
+    assert columns["__columns"] == "Item" and columns["count"] == core._COLUMNS_MIN
+    assert columns["fields"]["name"] == [f"item-{index}" for index in range(core._COLUMNS_MIN)]
+    order.items = order.items[:-1]
+    assert "__list" in _body(order)["items"]
+
+def test_mixed_or_nested_lists_keep_rows():
+    start()
+    order = models.Order(1)
+    order.items = [models.Item(index) for index in range(10)] + [models.Point(0, 0)]
+    assert "__list" in _body(order)["items"]
+    order.items = [models.Order(index) for index in range(10)]
+    loaded = decode(encode(order)._encoded("utf-8"))
+    assert [(item.id, item.origin.y, item.color) for item in loaded.items] == [(index, -index, models.Color.Green) for index in range(10)]
+
+@pytest.mark.parametrize("codec", ["json", "binary"])
+def test_columns_round_trip_with_missing_fields(codec):
+    start(codec)
+    items = [models.Item(index) for index in range(20)]
+    items[3].extra = "only here"
+    order = models.Order(1)
+    order.items = items
+    loaded = decode(encode(order)._encoded("utf-8")).items
+    assert [item.name for item in loaded] == [item.name for item in items]
+    assert loaded[3].extra == "only here" and not hasattr(loaded[4], "extra")
+
+def test_binary_packs_numeric_lists():
+    start("binary")
+    data = encode(models.Point(list(range(100)), [0.5] * 100))._encoded("utf-8")
+    assert bytes([core._B_INTS, 1]) in data and bytes([core._B_FLOATS]) in data
+    assert len(data) < 100 + 100 * 8 + 64
+    point = decode(data)
+    assert point.x == list(range(100)) and point.y == [0.5] * 100
+    assert type(point.x[0]) == int and type(point.y[0]) == float
+
+def test_binary_keeps_lists_that_can_not_be_packed():
+    start("binary")
+    values = ([True] * 10, [2**70] * 10, [1, 2.5] * 5)
+    for value in values: assert decode(encode(models.Point(value, None))._encoded("utf-8")).x == value
+    assert type(decode(encode(models.Point([True] * 10, None))._encoded("utf-8")).x[0]) == bool
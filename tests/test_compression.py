@@ -0,0 +1,92 @@
+import pytest
+
+import oon
+from oon import oon as core
+from . import models
+from .support import FRAME, accept, close_client, connect, decode, encode, pack, read_exactly, read_frame, receive, send, start_server
+
+
+def _setting(transport : str, name : str):
+    return ("Net" if transport == "net" else "Unix") + name
+
+
+@pytest.mark.parametrize("name", sorted(core._COMPRESSORS))
+def test_big_messages_are_compressed_and_small_ones_sent_raw(transport, name):
+    start_server(transport, **{_setting(transport, "Compression"):name, _setting(transport, "CompressBytes"):256})
+    peer = connect(transport)
+    client, excode = accept(transport)
+    big = encode(models.Blob("abc" * 10000))
+    assert send(transport, big, client) == oon.ExCode.Success
+    header = FRAME.unpack(read_exactly(peer, FRAME.size))[0]
+    assert header & core._FRAME_COMPRESSED
+    frame = read_exactly(peer, header & core._FRAME_SIZE)
+    assert frame[0] == core._COMPRESSORS[name].tag
+    assert len(frame) < 30000
+    assert core._unpack_frame(frame, 1 << 20) == big._encoded("utf-8")
+    assert send(transport, encode(models.Point(1, 2)), client) == oon.ExCode.Success
+    header = FRAME.unpack(read_exactly(peer, FRAME.size))[0]
+    assert not header & core._FRAME_COMPRESSED
+    assert decode(read_exactly(peer, header)).x == 1
+    peer.close()
+    close_client(transport, client)
+
+def test_compressed_and_raw_frames_are_read_without_setting(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    data = encode(models.Blob("x" * 5000))._encoded("utf-8")
+    peer.sendall(b"".join(core._pack_frame([], data, core._COMPRESSORS["zlib"])) + pack(data))
+    for _ in range(2):
+        netmessage, excode = receive(transport, client)
+        assert excode == oon.ExCode.Success
+        assert netmessage.netobj.data == "x" * 5000
+    peer.close()
+    close_client(transport, client)
+
+def test_compressed_frame_bigger_than_limit_is_bad_data(transport):
+    start_server(transport, **{_setting(transport, "MaxMessageBytes"):4096})
+    peer = connect(transport)
+    client, excode = accept(transport)
+    data = encode(models.Blob("x" * 100000))._encoded("utf-8")
+    peer.sendall(b"".join(core._pack_frame([], data, core._COMPRESSORS["zlib"])) + pack(encode(models.Point(3, 4))._encoded("utf-8")))
+    netmessage, excode = receive(transport, client)
+    assert excode == oon.ExCode.BadData
+    netmessage, excode = receive(transport, client)
+    assert excode == oon.ExCode.Success and netmessage.netobj.x == 3
+    peer.close()
+    close_client(transport, client)
+
+def test_unknown_compression_fails_start(net_port):
+    oon.StartValues.ConvertClasses = [models.Point]
+    oon.StartValues.EnableNetManager = True
+    oon.StartValues.NetIsServer = True
+    oon.StartValues.NetCompression = "zstd"
+    assert oon.start() == oon.ExCode.StartFail
+
+def test_frames_over_size_header_limit_are_not_sent(transport, monkeypatch):
+    start_server(transport, **{_setting(transport, "MaxMessageBytes"):2**40})
+    peer = connect(transport)
+    client, excode = accept(transport)
+    assert client.reader.max_size == core._FRAME_SIZE
+    monkeypatch.setattr(core, "_FRAME_SIZE", 0x3ff)
+    big = encode(models.Blob("x" * 2000))
+    small = encode(models.Point(1, 2))
+    assert send(transport, big, client) == oon.ExCode.BadData
+    send_messages = oon.send_messages_over_net if transport == "net" else oon.send_messages_over_unix
+    assert send_messages([small, big], client) == oon.ExCode.BadData
+    assert send(transport, small, client) == oon.ExCode.Success
+    assert decode(read_frame(peer)).x == 1
+    peer.close()
+    close_client(transport, client)
+
+def test_compressed_frame_under_size_header_limit_is_sent(transport, monkeypatch):
+    start_server(transport, **{_setting(transport, "Compression"):"zlib"})
+    peer = connect(transport)
+    client, excode = accept(transport)
+    monkeypatch.setattr(core, "_FRAME_SIZE", 0x3ff)
+    big = encode(models.Blob("x" * 2000))
+    assert send(transport, big, client) == oon.ExCode.Success
+    header = FRAME.unpack(read_exactly(peer, FRAME.size))[0]
+    assert core._unpack_frame(read_exactly(peer, header & 0x3fffffff), 1 << 20) == big._encoded("utf-8")
+    peer.close()
+    close_client(transport, client)
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+import oon
+from oon import oon as core
+from . import models
+from .support import decode, encode, start
+
+
+def test_round_trip_keeps_fields_nested_objects_and_enums():
+    start()
+    order = decode(encode(models.Order(3))._encoded("utf-8"))
+    assert type(order) == models.Order
+    assert (order.id, order.title, order.price, order.paid) == (3, "order-3", 0.75, False)
+    assert order.color == models.Color.Green
+    assert type(order.origin) == models.Point and (order.origin.x, order.origin.y) == (3, -3)
+    assert order.tags == ["a", "b"]
+
+def test_plans_are_built_once_at_start():
+    start()
+    plan = core._ConvertManager.registry.by_type[models.Order]
+    assert plan.name == "Order"
+    assert {"id", "title", "origin", "items"} <= plan.field_set
+    encode(models.Order(1))
+    assert core._ConvertManager.registry.by_type[models.Order] is plan
+
+def test_slotted_object_round_trip():
+    start()
+    slotted = decode(encode(models.Slotted(5, "five"))._encoded("utf-8"))
+    assert (slotted.a, slotted.b) == (5, "five")
+
+def test_slot_missing_from_payload_is_set_by_init():
+    start()
+    slotted = decode(json.dumps({"head":{"uuid":"a"}, "body":{"type":"Slotted", "a":9}}))
+    assert (slotted.a, slotted.b) == (9, "b")
+
+def test_ignored_fields_are_not_sent():
+    start()
+    netmessage, excode = oon.generate_message(models.Point(1, 2), ["y"])
+    assert excode == oon.ExCode.Success
+    assert "y" not in json.loads(netmessage._encoded("utf-8"))["body"]
+
+def test_unknown_class_and_unknown_field_are_bad_data():
+    start()
+    netmessage, excode = oon.generate_message(object())
+    assert excode == oon.ExCode.BadData
+    for body in ({"type":"Missing"}, {"type":"Slotted", "z":1}):
+        netmessage, excode = oon.load_message_from_str(json.dumps({"head":{"uuid":"a"}, "body":body}))
+        assert excode == oon.ExCode.BadData
+
+def test_non_dict_body_is_bad_data():
+    start()
+    for body in (None, 5, "text", [1, 2]):
+        netmessage, excode = oon.load_message_from_str(json.dumps({"head":{"uuid":"a"}, "body":body}))
+        assert excode == oon.ExCode.BadData
+
+@pytest.mark.parametrize("codec", ["json", "binary"])
+def test_shared_references_and_cycles_are_kept(codec):
+    start(codec)
+    shared = models.Point(1, 2)
+    order = models.Order(1)
+    order.origin = shared
+    order.items = [shared, shared]
+    order.meta = {"self":order}
+    loaded = decode(encode(order)._encoded("utf-8"))
+    assert loaded.origin is loaded.items[0] is loaded.items[1]
+    assert loaded.meta["self"] is loaded
+    assert (loaded.origin.x, loaded.title) == (1, "order-1")
+
+def test_plain_tree_keeps_nested_format_and_graph_uses_table():
+    start()
+    body = json.loads(encode(models.Order(1))._encoded("utf-8"))["body"]
+    assert "__graph" not in body and body["origin"]["type"] == "Point"
+    node = models.Node(0)
+    node.next = node
+    body = json.loads(encode(node)._encoded("utf-8"))["body"]
+    assert body["type"] == "Node" and body["__graph"][0]["next"] == {"__ref":0}
+
+def test_deep_chain_is_sent_as_table():
+    start()
+    root = node = models.Node(0)
+    for index in range(1, 500):
+        node.next = models.Node(index)
+        node = node.next
+    data = encode(root)._encoded("utf-8")
+    assert "__graph" in json.loads(data)["body"]
+    node = decode(data)
+    for index in range(500):
+        assert node.value == index
+        node = node.next
+    assert node == None
+
+def test_bad_graph_references_are_bad_data():
+    start()
+    for table in ([{"type":"Node", "value":0, "next":{"__ref":5}}], [], [{"type":"Missing"}]):
+        body = {"type":"Node", "__graph":table}
+        netmessage, excode = oon.load_message_from_str(json.dumps({"head":{"uuid":"a"}, "body":body}))
+        assert excode == oon.ExCode.BadData
@@ -0,0 +1,102 @@
+import json
+
+import oon
+from . import models
+from .support import accept, close_client, connect, pack, read_frame, receive, start_server
+
+
+def _send_delta(transport : str, netobj, client, key : str = None):
+    if transport == "net": return oon.send_delta_over_net(netobj, client, key)
+    return oon.send_delta_over_unix(netobj, client, key)
+
+def _forget_delta(transport : str, key : str, client):
+    if transport == "net": return oon.forget_delta_over_net(key, client)
+    return oon.forget_delta_over_unix(key, client)
+
+
+def test_only_changed_fields_are_sent_and_patched_back(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    order = models.Order(4)
+    frames = []
+    assert _send_delta(transport, order, client, "order") == oon.ExCode.Success
+    frames.append(read_frame(peer))
+    order.title = "changed"
+    order.origin.y = 40
+    assert _send_delta(transport, order, client, "order") == oon.ExCode.Success
+    frames.append(read_frame(peer))
+    full, patch = [json.loads(frame) for frame in frames]
+    assert full["head"]["full"] == True and full["body"]["title"] == "order-4"
+    assert "full" not in patch["head"] and patch["head"]["delta"] == "order"
+    assert set(patch["body"]) == {"type", "__delta", "title", "origin"}
+    assert set(patch["body"]["origin"]) == {"type", "__delta", "y"}
+    assert len(frames[1]) < len(frames[0])
+    peer.sendall(b"".join(pack(frame) for frame in frames))
+    first, excode = receive(transport, client)
+    assert excode == oon.ExCode.Success and first.netobj.title == "order-4"
+    second, excode = receive(transport, client)
+    assert excode == oon.ExCode.Success
+    assert second.netobj is first.netobj
+    assert (second.netobj.title, second.netobj.origin.y, second.netobj.price) == ("changed", 40, 1.0)
+    peer.close()
+    close_client(transport, client)
+
+def test_unchanged_object_sends_empty_patch(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    point = models.Point(1, 2)
+    for _ in range(2): assert _send_delta(transport, point, client, "p") == oon.ExCode.Success
+    read_frame(peer)
+    assert json.loads(read_frame(peer))["body"] == {"type":"Point", "__delta":[]}
+    peer.close()
+    close_client(transport, client)
+
+def test_patch_without_full_object_is_bad_data(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    peer.sendall(pack(json.dumps({"head":{"uuid":"a", "delta":"k"}, "body":{"type":"Point", "__delta":[], "x":1}}).encode()))
+    netmessage, excode = receive(transport, client)
+    assert excode == oon.ExCode.BadData
+    peer.close()
+    close_client(transport, client)
+
+def test_delta_state_starts_again_for_new_connection(transport):
+    start_server(transport)
+    point = models.Point(1, 2)
+    for _ in range(2):
+        peer = connect(transport)
+        client, excode = accept(transport)
+        assert _send_delta(transport, point, client, "p") == oon.ExCode.Success
+        assert json.loads(read_frame(peer))["head"]["full"] == True
+        peer.close()
+        close_client(transport, client)
+
+def test_delta_needs_key_and_forgotten_key_is_sent_whole(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    point = models.Point(1, 2)
+    assert _send_delta(transport, point, client) == oon.ExCode.BadData
+    for _ in range(2): assert _send_delta(transport, point, client, "p") == oon.ExCode.Success
+    assert _forget_delta(transport, "p", client) == oon.ExCode.Success
+    assert _forget_delta(transport, "p", client) == oon.ExCode.BadData
+    assert _send_delta(transport, point, client, "p") == oon.ExCode.Success
+    assert [json.loads(read_frame(peer))["head"].get("full") for _ in range(3)] == [True, None, True]
+    peer.close()
+    close_client(transport, client)
+
+def test_forget_drops_received_object(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    full = {"head":{"uuid":"a", "delta":"k", "full":True}, "body":{"type":"Point", "x":1, "y":2}}
+    patch = {"head":{"uuid":"b", "delta":"k"}, "body":{"type":"Point", "__delta":[], "x":3}}
+    peer.sendall(pack(json.dumps(full).encode()) + pack(json.dumps(patch).encode()))
+    assert receive(transport, client)[1] == oon.ExCode.Success
+    assert _forget_delta(transport, "k", client) == oon.ExCode.Success
+    assert receive(transport, client)[1] == oon.ExCode.BadData
+    peer.close()
+    close_client(transport, client)
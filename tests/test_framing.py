@@ -0,0 +1,157 @@
+import socket
+import threading
+
+import oon
+from . import models
+from .support import accept, close_client, connect, decode, encode, pack, read_frame, receive, send, start_server
+
+
+def test_frames_split_across_reads_are_joined(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    assert excode == oon.ExCode.Success
+    data = pack(encode(models.Order(1))._encoded("utf-8"))
+    writer = threading.Thread(target=lambda: [peer.sendall(data[index:index + 1]) for index in range(len(data))])
+    writer.start()
+    netmessage, excode = receive(transport, client)
+    writer.join()
+    assert excode == oon.ExCode.Success
+    assert netmessage.netobj.title == "order-1"
+    assert netmessage.netobj.origin.y == -1
+    peer.close()
+    close_client(transport, client)
+
+def test_several_frames_in_one_read_are_returned_one_by_one(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    peer.sendall(b"".join(pack(encode(models.Point(index, 0))._encoded("utf-8")) for index in range(5)))
+    for index in range(5):
+        netmessage, excode = receive(transport, client)
+        assert excode == oon.ExCode.Success
+        assert netmessage.netobj.x == index
+    peer.close()
+    close_client(transport, client)
+
+def test_message_bigger_than_read_size(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    writer = threading.Thread(target=peer.sendall, args=(pack(encode(models.Blob("x" * 300000))._encoded("utf-8")),))
+    writer.start()
+    netmessage, excode = receive(transport, client)
+    writer.join()
+    assert excode == oon.ExCode.Success
+    assert len(netmessage.netobj.data) == 300000
+    peer.close()
+    close_client(transport, client)
+
+def test_send_writes_one_frame(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    assert send(transport, encode(models.Point(3, 4)), client) == oon.ExCode.Success
+    point = decode(read_frame(peer))
+    assert (point.x, point.y) == (3, 4)
+    peer.close()
+    close_client(transport, client)
+
+def test_closed_peer_is_bad_conn(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    peer.close()
+    netmessage, excode = receive(transport, client)
+    assert excode == oon.ExCode.BadConn
+    close_client(transport, client)
+
+def test_oversized_frame_is_skipped(transport):
+    start_server(transport, NetMaxMessageBytes=4096, UnixMaxMessageBytes=4096)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    data = pack(b"y" * 20000) + pack(encode(models.Point(7, 8))._encoded("utf-8"))
+    writer = threading.Thread(target=peer.sendall, args=(data,))
+    writer.start()
+    netmessage, excode = receive(transport, client)
+    assert excode == oon.ExCode.BadData
+    netmessage, excode = receive(transport, client)
+    writer.join()
+    assert excode == oon.ExCode.Success
+    assert netmessage.netobj.x == 7
+    peer.close()
+    close_client(transport, client)
+
+def test_send_messages_writes_whole_batch(transport):
+    start_server(transport, NetCork=True)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    send_batch = oon.send_messages_over_net if transport == "net" else oon.send_messages_over_unix
+    assert send_batch([encode(models.Point(index, 0)) for index in range(50)], client) == oon.ExCode.Success
+    assert [decode(read_frame(peer)).x for _ in range(50)] == list(range(50))
+    peer.close()
+    close_client(transport, client)
+
+def test_receive_messages_returns_every_buffered_message(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    receive_batch = oon.receive_messages_over_net if transport == "net" else oon.receive_messages_over_unix
+    peer.sendall(b"".join(pack(encode(models.Point(index, 0))._encoded("utf-8")) for index in range(5)))
+    received = []
+    while len(received) < 5:
+        netmessages, excode = receive_batch(client=client)
+        assert excode == oon.ExCode.Success and len(netmessages) > 0
+        received += netmessages
+    assert [netmessage.netobj.x for netmessage in received] == list(range(5))
+    peer.sendall(pack(b"{broken") + pack(encode(models.Point(9, 0))._encoded("utf-8")))
+    received, codes = [], []
+    while len(received) < 2:
+        netmessages, excode = receive_batch(client=client)
+        received += netmessages
+        codes.append(excode)
+    assert codes[0] == oon.ExCode.BadData
+    assert [netmessage.create_code for netmessage in received] == [oon.ExCode.BadData, oon.ExCode.Success]
+    assert received[1].netobj.x == 9
+    peer.close()
+    netmessages, excode = receive_batch(client=client)
+    assert (netmessages, excode) == ([], oon.ExCode.BadConn)
+    close_client(transport, client)
+
+def test_net_sockets_get_nodelay():
+    start_server("net", NetNoDelay=True)
+    peer = connect("net")
+    client, excode = accept("net")
+    assert client.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+    peer.close()
+    close_client("net", client)
+
+def test_buffer_shrinks_after_big_message(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    size = len(client.reader.buffer)
+    writer = threading.Thread(target=peer.sendall, args=(pack(encode(models.Blob("x" * 300000))._encoded("utf-8")),))
+    writer.start()
+    netmessage, excode = receive(transport, client)
+    writer.join()
+    assert excode == oon.ExCode.Success
+    assert len(client.reader.buffer) == size
+    peer.sendall(pack(encode(models.Point(1, 2))._encoded("utf-8")))
+    assert receive(transport, client)[0].netobj.x == 1
+    peer.close()
+    close_client(transport, client)
+
+def test_framing_is_off_by_default(transport):
+    assert oon.StartValues.NetFraming == False and oon.StartValues.UnixFraming == False
+    start_server(transport, NetFraming=False, UnixFraming=False)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    data = encode(models.Point(1, 2))._encoded("utf-8")
+    peer.sendall(data)
+    netmessage, excode = receive(transport, client)
+    assert excode == oon.ExCode.Success and netmessage.netobj.y == 2
+    assert send(transport, netmessage, client) == oon.ExCode.Success
+    assert peer.recv(len(data)) == data
+    peer.close()
+    close_client(transport, client)
@@ -0,0 +1,89 @@
+import contextlib
+import socket
+import threading
+
+import oon
+from oon import oon as core
+from . import models
+from .support import CLASSES, encode, pack, read_frame, start, start_server, wait_for
+
+
+def test_instance_stats_count_own_clients_only(net_port):
+    start()
+    oon.enable_stats()
+    server = oon.NetServer(port=net_port, classes=CLASSES)
+    assert server.start() == oon.ExCode.Success
+    peer = socket.create_connection(("127.0.0.1", net_port), timeout=5)
+    client, excode = server.accept(5)
+    peer.sendall(pack(encode(models.Point(1, 2))._encoded("utf-8")))
+    netmessage, excode = server.receive(client)
+    assert excode == oon.ExCode.Success
+    assert server.send(netmessage, client) == oon.ExCode.Success
+    read_frame(peer)
+    stats = server.stats(reset=True)
+    assert (stats["messages_in"], stats["messages_out"], stats["accepts"], stats["clients"]) == (1, 1, 1, 1)
+    assert server.stats()["messages_in"] == 0
+    assert oon.stats()["net"]["messages_in"] == 0
+    peer.close()
+    assert server.close_client(client) == oon.ExCode.Success
+    assert server.stop() == oon.ExCode.Success
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _echo(client, netmessage, excode):
+    return netmessage
+
+@contextlib.contextmanager
+def _serving(server):
+    assert server.start() == oon.ExCode.Success
+    thread = threading.Thread(target=server.serve, args=(_echo,), daemon=True)
+    thread.start()
+    assert wait_for(lambda: server.manager.serve_loop != None and server.manager.serve_loop.running == True)
+    try: yield server
+    finally:
+        server.stop_serving()
+        thread.join(5)
+        server.stop()
+
+def test_servers_with_own_classes_and_codecs_run_side_by_side():
+    oon.StartValues.NetFraming = True
+    ports = [_free_port(), _free_port()]
+    points = oon.NetServer(port=ports[0], classes=[models.Point])
+    items = oon.NetServer(port=ports[1], classes=[models.Item], codec="binary")
+    with _serving(points), _serving(items):
+        for port, classes, codec, netobj in ((ports[0], [models.Point], None, models.Point(1, 2)),
+                                             (ports[1], [models.Item], "binary", models.Item(7))):
+            session = oon.NetClientSession(port=port, classes=classes, codec=codec)
+            assert session.start() == oon.ExCode.Success
+            netmessage, excode = session.generate_message(netobj)
+            assert excode == oon.ExCode.Success
+            assert session.send(netmessage) == oon.ExCode.Success
+            reply, excode = session.receive()
+            assert excode == oon.ExCode.Success and type(reply.netobj) == type(netobj)
+            assert session.stop() == oon.ExCode.Success
+        assert points.generate_message(models.Item(1))[1] == oon.ExCode.BadData
+        assert items.generate_message(models.Item(1))[0]._encoded("utf-8")[0] == core._BINARY_MAGIC
+    assert oon.is_running()["_NetManager"] == False
+
+def test_unix_server_and_session_beside_module_api(unix_path, net_port):
+    start_server("net")
+    server = oon.UnixServer(path=unix_path, classes=CLASSES)
+    with _serving(server):
+        session = oon.UnixClientSession(path=unix_path, classes=CLASSES)
+        assert session.start() == oon.ExCode.Success and session.is_connected() == True
+        assert session.send(session.generate_message(models.Point(3, 4))[0]) == oon.ExCode.Success
+        assert session.receive()[0].netobj.y == 4
+        assert wait_for(lambda: server.client_count() == 1)
+        session.stop()
+        assert session.is_connected() == False
+    assert server.is_running() == False
+    assert oon.is_running()["_NetManager"] == True
+
+def test_failed_instance_start_cleans_up(unix_path):
+    session = oon.UnixClientSession(path=unix_path, classes=CLASSES)
+    assert session.start() == oon.ExCode.BadConn
+    assert session.is_running() == False
+    assert oon.NetServer(port=_free_port(), classes=CLASSES, codec="yaml").start() == oon.ExCode.StartFail
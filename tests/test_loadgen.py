@@ -0,0 +1,22 @@
+import pytest
+
+import oon
+from oon import loadgen
+
+
+def test_unix_load_run_restores_socket_path():
+    report = loadgen.run_load("unix", clients=2, duration=0.5)
+    assert report["failures"] == []
+    assert report["received"] > 0 and report["errors"] == 0 and report["lost"] == 0
+    assert report["p50_ms"] <= report["p99_ms"] <= report["max_ms"]
+    assert oon.StartValues.UnixPath == "oon.socket"
+
+def test_open_loop_net_run(net_port):
+    report = loadgen.run_load("net", clients=1, rate=200, duration=0.5, mix={"Ping":1, "Record":1})
+    assert report["failures"] == []
+    assert report["mode"] == "open"
+    assert report["received"] == report["sent"] > 50
+
+def test_mix_parsing_and_unknown_class():
+    assert loadgen._parse_mix("Ping:8, Record") == {"Ping":8.0, "Record":1.0}
+    with pytest.raises(ValueError): loadgen.run_load("net", mix={"Missing":1})
@@ -0,0 +1,48 @@
+import json
+
+import oon
+from oon import oon as core
+from . import models
+from .support import encode, start
+
+
+def _count(monkeypatch, module, name : str):
+    calls = []
+    original = getattr(module, name)
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+    monkeypatch.setattr(module, name, counted)
+    return calls
+
+def test_generate_dumps_once_and_caches_encoded_bytes(monkeypatch):
+    start()
+    dumps = _count(monkeypatch, core.json, "dumps")
+    netmessage = encode(models.Order(2))
+    first = netmessage._encoded("utf-8")
+    assert netmessage._encoded("utf-8") is first
+    assert len(dumps) == 1
+
+def test_load_parses_once_and_resends_original_bytes(monkeypatch):
+    start()
+    data = encode(models.Point(1, 2))._encoded("utf-8")
+    loads = _count(monkeypatch, core.json, "loads")
+    dumps = _count(monkeypatch, core.json, "dumps")
+    netmessage, excode = oon.load_message_from_str(data)
+    assert excode == oon.ExCode.Success
+    assert netmessage._encoded("utf-8") is data
+    assert (len(loads), len(dumps)) == (1, 0)
+
+def test_load_accepts_str_and_keeps_uuid():
+    start()
+    netmessage = encode(models.Point(1, 2))
+    loaded, excode = oon.load_message_from_str(netmessage._encoded("utf-8").decode())
+    assert excode == oon.ExCode.Success
+    assert loaded.uuid == netmessage.uuid
+    assert (loaded.netobj.x, loaded.netobj.y) == (1, 2)
+
+def test_malformed_messages_are_bad_data():
+    start()
+    for data in (b"{not json", json.dumps({"body":{"type":"Point"}}), json.dumps({"head":{}, "body":{"type":"Point"}})):
+        netmessage, excode = oon.load_message_from_str(data)
+        assert excode == oon.ExCode.BadData
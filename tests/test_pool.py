@@ -0,0 +1,97 @@
+import socket
+
+import pytest
+
+import oon
+from . import models
+from .support import decode, encode, pack, read_frame, start, wait_for
+
+
+class _Server:
+    def __init__(self):
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.listener.settimeout(5)
+        self.endpoint = self.listener.getsockname()
+        self.peers = []
+
+    def accept(self, count : int):
+        for _ in range(count):
+            peer, addr = self.listener.accept()
+            peer.settimeout(5)
+            self.peers.append(peer)
+        return self.peers[-count:]
+
+    def close(self):
+        for peer in self.peers: peer.close()
+        self.listener.close()
+
+
+@pytest.fixture
+def servers():
+    started = [_Server(), _Server()]
+    yield started
+    for server in started: server.close()
+
+
+def _pool(servers : list, connections : int = 1, balance : str = "round_robin"):
+    pool, excode = oon.start_net_pool([server.endpoint for server in servers], connections, balance, 5)
+    assert excode == oon.ExCode.Success
+    return pool
+
+def test_round_robin_spreads_messages_over_servers(servers):
+    start()
+    pool = _pool(servers)
+    peers = [server.accept(1)[0] for server in servers]
+    for index in range(4): assert oon.send_data_over_pool(encode(models.Point(index, 0)), pool) == oon.ExCode.Success
+    assert [decode(read_frame(peers[0])).x for _ in range(2)] == [0, 2]
+    assert [decode(read_frame(peers[1])).x for _ in range(2)] == [1, 3]
+    assert oon.net_pool_status(pool)["alive"] == 2
+    assert oon.stop_net_pool(pool) == oon.ExCode.Success
+    assert oon.stop_net_pool(pool) == oon.ExCode.StopFail
+
+def test_leased_connection_receives_reply(servers):
+    start()
+    pool = _pool(servers[:1])
+    peer = servers[0].accept(1)[0]
+    conn, excode = oon.lease_net_connection(pool)
+    assert excode == oon.ExCode.Success
+    assert oon.send_data_over_pool(encode(models.Point(1, 2)), pool, conn) == oon.ExCode.Success
+    peer.sendall(pack(read_frame(peer)))
+    netmessage, excode = oon.receive_data_over_pool(pool, conn)
+    assert excode == oon.ExCode.Success and netmessage.netobj.y == 2
+    assert oon.lease_net_connection(pool, 0.05) == (None, oon.ExCode.Timeout)
+    assert oon.release_net_connection(conn, pool) == oon.ExCode.Success
+    assert oon.release_net_connection(conn, pool) == oon.ExCode.BadConn
+    oon.stop_net_pool(pool)
+
+def test_least_in_flight_prefers_server_with_fewer_leases(servers):
+    start()
+    pool = _pool(servers, 2, "least_in_flight")
+    first, excode = oon.lease_net_connection(pool)
+    second, excode = oon.lease_net_connection(pool)
+    assert (first.addr, first.port) != (second.addr, second.port)
+    oon.stop_net_pool(pool)
+
+def test_broken_connection_is_reconnected(servers):
+    start()
+    oon.StartValues.NetPoolBackoff = 0.01
+    pool = _pool(servers[:1])
+    servers[0].accept(1)[0].close()
+    conn, excode = oon.lease_net_connection(pool)
+    netmessage, excode = oon.receive_data_over_pool(pool, conn)
+    assert excode == oon.ExCode.BadConn
+    oon.release_net_connection(conn, pool)
+    peer = servers[0].accept(1)[0]
+    assert wait_for(lambda: oon.net_pool_status(pool)["alive"] == 1)
+    assert oon.send_data_over_pool(encode(models.Point(5, 0)), pool) == oon.ExCode.Success
+    assert decode(read_frame(peer)).x == 5
+    oon.stop_net_pool(pool)
+
+def test_pool_without_servers_and_bad_arguments(servers):
+    endpoint = servers[0].endpoint
+    servers[0].close()
+    pool, excode = oon.start_net_pool([endpoint], 1)
+    assert excode == oon.ExCode.BadConn
+    oon.stop_net_pool(pool)
+    assert oon.start_net_pool([endpoint], 0) == (None, oon.ExCode.StartFail)
+    assert oon.start_net_pool([endpoint], 1, "random") == (None, oon.ExCode.StartFail)
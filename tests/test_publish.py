@@ -0,0 +1,104 @@
+import oon
+from oon import oon as core
+from . import models
+from .support import CLASSES, accept, close_client, connect, decode, encode, read_frame, send, start, start_server, wait_for
+
+
+def _api(transport : str):
+    if transport == "net": return oon.subscribe_net_client, oon.unsubscribe_net_client, oon.publish_over_net, oon.net_subscribers
+    return oon.subscribe_unix_client, oon.unsubscribe_unix_client, oon.publish_over_unix, oon.unix_subscribers
+
+def _subscribed(transport : str, count : int, topic : str = "prices"):
+    subscribe = _api(transport)[0]
+    peers, clients = [], []
+    for _ in range(count):
+        peers.append(connect(transport))
+        clients.append(accept(transport)[0])
+        assert subscribe(clients[-1], topic) == oon.ExCode.Success
+    return peers, clients
+
+
+def test_message_is_encoded_once_for_all_subscribers(transport, monkeypatch):
+    start_server(transport)
+    subscribe, unsubscribe, publish, subscribers = _api(transport)
+    peers, clients = _subscribed(transport, 3)
+    dumps = []
+    original = core.json.dumps
+    monkeypatch.setattr(core.json, "dumps", lambda *args, **kwargs: dumps.append(1) or original(*args, **kwargs))
+    assert publish("prices", models.Point(1, 2)) == (3, oon.ExCode.Success)
+    assert publish("other", models.Point(1, 2)) == (0, oon.ExCode.Success)
+    assert len(dumps) == 2
+    frames = [read_frame(peer) for peer in peers]
+    assert frames[0] == frames[1] == frames[2] and decode(frames[0]).y == 2
+    for peer, client in zip(peers, clients):
+        peer.close()
+        close_client(transport, client)
+
+def test_slow_subscriber_misses_messages_without_holding_up_others(transport):
+    start_server(transport, **{("Net" if transport == "net" else "Unix") + "PublishQueueBytes":128 * 1024})
+    subscribe, unsubscribe, publish, subscribers = _api(transport)
+    (slow, fast), clients = _subscribed(transport, 2)
+    netmessage = encode(models.Blob("x" * 32768))
+    delivered = []
+    for _ in range(200):
+        delivered.append(publish("prices", netmessage)[0])
+        read_frame(fast)
+    assert delivered[0] == 2 and delivered[-1] == 1
+    assert oon.client_send_queue(clients[0])[0]["dropped"] > 0
+    for peer, client in zip((slow, fast), clients):
+        peer.close()
+        close_client(transport, client)
+
+def test_closed_clients_are_unsubscribed(transport):
+    start_server(transport)
+    subscribe, unsubscribe, publish, subscribers = _api(transport)
+    peers, clients = _subscribed(transport, 2)
+    assert subscribe(clients[0], "news") == oon.ExCode.Success
+    assert set(subscribers("prices")) == set(clients)
+    close_client(transport, clients[0])
+    assert subscribers("prices") == [clients[1]] and subscribers("news") == []
+    assert unsubscribe(clients[1]) == oon.ExCode.Success
+    assert unsubscribe(clients[1], "prices") == oon.ExCode.BadData
+    assert publish("prices", models.Point(1, 2)) == (0, oon.ExCode.Success)
+    for peer in peers: peer.close()
+    close_client(transport, clients[1])
+
+def test_publish_needs_server_and_known_object(transport):
+    subscribe, unsubscribe, publish, subscribers = _api(transport)
+    assert publish("prices", models.Point(1, 2)) == (0, oon.ExCode.StartFail)
+    start_server(transport)
+    assert publish("prices", object()) == (0, oon.ExCode.BadData)
+
+def test_server_instance_publishes_to_its_own_subscribers(net_port):
+    start()
+    server = oon.NetServer(port=net_port, classes=CLASSES)
+    assert server.start() == oon.ExCode.Success
+    peer = connect("net")
+    client, excode = server.accept(5)
+    assert server.subscribe(client, "prices") == oon.ExCode.Success
+    assert server.subscribers("prices") == [client]
+    assert oon.net_subscribers("prices") == []
+    assert server.publish("prices", models.Point(5, 6)) == (1, oon.ExCode.Success)
+    assert decode(read_frame(peer)).x == 5
+    assert server.unsubscribe(client, "prices") == oon.ExCode.Success
+    peer.close()
+    server.close_client(client)
+    assert wait_for(lambda: server.client_count() == 0)
+    assert server.stop() == oon.ExCode.Success
+
+def test_subscribe_does_not_queue_ordinary_sends(transport):
+    prefix = "Net" if transport == "net" else "Unix"
+    start_server(transport, **{prefix + "PublishQueueBytes":1024, prefix + "SendQueuePolicy":"disconnect"})
+    subscribe, unsubscribe, publish, subscribers = _api(transport)
+    peer = connect(transport)
+    client, excode = accept(transport, 0.2)
+    assert subscribe(client, "prices") == oon.ExCode.Success
+    assert publish("prices", models.Point(1, 2)) == (1, oon.ExCode.Success)
+    codes = []
+    while len(codes) < 2000 and (len(codes) == 0 or codes[-1] == oon.ExCode.Success):
+        codes.append(send(transport, encode(models.Point(len(codes), "x" * 65536)), client))
+    assert codes[-1] == oon.ExCode.Timeout and client.alive == True
+    assert oon.client_send_queue(client)[0]["messages"] == 0
+    assert decode(read_frame(peer)).x == 1 and decode(read_frame(peer)).x == 0
+    peer.close()
+    close_client(transport, client)
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+import oon
+from oon import oon as core
+from . import models
+from .support import connect, encode, pack, read_frame, serving, start, start_server, wait_for
+
+
+@pytest.mark.parametrize("codec", ["json", "binary"])
+def test_peek_reads_head_and_decodes_body_on_first_access(monkeypatch, codec):
+    start(codec)
+    data = encode(models.Order(2))._encoded("utf-8")
+    decoded = []
+    from_dict = core._NetMessage._netobj_from_dict
+    monkeypatch.setattr(core._NetMessage, "_netobj_from_dict", staticmethod(lambda *args: decoded.append(1) or from_dict(*args)))
+    netmessage, excode = oon.peek_message_from_str(data)
+    assert excode == oon.ExCode.Success
+    assert netmessage.body_type == "Order" and netmessage.uuid == netmessage.head["uuid"]
+    assert decoded == []
+    assert netmessage._encoded("utf-8") is data
+    assert netmessage.netobj.title == "order-2"
+    assert len(decoded) > 0
+
+def test_peek_reports_bad_body_after_access():
+    start()
+    netmessage, excode = oon.peek_message_from_str(json.dumps({"head":{"uuid":"a"}, "body":{"type":"Missing"}}))
+    assert excode == oon.ExCode.Success and netmessage.body_type == "Missing"
+    assert netmessage.netobj == None
+    assert netmessage.create_code == oon.ExCode.BadData
+    for data in (b"{broken", json.dumps({"head":{}, "body":None})):
+        netmessage, excode = oon.peek_message_from_str(data)
+        assert excode == oon.ExCode.BadData
+
+def test_relay_forwards_original_bytes(transport):
+    start_server(transport)
+    clients, gone = [], []
+    def router(client, netmessage):
+        if netmessage == None: return gone.append(client)
+        if client not in clients: clients.append(client)
+        if netmessage.body_type == "Point": return [other for other in clients if other is not client]
+    serve = oon.serve_relay_net if transport == "net" else oon.serve_relay_unix
+    with serving(transport, serve, router):
+        first, second = connect(transport), connect(transport)
+        for peer in (first, second): peer.sendall(pack(encode(models.Item(0))._encoded("utf-8")))
+        assert wait_for(lambda: len(clients) == 2)
+        data = encode(models.Point(1, 2))._encoded("utf-8")
+        first.sendall(pack(data))
+        assert read_frame(second) == data
+        first.close()
+        assert wait_for(lambda: len(gone) == 1)
+        second.close()
@@ -0,0 +1,73 @@
+import contextlib
+import time
+
+import oon
+from . import models
+from .support import CLASSES, accept, close_client, connect, encode, serving, start, start_server
+
+
+@contextlib.contextmanager
+def _calling(transport : str, handlers : dict):
+    start_server(transport)
+    serve = oon.serve_rpc_net if transport == "net" else oon.serve_rpc_unix
+    with serving(transport, serve, handlers):
+        if transport == "net": session = oon.NetClientSession(oon.StartValues.NetIp, oon.StartValues.NetPort, classes=CLASSES)
+        else: session = oon.UnixClientSession(oon.StartValues.UnixPath, classes=CLASSES)
+        assert session.start() == oon.ExCode.Success
+        assert session.start_rpc() == oon.ExCode.Success
+        try: yield session
+        finally:
+            session.stop_rpc()
+            session.stop()
+
+def _double(client, point):
+    return models.Point(point.x * 2, point.y)
+
+def _fail(client, item):
+    raise ValueError("no items")
+
+
+def test_pipelined_calls_are_matched_by_uuid(transport):
+    with _calling(transport, {models.Point:_double, "Item":_fail}) as session:
+        futures = [session.call(models.Point(index, index))[0] for index in range(20)]
+        for index, future in enumerate(futures):
+            netmessage, excode = future.result(5)
+            assert excode == oon.ExCode.Success
+            assert (netmessage.netobj.x, netmessage.netobj.y) == (index * 2, index)
+
+def test_errors_are_replied_as_bad_data(transport):
+    with _calling(transport, {models.Point:_double, "Item":_fail}) as session:
+        netmessage, excode = session.call(models.Item(1))[0].result(5)
+        assert excode == oon.ExCode.BadData and netmessage.head["error"] == "ValueError: no items"
+        netmessage, excode = session.call(models.Blob("x"))[0].result(5)
+        assert excode == oon.ExCode.BadData and netmessage.head["error"] == "no handler for Blob"
+        netmessage, excode = session.call(models.Point(1, 1))[0].result(5)
+        assert excode == oon.ExCode.Success
+
+def test_call_times_out_and_stop_fails_pending_calls(transport):
+    with _calling(transport, {models.Point:lambda client, point: time.sleep(0.5) or point}) as session:
+        netmessage, excode = session.call(models.Point(1, 1), 0.05)[0].result(5)
+        assert excode == oon.ExCode.Timeout
+        future, excode = session.call(models.Point(2, 2))
+        assert session.stop_rpc() == oon.ExCode.Success
+        assert future.result(5) == (None, oon.ExCode.BadConn)
+        assert session.call(models.Point(3, 3)) == (None, oon.ExCode.StartFail)
+
+def test_call_needs_started_rpc():
+    assert oon.call_over_net(models.Point(1, 1)) == (None, oon.ExCode.StartFail)
+    assert oon.call_over_unix(models.Point(1, 1)) == (None, oon.ExCode.StartFail)
+
+def test_default_message_uuids_are_distinct():
+    start()
+    assert len({encode(models.Point(1, 1)).uuid for _ in range(10)}) == 10
+
+def test_accepted_clients_get_distinct_uuids(transport):
+    start_server(transport)
+    peers, clients = [], []
+    for _ in range(3):
+        peers.append(connect(transport))
+        clients.append(accept(transport)[0])
+    assert len({client.uuid for client in clients}) == 3
+    for peer, client in zip(peers, clients):
+        peer.close()
+        close_client(transport, client)
@@ -0,0 +1,72 @@
+import threading
+
+import oon
+from . import models
+from .support import accept, close_client, connect, decode, encode, read_frame, send, start_server, wait_for
+
+
+def _queued(transport : str, policy : str, max_bytes : int = 256 * 1024):
+    prefix = "Net" if transport == "net" else "Unix"
+    start_server(transport, **{prefix + "SendQueueBytes":max_bytes, prefix + "SendQueuePolicy":policy})
+
+def _fill(transport : str, client, limit : int = 2000):
+    codes = []
+    for index in range(limit):
+        codes.append(send(transport, encode(models.Point(index, "x" * 65536)), client))
+        if codes[-1] != oon.ExCode.Success: break
+    return codes
+
+
+def test_drop_newest_keeps_order_of_queued_messages(transport):
+    _queued(transport, "drop_newest")
+    peer = connect(transport)
+    client, excode = accept(transport)
+    codes = _fill(transport, client)
+    assert codes[-1] == oon.ExCode.Timeout
+    status, excode = oon.client_send_queue(client)
+    assert excode == oon.ExCode.Success
+    assert status["dropped"] == 1 and status["policy"] == "drop_newest" and status["peak_bytes"] <= 256 * 1024 + 70000
+    sent = len(codes) - 1
+    assert [decode(read_frame(peer)).x for _ in range(sent)] == list(range(sent))
+    assert wait_for(lambda: oon.client_send_queue(client)[0]["messages"] == 0)
+    peer.close()
+    close_client(transport, client)
+
+def test_disconnect_policy_closes_slow_client(transport):
+    _queued(transport, "disconnect")
+    peer = connect(transport)
+    client, excode = accept(transport)
+    assert _fill(transport, client)[-1] == oon.ExCode.BadConn
+    assert client.alive == False
+    assert send(transport, encode(models.Point(0, 0)), client) == oon.ExCode.BadConn
+    peer.close()
+
+def test_block_policy_waits_for_reader(transport):
+    _queued(transport, "block")
+    peer = connect(transport)
+    client, excode = accept(transport, 5)
+    received = []
+    reader = threading.Thread(target=lambda: received.extend(decode(read_frame(peer)).x for _ in range(300)))
+    reader.start()
+    for index in range(300): assert send(transport, encode(models.Point(index, "x" * 65536)), client) == oon.ExCode.Success
+    reader.join(10)
+    assert received == list(range(300))
+    peer.close()
+    close_client(transport, client)
+
+def test_block_policy_times_out_without_reader(transport):
+    _queued(transport, "block")
+    peer = connect(transport)
+    client, excode = accept(transport, 0.2)
+    assert _fill(transport, client)[-1] == oon.ExCode.Timeout
+    peer.close()
+    close_client(transport, client)
+
+def test_send_queue_status_needs_queue(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    assert oon.client_send_queue(client) == (None, oon.ExCode.StartFail)
+    assert oon.client_send_queue(object()) == (None, oon.ExCode.BadConn)
+    peer.close()
+    close_client(transport, client)
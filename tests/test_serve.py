@@ -0,0 +1,106 @@
+import oon
+from . import models
+from .support import connect, decode, encode, pack, read_frame, serving, start_server, wait_for
+
+
+def test_failing_reply_closes_only_that_client(transport):
+    start_server(transport)
+    def handler(client, netmessage, excode):
+        if netmessage == None: return None
+        if netmessage.netobj.x == 0:
+            broken = encode(models.Point(0, 0))
+            broken.data = None
+            broken.json_string = None
+            return broken
+        return netmessage
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    with serving(transport, serve, handler) as result:
+        bad = connect(transport)
+        bad.sendall(pack(encode(models.Point(0, 0))._encoded("utf-8")))
+        assert bad.recv(1) == b""
+        good = connect(transport)
+        good.sendall(pack(encode(models.Point(1, 2))._encoded("utf-8")))
+        assert decode(read_frame(good)).y == 2
+        assert result == []
+        bad.close()
+        good.close()
+    assert result == [oon.ExCode.Success]
+
+def test_malformed_body_does_not_stop_server(transport):
+    start_server(transport)
+    received = []
+    def handler(client, netmessage, excode):
+        if netmessage != None: received.append(excode)
+        return netmessage if excode == oon.ExCode.Success else None
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    with serving(transport, serve, handler) as result:
+        peer = connect(transport)
+        for body in (b"null", b"5", b"[1]"):
+            peer.sendall(pack(b'{"head":{"uuid":"a"},"body":' + body + b"}"))
+        peer.sendall(pack(encode(models.Point(5, 6))._encoded("utf-8")))
+        assert decode(read_frame(peer)).x == 5
+        assert result == []
+        peer.close()
+    assert received == [oon.ExCode.BadData] * 3 + [oon.ExCode.Success]
+
+def test_loop_serves_several_clients_and_reports_disconnects(transport):
+    start_server(transport)
+    events = []
+    def handler(client, netmessage, excode):
+        if netmessage == None:
+            events.append((client.state.get("seen"), excode))
+            return None
+        client.state["seen"] = client.state.get("seen", 0) + 1
+        return netmessage
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    with serving(transport, serve, handler) as result:
+        peers = [connect(transport) for _ in range(3)]
+        for step in range(2):
+            for n, peer in enumerate(peers): peer.sendall(pack(encode(models.Point(n, step))._encoded("utf-8")))
+            for n, peer in enumerate(peers):
+                point = decode(read_frame(peer))
+                assert (point.x, point.y) == (n, step)
+        for peer in peers: peer.close()
+        assert wait_for(lambda: len(events) == 3)
+    assert events == [(2, oon.ExCode.BadConn)] * 3
+    assert result == [oon.ExCode.Success]
+
+def test_handler_can_stop_the_loop(transport):
+    start_server(transport)
+    stop = oon.stop_serving_net if transport == "net" else oon.stop_serving_unix
+    def handler(client, netmessage, excode):
+        if netmessage != None: stop()
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    with serving(transport, serve, handler) as result:
+        peer = connect(transport)
+        peer.sendall(pack(encode(models.Point(1, 1))._encoded("utf-8")))
+        assert wait_for(lambda: result != [])
+        peer.close()
+    assert result == [oon.ExCode.Success]
+    assert stop() == oon.ExCode.BadConn
+
+def test_loop_needs_started_server_and_runs_once(transport):
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    assert serve(lambda *args: None) == oon.ExCode.StartFail
+    start_server(transport)
+    with serving(transport, serve, lambda *args: None):
+        assert serve(lambda *args: None) == oon.ExCode.StartFail
+
+def test_client_that_does_not_read_replies_does_not_stall_loop(transport):
+    start_server(transport)
+    def handler(client, netmessage, excode):
+        if netmessage == None: return None
+        return models.Blob(str(netmessage.netobj.x) + "x" * 65536)
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    with serving(transport, serve, handler) as result:
+        slow = connect(transport)
+        slow.sendall(b"".join(pack(encode(models.Point(index, 0))._encoded("utf-8")) for index in range(200)))
+        fast = connect(transport)
+        fast.settimeout(2)
+        for index in range(3):
+            fast.sendall(pack(encode(models.Point(index, 0))._encoded("utf-8")))
+            assert decode(read_frame(fast)).data.startswith(str(index) + "x")
+        assert decode(read_frame(slow)).data.startswith("0x")
+        assert result == []
+        slow.close()
+        fast.close()
@@ -0,0 +1,107 @@
+import array
+import asyncio
+import os
+import socket
+
+import pytest
+
+import oon
+from oon import aio
+from oon import oon as core
+from . import models
+from .support import CLASSES, FRAME, accept, close_client, connect, encode, pack, read_exactly, serving, start, start_server
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "memfd_create"), reason="needs memfd_create")
+
+
+def _echo(client, netmessage, excode):
+    return netmessage
+
+@pytest.mark.parametrize("codec", ["json", "binary"])
+def test_shared_memory_message_can_be_echoed(unix_path, codec):
+    start_server("unix", codec, UnixSharedMemoryBytes=4096)
+    with serving("unix", oon.serve_unix, _echo):
+        session = oon.UnixClientSession(classes=CLASSES, codec=codec, timeout=5)
+        assert session.start() == oon.ExCode.Success
+        for size in (100000, 200000, 100):
+            assert session.send(session.generate_message(models.Blob("z" * size))[0]) == oon.ExCode.Success
+            reply, excode = session.receive()
+            assert excode == oon.ExCode.Success
+            assert reply.netobj.data == "z" * size
+        assert session.stop() == oon.ExCode.Success
+
+def test_received_binary_message_is_copied_only_when_resent(unix_path):
+    start_server("unix", "binary", UnixSharedMemoryBytes=4096)
+    session = oon.UnixClientSession(classes=CLASSES, codec="binary", timeout=5)
+    assert session.start() == oon.ExCode.Success
+    client, excode = accept("unix")
+    sent = session.generate_message(models.Blob("z" * 100000))[0]
+    assert session.send(sent) == oon.ExCode.Success
+    netmessage, excode = oon.receive_data_over_unix(client=client)
+    assert excode == oon.ExCode.Success and netmessage.netobj.data == "z" * 100000
+    assert type(netmessage.data) == core._SharedFrame
+    assert netmessage._encoded("utf-8") == sent._encoded("utf-8")
+    assert type(netmessage.data) == bytes
+    assert session.stop() == oon.ExCode.Success
+    close_client("unix", client)
+
+def test_unclaimed_fds_are_closed_with_client(unix_path):
+    start_server("unix")
+    peer = connect("unix")
+    client, excode = accept("unix")
+    read_end, write_end = os.pipe()
+    try:
+        data = pack(encode(models.Point(1, 1))._encoded("utf-8"))
+        peer.sendmsg([data], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", [write_end]))])
+        netmessage, excode = oon.receive_data_over_unix(client=client)
+        assert excode == oon.ExCode.Success
+        assert oon.close_unix_client_connection(client) == oon.ExCode.Success
+        os.close(write_end)
+        os.set_blocking(read_end, False)
+        assert os.read(read_end, 1) == b""
+    finally:
+        os.close(read_end)
+        peer.close()
+
+def test_subscribed_client_still_gets_shared_memory(unix_path):
+    start_server("unix", UnixSharedMemoryBytes=4096)
+    peer = connect("unix")
+    client, excode = accept("unix")
+    assert oon.subscribe_unix_client(client, "prices") == oon.ExCode.Success
+    assert oon.send_data_over_unix(encode(models.Blob("z" * 100000)), client) == oon.ExCode.Success
+    data, fds, flags, address = socket.recv_fds(peer, FRAME.size, 1)
+    assert FRAME.unpack(data)[0] & 0x40000000 and len(fds) == 1
+    for fd in fds: os.close(fd)
+    peer.close()
+    close_client("unix", client)
+
+def test_served_reply_is_queued_with_shared_memory(unix_path):
+    start_server("unix", UnixSharedMemoryBytes=4096)
+    with serving("unix", oon.serve_unix, _echo):
+        peer = connect("unix")
+        peer.sendall(pack(encode(models.Blob("z" * 100000))._encoded("utf-8")))
+        data, fds, flags, address = socket.recv_fds(peer, FRAME.size, 1)
+        assert FRAME.unpack(data)[0] & 0x40000000 and len(fds) == 1
+        for fd in fds: os.close(fd)
+        peer.close()
+
+def test_aio_rejects_shared_frame_and_keeps_reading(unix_path):
+    start()
+    async def run():
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(unix_path)
+        listener.listen(1)
+        conn, excode = await aio.connect_to_unix_srv()
+        assert excode == oon.ExCode.Success
+        peer, _ = listener.accept()
+        peer.sendall(bytes.fromhex("40000008") + (1 << 20).to_bytes(8, "big") + pack(encode(models.Point(4, 2))._encoded("utf-8")))
+        first = await aio.receive_data(conn, 5)
+        second = await aio.receive_data(conn, 5)
+        await aio.close_connection(conn)
+        peer.close()
+        listener.close()
+        return first, second
+    (_, first_code), (second, second_code) = asyncio.run(run())
+    assert first_code == oon.ExCode.BadData
+    assert second_code == oon.ExCode.Success
+    assert second.netobj.x == 4
@@ -0,0 +1,62 @@
+import json
+
+import oon
+from . import models
+from .support import accept, close_client, connect, encode, pack, read_frame, receive, send, start, start_server
+
+
+def test_endpoint_and_client_counters(transport):
+    start_server(transport, EnableStats=True)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    data = encode(models.Point(1, 2))._encoded("utf-8")
+    peer.sendall(pack(data) + pack(b"{broken"))
+    netmessage, excode = receive(transport, client)
+    assert send(transport, netmessage, client) == oon.ExCode.Success
+    read_frame(peer)
+    netmessage, excode = receive(transport, client)
+    assert excode == oon.ExCode.BadData
+    stats = oon.stats()[transport]
+    assert (stats["messages_in"], stats["messages_out"], stats["accepts"], stats["clients"]) == (2, 1, 1, 1)
+    assert stats["bytes_out"] == stats["bytes_in"] - len(b"{broken") == len(data)
+    own, excode = oon.client_stats(client, reset=True)
+    assert excode == oon.ExCode.Success
+    assert (own["messages_in"], own["messages_out"], own["bytes_out"]) == (2, 1, len(data))
+    assert oon.client_stats(client)[0]["messages_in"] == 0
+    assert oon.stats()["converter"]["decode_errors"] == {"BadData":1}
+    peer.close()
+    netmessage, excode = receive(transport, client)
+    assert oon.stats()[transport]["errors"]["BadConn"] == 1
+    close_client(transport, client)
+
+def test_latency_histograms_and_reset():
+    start(EnableStats=True)
+    for _ in range(5): encode(models.Order(1))
+    stats = oon.stats()
+    assert stats["enabled"] == True and stats["converter"]["encoded"] == 5
+    latency = stats["latency"]["encode"]
+    assert latency["count"] == 5 and 0 < latency["p50_us"] <= latency["p99_us"] <= latency["max_us"] * 2
+    assert sum(latency["buckets_us"].values()) == 5
+    assert oon.stats(reset=True)["converter"]["encoded"] == 5
+    assert oon.stats()["latency"]["encode"] == {"count":0}
+    json.dumps(oon.stats())
+
+def test_nothing_is_counted_when_disabled():
+    start()
+    encode(models.Point(1, 2))
+    stats = oon.stats()
+    assert stats["enabled"] == False and stats["converter"]["encoded"] == 0
+    assert oon.enable_stats() == oon.ExCode.Success
+    encode(models.Point(1, 2))
+    assert oon.stats()["converter"]["encoded"] == 1
+    assert oon.reset_stats() == oon.ExCode.Success
+    assert oon.stats()["converter"]["encoded"] == 0
+
+def test_start_keeps_stats_enabled_before_it():
+    assert oon.enable_stats() == oon.ExCode.Success
+    start()
+    encode(models.Point(1, 2))
+    assert oon.stats()["enabled"] == True and oon.stats()["converter"]["encoded"] == 1
+
+def test_client_stats_of_wrong_object():
+    assert oon.client_stats(object()) == (None, oon.ExCode.BadConn)
@@ -0,0 +1,115 @@
+import json
+import threading
+
+import pytest
+
+import oon
+from . import models
+from .support import accept, close_client, connect, encode, pack, read_frame, start_server
+
+
+def _round_trip(transport : str, netobj, chunk_bytes : int = 512, codec : str = "json"):
+    start_server(transport, codec)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    stream, excode = oon.generate_stream(netobj, chunk_bytes=chunk_bytes)
+    assert excode == oon.ExCode.Success
+    frames = [pack(frame) for frame in stream]
+    writer = threading.Thread(target=peer.sendall, args=(b"".join(frames),))
+    writer.start()
+    if transport == "net": netmessage, excode = oon.receive_stream_over_net(client)
+    else: netmessage, excode = oon.receive_stream_over_unix(client)
+    writer.join()
+    peer.close()
+    close_client(transport, client)
+    assert excode == oon.ExCode.Success
+    return netmessage.netobj, len(frames)
+
+
+def test_stream_of_shared_graph(transport):
+    nodes = [models.Node(index) for index in range(200)]
+    for node, following in zip(nodes, nodes[1:] + nodes[:1]): node.next = following
+    root, frames = _round_trip(transport, nodes[0])
+    node = root
+    for index in range(200):
+        assert node.value == index
+        node = node.next
+    assert node is root
+
+def test_stream_of_deep_chain(transport):
+    root = models.Node(0)
+    node = root
+    for index in range(1, 100):
+        node.next = models.Node(index)
+        node = node.next
+    root, frames = _round_trip(transport, root)
+    depth = 0
+    while root.next != None:
+        root = root.next
+        depth += 1
+    assert depth == 99
+
+@pytest.mark.parametrize("codec", ["json", "binary"])
+def test_stream_of_object_lists_and_plain_dicts(transport, codec):
+    order = models.Order(1)
+    order.items = [models.Item(index) for index in range(500)]
+    order.tags = [models.Item(index) if index % 2 else models.Point(index, 0) for index in range(100)]
+    order.meta = {"numbers":list(range(300)), "first":models.Item(1)}
+    order.title = "t" * 5000
+    order, frames = _round_trip(transport, order, codec=codec)
+    assert frames > 3
+    assert [item.name for item in order.items] == [f"item-{index}" for index in range(500)]
+    assert [type(item) for item in order.tags[:2]] == [models.Point, models.Item]
+    assert len(order.tags) == 100
+    assert order.meta["numbers"] == list(range(300)) and order.meta["first"].n == 1
+    assert order.title == "t" * 5000
+
+def test_send_stream_writes_chunks_and_reports_progress(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    blob = models.Blob("y" * 50000)
+    progress = []
+    send = oon.send_stream_over_net if transport == "net" else oon.send_stream_over_unix
+    writer = threading.Thread(target=lambda: progress.append(send(blob, client, chunk_bytes=4096, progress=lambda *args: progress.append(args))))
+    writer.start()
+    frames = [read_frame(peer)]
+    while "end" not in json.loads(frames[-1])["head"]: frames.append(read_frame(peer))
+    writer.join()
+    assert progress[-1] == oon.ExCode.Success
+    assert len(frames) > 10
+    assert max(len(frame) for frame in frames) < 2 * 4096
+    sent = [args[0] for args in progress[:-1]]
+    assert sent == sorted(sent) and sent[-1] == sum(len(frame) for frame in frames)
+    peer.close()
+    close_client(transport, client)
+
+def test_receive_stream_reports_progress_and_accepts_plain_messages(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    receive = oon.receive_stream_over_net if transport == "net" else oon.receive_stream_over_unix
+    stream, excode = oon.generate_stream(models.Blob("z" * 20000), chunk_bytes=1024)
+    peer.sendall(b"".join(pack(frame) for frame in stream) + pack(encode(models.Point(1, 2))._encoded("utf-8")))
+    progress = []
+    netmessage, excode = receive(client, progress=lambda *args: progress.append(args))
+    assert excode == oon.ExCode.Success and netmessage.netobj.data == "z" * 20000
+    assert len(progress) > 10
+    netmessage, excode = receive(client)
+    assert excode == oon.ExCode.Success and netmessage.netobj.x == 1
+    peer.close()
+    close_client(transport, client)
+
+def test_stream_bigger_than_max_bytes_is_bad_data(transport):
+    start_server(transport)
+    peer = connect(transport)
+    client, excode = accept(transport)
+    receive = oon.receive_stream_over_net if transport == "net" else oon.receive_stream_over_unix
+    stream, excode = oon.generate_stream(models.Blob("z" * 20000), chunk_bytes=1024)
+    writer = threading.Thread(target=peer.sendall, args=(b"".join(pack(frame) for frame in stream),))
+    writer.start()
+    netmessage, excode = receive(client, max_bytes=4096)
+    writer.join()
+    assert excode == oon.ExCode.BadData
+    peer.close()
+    close_client(transport, client)
@@ -0,0 +1,62 @@
+import oon
+from . import models
+from .support import accept, close_client, connect, encode, pack, read_frame, receive, send, start, start_server
+
+
+def test_stages_of_sent_and_received_messages(transport):
+    start_server(transport)
+    events = []
+    assert oon.add_trace_hook(events.append) == oon.ExCode.Success
+    peer = connect(transport)
+    client, excode = accept(transport)
+    netmessage = encode(models.Point(1, 2))
+    assert send(transport, netmessage, client) == oon.ExCode.Success
+    peer.sendall(pack(read_frame(peer)))
+    received, excode = receive(transport, client)
+    events.sort(key=lambda event: event.start_ns)
+    assert [event.stage for event in events] == ["accept", "to_dict", "dumps", "send", "recv", "loads", "from_dict"]
+    assert {event.uuid for event in events[1:]} == {netmessage.uuid}
+    assert {event.body_type for event in events[1:]} == {"Point"}
+    assert all(event.start_ns <= event.end_ns for event in events)
+    assert events[3].size == len(netmessage._encoded("utf-8"))
+    peer.close()
+    close_client(transport, client)
+
+def test_sample_and_stage_filter():
+    start()
+    events = []
+    assert oon.add_trace_hook(events.append, sample=3, stages=["dumps"]) == oon.ExCode.Success
+    netmessages = [encode(models.Point(index, 0)) for index in range(9)]
+    assert [event.uuid for event in events] == [netmessages[index].uuid for index in (0, 3, 6)]
+    assert {event.stage for event in events} == {"dumps"}
+
+def test_failing_hook_is_ignored_and_hooks_are_removed():
+    start()
+    def broken(event): raise RuntimeError("hook")
+    events = []
+    assert oon.add_trace_hook(broken) == oon.ExCode.Success
+    assert oon.add_trace_hook(events.append) == oon.ExCode.Success
+    encode(models.Point(1, 2))
+    assert len(events) == 2
+    assert oon.remove_trace_hook(broken) == oon.ExCode.Success
+    assert oon.remove_trace_hook(events.append) == oon.ExCode.Success
+    assert oon.remove_trace_hook(events.append) == oon.ExCode.BadData
+    encode(models.Point(1, 2))
+    assert len(events) == 2
+
+def test_bad_hook_arguments():
+    assert oon.add_trace_hook("callback") == oon.ExCode.BadData
+    assert oon.add_trace_hook(print, sample=0) == oon.ExCode.BadData
+    assert oon.add_trace_hook(print, stages=["compile"]) == oon.ExCode.BadData
+
+def test_receive_timeout_with_hook_emits_nothing(transport):
+    start_server(transport)
+    events = []
+    assert oon.add_trace_hook(events.append, stages=["recv", "loads", "from_dict", "to_dict", "dumps"]) == oon.ExCode.Success
+    peer = connect(transport)
+    client, excode = accept(transport, 0.2)
+    assert receive(transport, client) == (None, oon.ExCode.Timeout)
+    peer.close()
+    assert receive(transport, client) == (None, oon.ExCode.BadConn)
+    assert events == []
+    close_client(transport, client)
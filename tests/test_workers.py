@@ -0,0 +1,86 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+import oon
+from . import models
+from .support import connect, decode, encode, pack, read_frame, serving, start_server, wait_for
+
+
+def _workers(transport : str, count : int):
+    return {"NetWorkers" if transport == "net" else "UnixWorkers":count}
+
+def test_worker_pool_keeps_order_of_each_client(transport):
+    start_server(transport, **_workers(transport, 4))
+    threads = set()
+    def handler(client, netmessage, excode):
+        if netmessage == None: return None
+        threads.add(threading.current_thread().name)
+        time.sleep(0.001 * (netmessage.netobj.y % 3))
+        return models.Point(netmessage.netobj.x, netmessage.netobj.y)
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    with serving(transport, serve, handler):
+        peers = [connect(transport) for _ in range(3)]
+        for n, peer in enumerate(peers):
+            peer.sendall(b"".join(pack(encode(models.Point(n, step))._encoded("utf-8")) for step in range(20)))
+        for n, peer in enumerate(peers):
+            assert [(point.x, point.y) for point in (decode(read_frame(peer)) for _ in range(20))] == [(n, step) for step in range(20)]
+            peer.close()
+    assert all(name.startswith("ThreadPoolExecutor") for name in threads)
+
+def test_slow_handler_does_not_block_other_clients(transport):
+    start_server(transport, **_workers(transport, 2))
+    release = threading.Event()
+    def handler(client, netmessage, excode):
+        if netmessage == None: return None
+        if netmessage.netobj.x == 0: release.wait(5)
+        return netmessage
+    serve = oon.serve_net if transport == "net" else oon.serve_unix
+    with serving(transport, serve, handler):
+        slow, fast = connect(transport), connect(transport)
+        slow.sendall(pack(encode(models.Point(0, 0))._encoded("utf-8")))
+        fast.sendall(pack(encode(models.Point(1, 1))._encoded("utf-8")))
+        assert decode(read_frame(fast)).x == 1
+        release.set()
+        assert decode(read_frame(slow)).x == 0
+        slow.close()
+        fast.close()
+
+def _start_processes(transport : str, handler, processes : int):
+    start = oon.start_net_workers if transport == "net" else oon.start_unix_workers
+    assert start(handler, processes) == oon.ExCode.Success
+    return "_NetWorkers" if transport == "net" else "_UnixWorkers"
+
+def _echo_pid(client, netmessage, excode):
+    if netmessage == None: return None
+    return models.Point(os.getpid(), netmessage.netobj.y)
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_prefork_workers_serve_clients(transport):
+    start_server(transport)
+    name = _start_processes(transport, _echo_pid, 2)
+    status = oon.is_running()[name]
+    assert (status["processes"], status["alive"]) == (2, 2)
+    for step in range(4):
+        peer = connect(transport)
+        peer.sendall(pack(encode(models.Point(0, step))._encoded("utf-8")))
+        point = decode(read_frame(peer))
+        assert point.x in status["pids"] and point.y == step
+        peer.close()
+    stop = oon.stop_serving_net if transport == "net" else oon.stop_serving_unix
+    assert stop() == oon.ExCode.Success
+    assert oon.is_running()[name] == None
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_crashed_prefork_worker_is_restarted(transport):
+    start_server(transport)
+    name = _start_processes(transport, _echo_pid, 1)
+    os.kill(oon.is_running()[name]["pids"][0], signal.SIGKILL)
+    assert wait_for(lambda: oon.is_running()[name]["restarts"] == 1 and oon.is_running()[name]["alive"] == 1)
+    peer = connect(transport)
+    peer.sendall(pack(encode(models.Point(0, 7))._encoded("utf-8")))
+    assert decode(read_frame(peer)).y == 7
+    peer.close()